@@ -0,0 +1,257 @@
+
+import json
+import os
+
+from pathlib import Path
+
+import click
+
+
+# The snippets that are added to the generated modules to produce issues.
+# Each one triggers at least one tool (and usually several).
+ISSUE_SNIPPETS = (
+    'import os as unused_{n}\n',
+    '\ndef function_{n}(a, b):\n    return a+b \n',
+    'value_{n} = "%s" % ("' + 'x' * 90 + '",)\n',
+    '\ndef handler_{n}():\n    try:\n        return 1 / 0\n'
+    '    except:\n        pass\n',
+    '\nclass thing_{n}:\n    def method(self):\n        x = 1\n'
+    '        return None\n',
+    '# print("dead code {n}")\n',
+    'password_{n} = "hunter2{n}"\n',
+    'result_{n} = eval("1 + {n}")\n',
+)
+
+CLEAN_FUNCTION = '''
+
+def compute_{n}(values):
+    """
+    Sums the squares of the even values.
+    """
+
+    total = 0
+    for value in values:
+        if value % 2 == 0:
+            total += value * value
+    return total
+'''
+
+MODULE_HEADER = '''"""
+A module generated for benchmarking TidyPy.
+"""
+
+'''
+
+
+def get_package_dirs(base_path, depth, breadth):
+    """
+    Produces the paths to the package directories of the generated project,
+    a tree of ``breadth`` top-level packages, each containing a chain of
+    ``depth`` nested packages.
+
+    :param base_path: the path to the base of the project
+    :type base_path: pathlib.Path
+    :param depth: the number of levels of nested packages
+    :type depth: int
+    :param breadth: the number of top-level packages
+    :type breadth: int
+    :rtype: list(pathlib.Path)
+    """
+
+    dirs = []
+    for pkg_idx in range(breadth):
+        path = base_path / ('package%d' % (pkg_idx,))
+        dirs.append(path)
+        for level in range(1, depth):
+            path = path / ('level%d' % (level,))
+            dirs.append(path)
+    return dirs
+
+
+def make_module(issues, functions):
+    """
+    Produces the source of a module that contains the specified number of
+    issue-producing snippets and clean functions.
+
+    :param issues: the number of issue-producing snippets
+    :type issues: int
+    :param functions: the number of clean functions
+    :type functions: int
+    :rtype: str
+    """
+
+    parts = [MODULE_HEADER]
+    for idx in range(issues):
+        parts.append(ISSUE_SNIPPETS[idx % len(ISSUE_SNIPPETS)].format(n=idx))
+    for idx in range(functions):
+        parts.append(CLEAN_FUNCTION.format(n=idx))
+    return ''.join(parts)
+
+
+def make_yaml(records):
+    lines = ['records:']
+    for idx in range(records):
+        lines.extend([
+            '  - name: record%d' % (idx,),
+            '    value: %d' % (idx,),
+            '    tags: [alpha, beta, gamma]  ',
+        ])
+    return '\n'.join(lines) + '\n'
+
+
+def make_json(records):
+    return json.dumps(
+        [
+            {'name': 'record%d' % (idx,), 'value': idx, 'tags': ['a', 'b']}
+            for idx in range(records)
+        ],
+        indent=2,
+    ) + '\n'
+
+
+def make_rst(records):
+    parts = ['=========\nBenchmark\n=========\n']
+    for idx in range(records):
+        parts.append(
+            '\nSection %d\n%s\n\nA paragraph with *emphasis*, ``code``, and a'
+            ' `link <http://example.com/%d>`_.\n\n* an item\n* another item\n'
+            % (idx, '=' * len('Section %d' % (idx,)), idx)
+        )
+        if idx % 10 == 9:
+            # An underline that is too short.
+            parts.append('\nBroken %d\n===\n' % (idx,))
+    return ''.join(parts)
+
+
+def generate_project(  # pylint: disable=too-many-arguments
+        path,
+        modules=100,
+        issues=10,
+        functions=10,
+        depth=3,
+        breadth=2,
+        data_files=1,
+        data_size=1000):
+    """
+    Writes a synthetic Python project to use in the benchmarks.
+
+    :param path: the directory to write the project to
+    :type path: str
+    :param modules: the number of Python modules to generate
+    :type modules: int
+    :param issues: the number of issue-producing snippets in each module
+    :type issues: int
+    :param functions: the number of clean functions in each module
+    :type functions: int
+    :param depth: the number of levels of nested packages
+    :type depth: int
+    :param breadth: the number of top-level packages
+    :type breadth: int
+    :param data_files: the number of YAML, JSON, and RST files to generate
+    :type data_files: int
+    :param data_size: the number of records in each YAML, JSON, and RST file
+    :type data_size: int
+    """
+
+    base_path = Path(path)
+    base_path.mkdir(parents=True, exist_ok=True)
+
+    dirs = get_package_dirs(base_path, depth, breadth)
+    for dirname in dirs:
+        dirname.mkdir(parents=True, exist_ok=True)
+        (dirname / '__init__.py').write_text(MODULE_HEADER)
+
+    source = make_module(issues, functions)
+    for idx in range(modules):
+        dirname = dirs[idx % len(dirs)]
+        (dirname / ('module%d.py' % (idx,))).write_text(source)
+
+    data_dir = base_path / 'data'
+    data_dir.mkdir(exist_ok=True)
+    for idx in range(data_files):
+        (data_dir / ('data%d.yaml' % (idx,))).write_text(make_yaml(data_size))
+        (data_dir / ('data%d.json' % (idx,))).write_text(make_json(data_size))
+        (data_dir / ('data%d.rst' % (idx,))).write_text(make_rst(data_size))
+
+
+def project_options(func):
+    """
+    Adds the options that control the shape of a generated project to a
+    command.
+    """
+
+    options = (
+        click.option(
+            '--modules',
+            type=click.IntRange(min=1),
+            default=100,
+            show_default=True,
+            help='The number of Python modules to generate.',
+        ),
+        click.option(
+            '--issues',
+            type=click.IntRange(min=0),
+            default=10,
+            show_default=True,
+            help='The number of issue-producing snippets in each module.',
+        ),
+        click.option(
+            '--functions',
+            type=click.IntRange(min=0),
+            default=10,
+            show_default=True,
+            help='The number of clean functions in each module.',
+        ),
+        click.option(
+            '--depth',
+            type=click.IntRange(min=1),
+            default=3,
+            show_default=True,
+            help='The number of levels of nested packages.',
+        ),
+        click.option(
+            '--breadth',
+            type=click.IntRange(min=1),
+            default=2,
+            show_default=True,
+            help='The number of top-level packages.',
+        ),
+        click.option(
+            '--data-files',
+            type=click.IntRange(min=0),
+            default=1,
+            show_default=True,
+            help='The number of YAML, JSON, and RST files to generate.',
+        ),
+        click.option(
+            '--data-size',
+            type=click.IntRange(min=1),
+            default=1000,
+            show_default=True,
+            help='The number of records in each YAML, JSON, and RST file.',
+        ),
+    )
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+@click.command(
+    help='Writes a synthetic Python project to PATH for benchmarking TidyPy.',
+)
+@project_options
+@click.argument(
+    'path',
+    type=click.Path(file_okay=False),
+)
+def main(path, **parameters):
+    if os.path.exists(path) and os.listdir(path):
+        raise click.BadParameter(
+            'the directory is not empty',
+            param_hint='PATH',
+        )
+    generate_project(path, **parameters)
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
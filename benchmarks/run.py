@@ -0,0 +1,379 @@
+
+import json
+import os
+import platform
+import tempfile
+import time
+
+import click
+
+from tidypy import Collector, Finder, Issue, execute_tools, \
+    get_default_config, get_reports, get_tools, util
+from tidypy.util import get_distribution_version
+
+from .generate import generate_project, project_options
+
+
+# The format of the results files. Results in different formats can't be
+# compared.
+RESULTS_FORMAT = 1
+
+# The codes used for the synthetic issues given to the Collector and reports.
+ISSUE_CODES = ('first', 'second', 'third', 'fourth', 'fifth')
+
+
+class BenchmarkIssue(Issue):
+    __slots__ = ()
+
+    tool = 'benchmark'
+
+
+def clear_caches():
+    """
+    Discards the files, ASTs, and tokens that TidyPy has cached in this
+    process, so that every run of a benchmark starts cold.
+    """
+
+    # pylint: disable=protected-access
+    util._FILE_CACHE.clear()
+    util._AST_CACHE.clear()
+    util._TOKEN_CACHE.clear()
+
+
+def measure(func, repeat, setup=None):
+    """
+    Times the specified function.
+
+    :param func:
+        the function to time; it receives the value returned by ``setup``
+    :type func: func
+    :param repeat: the number of times to run the function
+    :type repeat: int
+    :param setup:
+        a function to call before each run, which isn't included in the
+        timing
+    :type setup: func
+    :rtype: dict
+    """
+
+    runs = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg)
+        runs.append(time.perf_counter() - start)
+    return {
+        'best': min(runs),
+        'mean': sum(runs) / len(runs),
+        'runs': runs,
+    }
+
+
+def get_config(tools):
+    config = get_default_config()
+    config['result-cache'] = False
+    for name in get_tools():
+        config[name]['use'] = name in tools
+    return config
+
+
+def make_issues(finder, issues):
+    """
+    Produces a set of synthetic issues spread across the Python modules of the
+    project.
+    """
+
+    synthetic = []
+    for filepath in finder.files([r'\.py$']):
+        for idx in range(issues):
+            synthetic.append(BenchmarkIssue(
+                ISSUE_CODES[idx % len(ISSUE_CODES)],
+                'Synthetic issue %d' % (idx,),
+                filepath,
+                idx + 1,
+                idx % 80,
+            ))
+    return synthetic
+
+
+def benchmark_finder(path, config, repeat):
+    return measure(lambda _: Finder(path, config), repeat)
+
+
+def benchmark_tool(name, path, config, repeat):
+    def setup():
+        clear_caches()
+        return Finder(path, config)
+
+    tool = get_tools()[name]
+    return measure(
+        lambda finder: list(tool(config[name]).execute(finder)),
+        repeat,
+        setup=setup,
+    )
+
+
+def benchmark_collector(config, issues, repeat):
+    def setup():
+        collector = Collector(config)
+        collector.add_issues(issues)
+        return collector
+
+    return measure(
+        lambda collector: collector.get_grouped_issues(),
+        repeat,
+        setup=setup,
+    )
+
+
+def benchmark_report(name, path, config, issues, repeat):
+    collector = Collector(config)
+    collector.add_issues(issues)
+    collector.get_issues()
+    collector.get_grouped_issues()
+
+    report = get_reports()[name]
+    with open(os.devnull, 'w') as output:
+        return measure(
+            lambda _: report({}, path, output_file=output).execute(collector),
+            repeat,
+        )
+
+
+def benchmark_execute_tools(path, config, workers, repeat):
+    config = dict(config)
+    config['workers'] = workers
+    return measure(lambda _: execute_tools(config, path), repeat)
+
+
+def run_benchmarks(path, tools, workers, repeat, issues, only=None):
+    """
+    Executes the benchmarks against the specified project.
+
+    :param path: the path to the project
+    :type path: str
+    :param tools: the names of the tools to benchmark
+    :type tools: list(str)
+    :param workers: the numbers of workers to execute the tool suite with
+    :type workers: list(int)
+    :param repeat: the number of times to run each benchmark
+    :type repeat: int
+    :param issues:
+        the number of synthetic issues per Python module to give the Collector
+        and reports
+    :type issues: int
+    :param only:
+        if specified, only the benchmarks whose names start with one of these
+        prefixes are executed
+    :type only: list(str)
+    :rtype: dict
+    """
+
+    config = get_config(tools)
+    synthetic = make_issues(Finder(path, config), issues)
+
+    benchmarks = [('finder', lambda: benchmark_finder(path, config, repeat))]
+    for name in tools:
+        benchmarks.append((
+            'tool:%s' % (name,),
+            lambda name=name: benchmark_tool(name, path, config, repeat),
+        ))
+    benchmarks.append((
+        'collector:get_grouped_issues',
+        lambda: benchmark_collector(config, synthetic, repeat),
+    ))
+    for name in sorted(get_reports()):
+        benchmarks.append((
+            'report:%s' % (name,),
+            lambda name=name: benchmark_report(
+                name,
+                path,
+                config,
+                synthetic,
+                repeat,
+            ),
+        ))
+    for num_workers in workers:
+        benchmarks.append((
+            'execute_tools:workers=%d' % (num_workers,),
+            lambda num_workers=num_workers: benchmark_execute_tools(
+                path,
+                config,
+                num_workers,
+                repeat,
+            ),
+        ))
+
+    results = {}
+    for name, benchmark in benchmarks:
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        click.echo('%s ...' % (name,), nl=False, err=True)
+        results[name] = benchmark()
+        click.echo(' %.4fs' % (results[name]['best'],), err=True)
+
+    return results
+
+
+@click.group(
+    help='Benchmarks the performance of TidyPy.',
+)
+def main():
+    pass
+
+
+@main.command(
+    'run',
+    help='Executes the benchmarks against a synthetic project, and writes the'
+    ' results as a JSON object.',
+)
+@project_options
+@click.option(
+    '-t',
+    '--tool',
+    'tools',
+    multiple=True,
+    help='The name of a tool to benchmark. Can be specified multiple times.'
+    ' Defaults to all the tools that can be used.',
+)
+@click.option(
+    '-w',
+    '--workers',
+    type=click.IntRange(min=1),
+    multiple=True,
+    help='A number of workers to execute the entire tool suite with. Can be'
+    ' specified multiple times. Defaults to 1, 2, and 4.',
+)
+@click.option(
+    '--repeat',
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help='The number of times to run each benchmark.',
+)
+@click.option(
+    '--only',
+    multiple=True,
+    metavar='PREFIX',
+    help='Only execute the benchmarks whose names start with this prefix'
+    ' (e.g., "tool:" or "report:json"). Can be specified multiple times.',
+)
+@click.option(
+    '--project',
+    type=click.Path(exists=True, file_okay=False),
+    help='Benchmark an existing project rather than generating one.',
+)
+@click.option(
+    '-o',
+    '--output',
+    type=click.File('w'),
+    default='-',
+    help='The file to write the results to. Defaults to stdout.',
+)
+def run(tools, workers, repeat, only, project, output, **parameters):
+    tools = tools or [
+        name
+        for name, tool in get_tools().items()
+        if tool.can_be_used()
+    ]
+    workers = workers or (1, 2, 4)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = project
+        if not path:
+            path = os.path.join(tmpdir, 'project')
+            generate_project(path, **parameters)
+        path = os.path.abspath(path)
+
+        results = run_benchmarks(
+            path,
+            list(tools),
+            list(workers),
+            repeat,
+            parameters['issues'],
+            only=only,
+        )
+
+    json.dump(
+        {
+            'format': RESULTS_FORMAT,
+            'tidypy': get_distribution_version('tidypy'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'project': project,
+            'parameters': parameters,
+            'repeat': repeat,
+            'benchmarks': results,
+        },
+        output,
+        indent=2,
+    )
+    output.write('\n')
+
+
+@main.command(
+    'compare',
+    help='Compares the results of two executions of the benchmarks.',
+)
+@click.option(
+    '--threshold',
+    type=click.FloatRange(min=0),
+    default=10.0,
+    show_default=True,
+    help='The percentage by which a benchmark must be slower to be considered'
+    ' a regression.',
+)
+@click.argument('baseline', type=click.File('r'))
+@click.argument('current', type=click.File('r'))
+@click.pass_context
+def compare(ctx, threshold, baseline, current):
+    baseline = json.load(baseline)
+    current = json.load(current)
+
+    for key in ('format', 'parameters', 'project'):
+        if baseline.get(key) != current.get(key):
+            click.echo(
+                'The results were produced with different %s' % (key,),
+                err=True,
+            )
+            ctx.exit(2)
+
+    click.echo('%-40s %12s %12s %9s' % (
+        'benchmark',
+        'baseline',
+        'current',
+        'change',
+    ))
+    regressions = 0
+    for name, result in current['benchmarks'].items():
+        if name not in baseline['benchmarks']:
+            continue
+        before = baseline['benchmarks'][name]['best']
+        after = result['best']
+        change = ((after - before) / before * 100) if before else 0.0
+        flag = ''
+        if change > threshold:
+            flag = ' !'
+            regressions += 1
+        click.echo('%-40s %11.4fs %11.4fs %+8.1f%%%s' % (
+            name,
+            before,
+            after,
+            change,
+            flag,
+        ))
+
+    if regressions:
+        click.echo(
+            '%d benchmark(s) regressed by more than %s%%' % (
+                regressions,
+                threshold,
+            ),
+            err=True,
+        )
+        ctx.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,13 @@
 
 from . import util
 
+from .cache import purge_result_cache
+
 from .collector import Collector
 
 from .config import (
     get_tools,
+    get_tool_metadata,
     get_reports,
     get_extenders,
     get_default_config,
@@ -47,6 +50,8 @@ from .tools import (
     AccessIssue,
     ParseIssue,
     ToolIssue,
+    AstChecker,
+    AstDispatcher,
 )
 
 
@@ -54,6 +59,7 @@ __all__ = (
     'execute_tools',
     'execute_reports',
     'get_tools',
+    'get_tool_metadata',
     'get_reports',
     'get_extenders',
     'get_default_config',
@@ -61,6 +67,7 @@ __all__ = (
     'get_local_config',
     'get_project_config',
     'purge_config_cache',
+    'purge_result_cache',
     'util',
 
     'Tool',
@@ -71,6 +78,8 @@ __all__ = (
     'AccessIssue',
     'ParseIssue',
     'ToolIssue',
+    'AstChecker',
+    'AstDispatcher',
 
     'Finder',
     'Collector',
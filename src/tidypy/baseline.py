@@ -0,0 +1,203 @@
+
+import os
+import struct
+
+from collections import Counter, defaultdict
+from hashlib import blake2b
+from pathlib import Path
+
+from .util import read_file
+
+
+BASELINE_MAGIC = b'TPYB'
+
+BASELINE_VERSION = 1
+
+HEADER = struct.Struct('>4sBxxxI')
+
+FINGERPRINT_SIZE = 16
+
+
+class BaselineError(Exception):
+    """
+    An exception indicating that a baseline file could not be read.
+    """
+
+
+class Baseline:
+    """
+    A record of the issues that were known to exist in a project at some point,
+    so that only the issues that have appeared since then are reported.
+
+    Each issue is identified by a fingerprint of its tool, its code, the path
+    to its file (relative to the project), and the whitespace-normalized
+    content of its line, so that issues are still recognized after the lines
+    around them are added or removed.
+    """
+
+    def __init__(self, base_path, fingerprints=None):
+        """
+        :param base_path: the path to the base of the project
+        :type base_path: str
+        :param fingerprints:
+            the number of times each fingerprint occurs in the baseline
+        :type fingerprints: collections.Counter
+        """
+
+        self.base_path = Path(base_path).resolve()
+        self.fingerprints = fingerprints or Counter()
+
+    def __len__(self):
+        return sum(self.fingerprints.values())
+
+    @classmethod
+    def from_issues(cls, base_path, issues):
+        """
+        Creates a baseline that contains the specified issues.
+
+        :param base_path: the path to the base of the project
+        :type base_path: str
+        :param issues: the issues to include in the baseline
+        :type issues: list(tidypy.Issue)
+        :rtype: tidypy.baseline.Baseline
+        """
+
+        baseline = cls(base_path)
+        baseline.fingerprints.update(baseline.get_fingerprints(issues))
+        return baseline
+
+    @classmethod
+    def load(cls, path, base_path):
+        """
+        Reads a baseline from a file.
+
+        :param path: the path to the file to read
+        :type path: str
+        :param base_path: the path to the base of the project
+        :type base_path: str
+        :rtype: tidypy.baseline.Baseline
+        """
+
+        try:
+            with open(path, 'rb') as baseline_file:
+                data = baseline_file.read()
+        except EnvironmentError as exc:
+            raise BaselineError(
+                'Could not read baseline %s: %s' % (path, exc),
+            ) from exc
+
+        if len(data) < HEADER.size:
+            raise BaselineError('%s is not a TidyPy baseline' % (path,))
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != BASELINE_MAGIC \
+                or len(data) != HEADER.size + count * FINGERPRINT_SIZE:
+            raise BaselineError('%s is not a TidyPy baseline' % (path,))
+        if version != BASELINE_VERSION:
+            raise BaselineError(
+                '%s was written by an incompatible version of TidyPy' % (
+                    path,
+                ),
+            )
+
+        return cls(base_path, Counter(
+            data[idx:idx + FINGERPRINT_SIZE]
+            for idx in range(HEADER.size, len(data), FINGERPRINT_SIZE)
+        ))
+
+    def save(self, path):
+        """
+        Writes the baseline to a file.
+
+        The fingerprints are stored sorted, so that the file doesn't change
+        unless the issues in it do.
+
+        :param path: the path to the file to write
+        :type path: str
+        """
+
+        fingerprints = sorted(self.fingerprints.elements())
+        temp_path = '%s.%s' % (path, os.getpid())
+        with open(temp_path, 'wb') as baseline_file:
+            baseline_file.write(HEADER.pack(
+                BASELINE_MAGIC,
+                BASELINE_VERSION,
+                len(fingerprints),
+            ))
+            baseline_file.write(b''.join(fingerprints))
+        os.replace(temp_path, path)
+
+    def _relative_path(self, filename):
+        try:
+            return Path(filename).relative_to(self.base_path).as_posix()
+        except ValueError:
+            return str(filename)
+
+    def _get_lines(self, filename):
+        try:
+            return read_file(filename).splitlines()
+        except (EnvironmentError, TypeError, ValueError):
+            return []
+
+    def get_fingerprints(self, issues):
+        """
+        Produces the fingerprints of the specified issues.
+
+        :param issues: the issues to produce the fingerprints of
+        :type issues: list(tidypy.Issue)
+        :rtype: list(bytes)
+        """
+
+        fingerprints = [None] * len(issues)
+
+        # Handle the issues one file at a time, so that only one file's lines
+        # are held at once.
+        files = defaultdict(list)
+        for idx, issue in enumerate(issues):
+            files[issue.filename].append(idx)
+
+        for filename, indexes in files.items():
+            file_hash = blake2b(
+                self._relative_path(filename).encode('utf-8', 'replace'),
+                digest_size=FINGERPRINT_SIZE,
+            )
+            lines = self._get_lines(filename)
+            normalized = {}
+            for idx in indexes:
+                issue = issues[idx]
+                if issue.line not in normalized:
+                    line = ''
+                    if issue.line and issue.line <= len(lines):
+                        line = ' '.join(lines[issue.line - 1].split())
+                    normalized[issue.line] = line
+                digest = file_hash.copy()
+                digest.update('\0'.join([
+                    '',
+                    str(issue.tool),
+                    str(issue.code),
+                    normalized[issue.line],
+                ]).encode('utf-8', 'replace'))
+                fingerprints[idx] = digest.digest()
+
+        return fingerprints
+
+    def filter(self, issues):
+        """
+        Removes the issues that are in the baseline.
+
+        When the baseline contains an issue a number of times, only that many
+        of the matching issues are removed.
+
+        :param issues: the issues to filter
+        :type issues: list(tidypy.Issue)
+        :rtype: list(tidypy.Issue)
+        """
+
+        issues = list(issues)
+        used = Counter()
+        filtered = []
+        for issue, fingerprint in zip(issues, self.get_fingerprints(issues)):
+            if used[fingerprint] < self.fingerprints[fingerprint]:
+                used[fingerprint] += 1
+            else:
+                filtered.append(issue)
+        return filtered
@@ -0,0 +1,422 @@
+
+import json
+import os
+import pickle  # noqa: B403
+import sqlite3
+import time
+
+from hashlib import sha256
+
+from .config import get_cache_path
+from .tools import ToolIssue
+from .util import get_distribution_version
+
+
+RESULT_CACHE_FILENAME = 'results.sqlite'
+
+DURATIONS_DIRNAME = 'durations'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    issues BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+)
+'''
+
+
+def get_result_cache_path():
+    return os.path.join(get_cache_path(), RESULT_CACHE_FILENAME)
+
+
+def purge_result_cache():
+    """
+    Clears out the cache of the issues that tools found in previous executions.
+    """
+
+    path = get_result_cache_path()
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def open_result_cache():
+    """
+    Opens the cache of the issues that tools found in previous executions.
+    Returns ``None`` if the cache can't be used (e.g., its directory is
+    read-only, or its database is locked or corrupt), in which case the tools
+    are simply executed without it.
+
+    :rtype: tidypy.cache.ResultCache
+    """
+
+    try:
+        return ResultCache()
+    except sqlite3.Error:
+        return None
+
+
+def get_durations_path(base_path):
+    """
+    Produces the path to the file that stores how long the tools took to
+    analyze the specified project in previous executions.
+
+    :param base_path: the absolute path to the base of the project
+    :type base_path: str
+    :rtype: str
+    """
+
+    key = sha256(str(base_path).encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_path(), DURATIONS_DIRNAME, key + '.json')
+
+
+def load_tool_durations(base_path):
+    """
+    Retrieves how long the tools took to analyze the specified project in
+    previous executions.
+
+    :param base_path: the absolute path to the base of the project
+    :type base_path: str
+    :returns:
+        a dict whose keys are the names of the tools, and whose values are
+        dicts containing the ``time`` (in seconds) the tool took and the number
+        of ``files`` it analyzed
+    """
+
+    try:
+        with open(get_durations_path(base_path), 'r') as durations_file:
+            durations = json.load(durations_file)
+    except Exception:  # noqa: broad-except
+        return {}
+    return durations if isinstance(durations, dict) else {}
+
+
+def store_tool_durations(base_path, profiles):
+    """
+    Records how long the tools took to analyze the specified project, so that
+    the longest ones can be started first in later executions.
+
+    The durations are averaged with those of the previous executions, to
+    smooth out the noise in individual measurements.
+
+    :param base_path: the absolute path to the base of the project
+    :type base_path: str
+    :param profiles:
+        the profiles of the tools that were executed (see
+        ``tidypy.Progress.on_tool_profile()``), keyed by their names
+    :type profiles: dict
+    """
+
+    if not profiles:
+        return
+
+    durations = load_tool_durations(base_path)
+    for name, profile in profiles.items():
+        duration = {
+            'time': profile['wall_time'],
+            'files': profile['files'],
+        }
+        previous = durations.get(name)
+        if isinstance(previous, dict):
+            # Scale the previous time to the number of files analyzed this
+            # time, since only some of them may have needed to be.
+            scale = 1
+            if previous.get('files') and duration['files']:
+                scale = duration['files'] / previous['files']
+            duration['time'] = (duration['time'] + previous['time'] * scale) \
+                / 2
+        durations[name] = duration
+
+    path = get_durations_path(base_path)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = '%s.%s' % (path, os.getpid())
+        with open(temp_path, 'w') as durations_file:
+            json.dump(durations, durations_file)
+        os.replace(temp_path, path)
+    except EnvironmentError:
+        pass
+
+
+def hash_file(filepath):
+    digest = sha256()
+    with open(filepath, 'rb') as target:
+        for chunk in iter(lambda: target.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    A persistent cache of the issues that tools found in individual files.
+
+    Entries are keyed by the tool, the version and configuration of the tool,
+    and the path and content of the file, so they become unreachable as soon as
+    any of those things change.
+    """
+
+    def __init__(self, path=None):
+        """
+        :param path:
+            the path to the database to store the cache in. If not specified,
+            the database is stored in TidyPy's cache directory.
+        :type path: str
+        """
+
+        self._connection = sqlite3.connect(
+            path or get_result_cache_path(),
+            timeout=30,
+        )
+        self._connection.execute(SCHEMA)
+        self._file_hashes = {}
+
+    def close(self):
+        self._connection.close()
+
+    def get_signature(self, name, version, tool_config):
+        """
+        Produces a string that identifies the tool, its version, and the
+        configuration it is executed with. Returns ``None`` if the tool's
+        results cannot be cached.
+
+        :param name: the name of the tool
+        :type name: str
+        :param version:
+            the version of the tool's analysis logic (see
+            ``tidypy.Tool.get_version()``)
+        :type version: str
+        :param tool_config: the configuration of the tool
+        :type tool_config: dict
+        :rtype: str
+        """
+
+        if version is None:
+            return None
+
+        return sha256(json.dumps(
+            [
+                name,
+                get_distribution_version('tidypy'),
+                version,
+                tool_config,
+            ],
+            sort_keys=True,
+            default=str,
+        ).encode('utf-8')).hexdigest()
+
+    def get_key(self, signature, filepath):
+        """
+        Produces the key that the results of a tool for a file are stored
+        under. Returns ``None`` if the file cannot be read.
+
+        :param signature: the signature of the tool
+        :type signature: str
+        :param filepath: the path to the file
+        :type filepath: str
+        :rtype: str
+        """
+
+        if filepath not in self._file_hashes:
+            try:
+                self._file_hashes[filepath] = hash_file(filepath)
+            except EnvironmentError:
+                self._file_hashes[filepath] = None
+        if self._file_hashes[filepath] is None:
+            return None
+
+        return sha256('|'.join([
+            signature,
+            filepath,
+            self._file_hashes[filepath],
+        ]).encode('utf-8')).hexdigest()
+
+    def get_noqa_signature(self):
+        """
+        Produces the signature that the tables of the "noqa" directives in
+        files are stored under (see ``get_key()``).
+
+        :rtype: str
+        """
+
+        return sha256(json.dumps(
+            ['noqa', get_distribution_version('tidypy')],
+        ).encode('utf-8')).hexdigest()
+
+    def load_noqa(self, filepaths):
+        """
+        Retrieves the stored tables of the "noqa" directives in the specified
+        files.
+
+        :param filepaths: the paths to the files
+        :type filepaths: list(str)
+        :returns:
+            a dict whose keys are the paths to the files that were found, and
+            whose values are their tables
+        """
+
+        signature = self.get_noqa_signature()
+        keys = {}
+        for filepath in filepaths:
+            key = self.get_key(signature, filepath)
+            if key:
+                keys[filepath] = key
+
+        hits = self.get(keys.values())
+        return {
+            filepath: hits[key]
+            for filepath, key in keys.items()
+            if key in hits
+        }
+
+    def store_noqa(self, tables):
+        """
+        Stores the tables of the "noqa" directives in files.
+
+        Only the tables of files whose results were stored or retrieved by this
+        cache are stored, so that no other files need to be read.
+
+        :param tables:
+            a dict whose keys are the paths to the files, and whose values are
+            their tables
+        :type tables: dict
+        """
+
+        signature = self.get_noqa_signature()
+        entries = {}
+        for filepath, table in tables.items():
+            if filepath in self._file_hashes:
+                key = self.get_key(signature, filepath)
+                if key:
+                    entries[key] = table
+
+        if entries:
+            self.put(entries)
+
+    def get(self, keys):
+        """
+        Retrieves the issues that were stored under the specified keys.
+
+        :param keys: the keys to retrieve
+        :type keys: list(str)
+        :returns:
+            a dict whose keys are the keys that were found, and whose values
+            are the lists of issues stored under them
+        """
+
+        results = {}
+        corrupt = []
+
+        keys = list(keys)
+        for idx in range(0, len(keys), 500):
+            batch = keys[idx:idx + 500]
+            # Only the placeholders for the batch's values are interpolated
+            # into the query.
+            query = 'SELECT key, issues FROM results WHERE key IN (%s)'
+            query = query % (','.join('?' * len(batch)),)
+            for key, issues in self._connection.execute(query, batch):
+                try:
+                    # The database lives in the user's own cache directory and
+                    # is only ever written by TidyPy.
+                    results[key] = pickle.loads(issues)  # noqa: B301,DUO103
+                except Exception:  # noqa: broad-except
+                    # Entries that can no longer be loaded (e.g., written by
+                    # an incompatible version of a tool) are treated as misses,
+                    # and are discarded so they can be replaced.
+                    corrupt.append((key,))
+
+        if corrupt:
+            with self._connection:
+                self._connection.executemany(
+                    'DELETE FROM results WHERE key = ?',
+                    corrupt,
+                )
+
+        if results:
+            with self._connection:
+                self._connection.executemany(
+                    'UPDATE results SET accessed = ? WHERE key = ?',
+                    [(time.time(), key) for key in results],
+                )
+
+        return results
+
+    def put(self, entries):
+        """
+        Stores lists of issues in the cache.
+
+        :param entries:
+            a dict whose keys are the keys to store the issues under, and whose
+            values are the lists of issues to store
+        :type entries: dict
+        """
+
+        now = time.time()
+        rows = []
+        for key, issues in entries.items():
+            data = pickle.dumps(issues, pickle.HIGHEST_PROTOCOL)
+            rows.append((key, data, len(data), now))
+
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)',
+                rows,
+            )
+
+    def prune(self, max_size):
+        """
+        Removes the least-recently used entries from the cache until the total
+        size of what's stored is within the specified limit.
+
+        :param max_size: the maximum number of bytes to keep
+        :type max_size: int
+        """
+
+        total = self._connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM results',
+        ).fetchone()[0]
+        if total <= max_size:
+            return
+
+        expired = []
+        cursor = self._connection.execute(
+            'SELECT key, size FROM results ORDER BY accessed',
+        )
+        for key, size in cursor:
+            if total <= max_size:
+                break
+            expired.append((key,))
+            total -= size
+
+        with self._connection:
+            self._connection.executemany(
+                'DELETE FROM results WHERE key = ?',
+                expired,
+            )
+
+    def store_results(self, keys, issues):
+        """
+        Stores the issues a tool found while analyzing a set of files.
+
+        Issues that are not associated with one of the files are not stored.
+        If the tool failed in any way, nothing is stored.
+
+        :param keys:
+            a dict whose keys are the paths to the files the tool analyzed, and
+            whose values are the keys to store their issues under
+        :type keys: dict
+        :param issues: the issues the tool found
+        :type issues: list(tidypy.Issue)
+        """
+
+        if any(isinstance(issue, ToolIssue) for issue in issues):
+            return
+
+        entries = {
+            key: []
+            for key in keys.values()
+        }
+        for issue in issues:
+            if issue.filename in keys:
+                entries[keys[issue.filename]].append(issue)
+
+        self.put(entries)
@@ -8,25 +8,29 @@ from collections import OrderedDict
 import click
 import basicserial
 
-from .core import execute_tools, execute_reports
+from .baseline import Baseline, BaselineError
+from .cache import purge_result_cache
+from .core import execute_tools, execute_reports, create_reports
 from .config import (
     get_tools,
+    get_tool_metadata,
     get_reports,
     get_extenders,
     get_default_config,
     get_specific_config,
     get_project_config,
+    override_config,
     purge_config_cache,
 )
-from .plugin.git import GitHook
+from .daemon import DaemonServer, DaemonClient, DaemonError, \
+    is_daemon_supported
+from .plugin.git import GitHook, get_changed_files
 from .plugin.mercurial import MercurialHook
+from .profiling import write_profile
 from .progress import QuietProgress, ConsoleProgress
 from .util import output_error
 
 
-# pylint: disable=too-many-arguments
-
-
 @click.group(
     help='A tool that executes several static analysis tools upon a Python'
     ' project and aggregates the results.',
@@ -54,6 +58,133 @@ def validate_report_type(ctx, param, values):  # noqa: unused-argument
     return types
 
 
+def validate_tools(ctx, param, values):  # noqa: unused-argument
+    for value in values:
+        usable = value in get_tool_metadata() \
+            and get_tools()[value].can_be_used()
+        if not usable:
+            raise click.BadParameter(
+                'the {value} tool cannot be used in this environment'.format(
+                    value=value,
+                ),
+                param=param,
+            )
+
+    return values
+
+
+def get_overrides(options):
+    # Establish the settings that override the configuration
+    overrides = {}
+    if options['excludes']:
+        overrides['exclude'] = list(options['excludes'])
+    if options['disable_merge']:
+        overrides['merge-issues'] = False
+    if options['disable_noqa']:
+        overrides['noqa'] = False
+    if options['disable_result_cache']:
+        overrides['result-cache'] = False
+    if options['workers']:
+        overrides['workers'] = options['workers']
+    if options['enable_sharding']:
+        overrides['sharding'] = True
+    overrides['requested_reports'] = [
+        {
+            'type': report,
+            'file': fname,
+        }
+        for report, fname in options['reports'] or [['console', None]]
+    ]
+    return overrides
+
+
+def get_changed_paths(ctx, path, options):
+    paths = None
+    if options['changed'] or options['since']:
+        try:
+            paths = get_changed_files(path, since=options['since'])
+        except Exception as exc:  # pylint: disable=broad-except
+            output_error('Could not retrieve the changed files: %s' % (exc,))
+            ctx.exit(1)
+    return paths
+
+
+def load_baseline(ctx, path, baseline_file):
+    baseline = None
+    if baseline_file:
+        try:
+            baseline = Baseline.load(baseline_file, path)
+        except BaselineError as exc:
+            output_error(str(exc))
+            ctx.exit(1)
+    return baseline
+
+
+def establish_config(ctx, path, options, overrides):
+    try:
+        if options['config_file']:
+            config = get_specific_config(
+                options['config_file'],
+                path,
+                use_cache=not options['disable_config_cache'],
+            )
+        else:
+            config = get_project_config(
+                path,
+                use_cache=not options['disable_config_cache'],
+            )
+    except Exception as exc:  # pylint: disable=broad-except
+        output_error('Could not parse config file: %s' % (exc,))
+        ctx.exit(1)
+    override_config(config, overrides, options['tools'])
+    return config
+
+
+def check_with_daemon(ctx, path, options, overrides, **kwargs):
+    result = None
+    try:
+        result = DaemonClient().check(
+            path,
+            config_file=os.path.abspath(options['config_file'])
+            if options['config_file'] else None,
+            use_cache=not options['disable_config_cache'],
+            overrides=overrides,
+            tools=options['tools'],
+            **kwargs
+        )
+    except DaemonError as exc:
+        output_error(str(exc))
+        ctx.exit(1)
+    return result
+
+
+def create_progress(config, options):
+    if options['disable_progress'] or options['stream']:
+        return QuietProgress()
+    return ConsoleProgress(config)
+
+
+def write_profile_file(ctx, path, progress, filename):
+    try:
+        write_profile(filename, path, progress.tool_profiles)
+    except EnvironmentError as exc:
+        output_error('Could not write profile: %s' % (exc,))
+        ctx.exit(1)
+
+
+def write_baseline(ctx, path, collector, filename):
+    # The new baseline records every issue that was found, and then replaces
+    # the old one so that only the issues it doesn't know of are reported.
+    collector.set_baseline(None)
+    baseline = Baseline.from_issues(path, collector.get_issues())
+    try:
+        baseline.save(filename)
+    except EnvironmentError as exc:
+        output_error('Could not write baseline: %s' % (exc,))
+        ctx.exit(1)
+    collector.set_baseline(baseline)
+
+
 @main.command(  # noqa
     'check',
     short_help='Executes the tools upon the project files.',
@@ -78,11 +209,8 @@ If not specified, defaults to the current working directory.
     '-t',
     'tools',
     multiple=True,
-    type=click.Choice(sorted([
-        name
-        for name, cls in get_tools().items()
-        if cls.can_be_used()
-    ])),
+    type=click.Choice(sorted(get_tools().keys())),
+    callback=validate_tools,
     help='Specifies the name of a tool to use during the examination. Can be'
     ' specified multiple times. Overrides the configuration file.',
 )
@@ -114,6 +242,13 @@ If not specified, defaults to the current working directory.
     help='The number of workers to use to concurrently execute the tools.'
     ' Overrides the configuration file.',
 )
+@click.option(
+    '--enable-sharding',
+    is_flag=True,
+    help='Split the work of the tools that analyze each file independently'
+    ' into batches of files that any worker can execute. Overrides the'
+    ' configuration file.',
+)
 @click.option(
     '--disable-merge',
     is_flag=True,
@@ -137,76 +272,133 @@ If not specified, defaults to the current working directory.
     help='Disable the use of the cache when retrieving configurations'
     ' referenced by the "extends" option.',
 )
+@click.option(
+    '--disable-result-cache',
+    is_flag=True,
+    help='Disable the use of the cache of the issues found in files that have'
+    ' not changed since a previous execution.',
+)
+@click.option(
+    '--changed',
+    is_flag=True,
+    help='Only analyze the files that Git reports as added or modified (or'
+    ' untracked). Tools that analyze the project as a whole are skipped,'
+    ' unless the changed-project-tools option is set to "filter".',
+)
+@click.option(
+    '--since',
+    metavar='REF',
+    help='The Git revision to compare against when finding the changed files.'
+    ' Implies --changed. If not specified, defaults to HEAD.',
+)
+@click.option(
+    '--daemon',
+    'use_daemon',
+    is_flag=True,
+    help='Have the running TidyPy daemon (see the daemon command) execute the'
+    ' tools.',
+)
+@click.option(
+    '--stream',
+    is_flag=True,
+    help='Output the issues found in each file as soon as all the tools have'
+    ' finished analyzing it, rather than after the entire project has been'
+    ' analyzed. Only supported by the console, pycodestyle, csv, and jsonl'
+    ' reports. Disables the display of the progress bar.',
+)
+@click.option(
+    '--baseline',
+    'baseline_file',
+    metavar='FILENAME',
+    type=click.Path(exists=True, dir_okay=False),
+    help='Only report the issues that are not in the specified baseline file'
+    ' (see --write-baseline).',
+)
+@click.option(
+    '--write-baseline',
+    'write_baseline_file',
+    metavar='FILENAME',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Record all the issues that are found in the specified baseline file,'
+    ' so that only new issues are reported when it is used with --baseline.',
+)
+@click.option(
+    '--profile',
+    'profile_file',
+    metavar='FILENAME',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Record the time and CPU time each tool used, the peak memory of the'
+    ' workers that executed it, and the files each tool spent the most time'
+    ' on, in the specified file as a JSON object.',
+)
 @click.argument(
     'path',
     type=click.Path(exists=True),
     default=os.getcwd(),
 )
 @click.pass_context
-def check(  # noqa: mccabe:complex
-        ctx,
-        excludes,
-        tools,
-        reports,
-        config_file,
-        disable_merge,
-        workers,
-        disable_progress,
-        disable_noqa,
-        disable_config_cache,
-        path):
+def check(ctx, path, **options):
     # Clean up the path
     path = os.path.abspath(path)
 
-    # Establish the configuration
-    try:
-        if config_file:
-            config = get_specific_config(
-                config_file,
-                path,
-                use_cache=not disable_config_cache,
-            )
-        else:
-            config = get_project_config(
-                path,
-                use_cache=not disable_config_cache,
-            )
-    except Exception as exc:  # pylint: disable=broad-except
-        output_error('Could not parse config file: %s' % (exc,))
-        ctx.exit(1)
+    overrides = get_overrides(options)
+    paths = get_changed_paths(ctx, path, options)
+    baseline = load_baseline(ctx, path, options['baseline_file'])
+
+    reporters = []
+    progresses = []
+
+    def prepare(config):
+        if options['stream']:
+            reporters.extend(create_reports(config, path))
+        progresses.append(create_progress(config, options))
+        return progresses[-1]
+
+    def on_files_complete(collector, filenames):
+        for _, reporter in reporters:
+            reporter.stream(collector, filenames)
+
+    if options['use_daemon']:
+        config, collector = check_with_daemon(
+            ctx,
+            path,
+            options,
+            overrides,
+            paths=paths,
+            progress_factory=prepare,
+            on_files_complete=on_files_complete if options['stream'] else None,
+            baseline=baseline,
+        )
 
-    if excludes:
-        config['exclude'] = excludes
-    if disable_merge:
-        config['merge-issues'] = False
-    if disable_noqa:
-        config['noqa'] = False
-    if workers:
-        config['workers'] = workers
-    if tools:
-        for tool in get_tools():
-            config[tool]['use'] = tool in tools
-    reports = reports or [['console', None]]
-    config['requested_reports'] = [
-        {
-            'type': report,
-            'file': fname,
-        }
-        for report, fname in reports
-    ]
-    if disable_progress:
-        progress = QuietProgress()
     else:
-        progress = ConsoleProgress(config)
-
-    collector = execute_tools(
+        config = establish_config(ctx, path, options, overrides)
+        collector = execute_tools(
+            config,
+            path,
+            progress=prepare(config),
+            paths=paths,
+            on_files_complete=on_files_complete if options['stream'] else None,
+            baseline=baseline,
+        )
+
+    if options['profile_file'] and progresses:
+        write_profile_file(
+            ctx,
+            path,
+            progresses[-1],
+            options['profile_file'],
+        )
+
+    if options['write_baseline_file']:
+        write_baseline(ctx, path, collector, options['write_baseline_file'])
+
+    execute_reports(
         config,
         path,
-        progress=progress,
+        collector,
+        reporters=reporters if options['stream'] else None,
     )
 
-    execute_reports(config, path, collector)
-
     if collector.issue_count() > 0:
         ctx.exit(1)
 
@@ -294,6 +486,60 @@ def purge_cache():
     purge_config_cache()
 
 
+@main.command(
+    'purge-result-cache',
+    short_help='Deletes the cache of issues found during previous'
+    ' executions.',
+    help='Deletes the cache of issues found during previous executions.',
+)
+def purge_results():
+    purge_result_cache()
+
+
+@main.command(
+    'daemon',
+    short_help='Starts a process that executes the tools on behalf of the'
+    ' check command.',
+    help='''Starts a process that executes the tools on behalf of the check
+command when it is invoked with the --daemon option.
+
+The daemon keeps the tools loaded and its workers running between requests,
+which greatly reduces the time it takes to analyze a project again. It runs
+until it is stopped using the --stop option.
+''',
+)
+@click.option(
+    '--workers',
+    type=click.IntRange(1),
+    metavar='NUM_WORKERS',
+    help='The number of workers to use to concurrently execute the tools.',
+)
+@click.option(
+    '--stop',
+    is_flag=True,
+    help='Stop the daemon that is currently running.',
+)
+@click.pass_context
+def daemon(ctx, workers, stop):
+    if not is_daemon_supported():  # pragma: no cover
+        output_error('The daemon is not supported on this platform')
+        ctx.exit(1)
+
+    if stop:
+        try:
+            DaemonClient().stop()
+        except DaemonError as exc:
+            output_error(str(exc))
+            ctx.exit(1)
+        return
+
+    try:
+        DaemonServer(workers=workers).serve_forever()
+    except DaemonError as exc:
+        output_error(str(exc))
+        ctx.exit(1)
+
+
 @main.command(
     'install-vcs',
     short_help='Installs TidyPy as a pre-commit hook into the specified VCS.',
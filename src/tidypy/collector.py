@@ -14,11 +14,152 @@ RE_NOQA = re.compile(
     re.IGNORECASE,
 )
 
+# The codes in a directive are separated by commas, which may be surrounded by
+# whitespace. Whitespace alone doesn't separate codes, so a directive like
+# "# noqa: E501 something" doesn't suppress a code named "something".
+RE_NOQA_SEPARATOR = re.compile(r'\s*,\s*')
+
+
+# The value of the lines in a noqa table that suppress every issue.
+NOQA_ALL = 'ALL'
+
 
 def default_group(issue):  # noqa
     return issue.filename
 
 
+def parse_noqa(content):
+    """
+    Extracts the "noqa" directives from the source of a Python module.
+
+    Returns a dict whose keys are the line numbers that contain a directive,
+    and whose values are either ``NOQA_ALL``, or a tuple containing the sets
+    of the codes, the tools (``@tool``), and the tool/code pairs
+    (``tool:code``) that are suppressed on that line.
+
+    :param content: the source of the module
+    :type content: str
+    :rtype: dict
+    """
+
+    table = {}
+
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Searching the whole content at once (rather than line by line) keeps
+    # the cost proportional to the number of directives.
+    parsed = {}
+    line = 1
+    position = 0
+    for match in _find_noqa(content):
+        line += content.count('\n', position, match.start())
+        position = match.start()
+        if line in table:
+            continue
+
+        if not match.group('codes'):
+            table[line] = NOQA_ALL
+            continue
+
+        directive = match.group('codes').split('\n', 1)[0]
+        if directive not in parsed:
+            parsed[directive] = _parse_noqa_codes(directive)
+        table[line] = parsed[directive]
+
+    return table
+
+
+def _parse_noqa_codes(directive):
+    codes = set()
+    tools = set()
+    tool_codes = set()
+    for code in RE_NOQA_SEPARATOR.split(directive.strip()):
+        if not code:
+            continue
+        if code.startswith('@'):
+            tools.add(code[1:])
+        elif ':' in code:
+            tool_codes.add(tuple(code.split(':', 1)))
+        else:
+            codes.add(code)
+    return frozenset(codes), frozenset(tools), frozenset(tool_codes)
+
+
+def _find_noqa(content):
+    lowered = content.lower()
+    if len(lowered) != len(content):
+        # The offsets in the lowered content don't line up.
+        yield from RE_NOQA.finditer(content)
+        return
+
+    position = lowered.find('# noqa')
+    while position != -1:
+        match = RE_NOQA.match(content, position)
+        yield match
+        position = lowered.find('# noqa', match.end())
+
+
+def get_noqa_table(filename):
+    """
+    Produces the table of "noqa" directives in the specified file (see
+    ``parse_noqa()``). Files that aren't Python modules or can't be read have
+    empty tables.
+
+    :param filename: the path to the file
+    :type filename: str
+    :rtype: dict
+    """
+
+    if not RE_PYTHON_FILE.search(filename):
+        return {}
+
+    try:
+        content = read_file(filename)
+    except EnvironmentError:
+        return {}
+
+    return parse_noqa(content)
+
+
+def get_sort_key(sortby):
+    """
+    Produces a function that generates a composite key that can be used to
+    sort issues by several of their properties in a single pass.
+
+    :param sortby: the properties to sort the issues by
+    :type sortby: list(str)
+    :rtype: func
+    """
+
+    getters = [
+        (attr, 0 if attr in ('line', 'character') else '')
+        for attr in sortby
+    ]
+
+    def keyfunc(issue):
+        return tuple(
+            getattr(issue, attr) or default
+            for attr, default in getters
+        )
+
+    return keyfunc
+
+
+def merge_key(issue):  # noqa
+    return (
+        issue.filename or '',
+        issue.line is not None,
+        issue.line or 0,
+        issue.tool or '',
+        issue.code or '',
+        issue.character or 0,
+        # Keep the same duplicate regardless of the order the tools finished
+        # in.
+        issue.message or '',
+    )
+
+
 class Collector:
     """
     A class that contains all the issues found during an execution of the
@@ -37,9 +178,16 @@ class Collector:
 
         self._config = config
         self._all_issues = []
+        self._file_issues = defaultdict(list)
         self._cleaned_issues = None
+        self._views = {}
         self._lock = Lock()
-        self._noqa = {}
+        # What the issues are filtered with: the tables of the "noqa"
+        # directives in the files, and the baseline of known issues.
+        self._filters = {
+            'noqa': {},
+            'baseline': None,
+        }
 
     def add_issues(self, issues):
         """
@@ -53,7 +201,63 @@ class Collector:
             issues = [issues]
         with self._lock:
             self._all_issues.extend(issues)
+            for issue in issues:
+                self._file_issues[issue.filename].append(issue)
             self._cleaned_issues = None
+            self._views = {}
+
+    def add_noqa(self, tables):
+        """
+        Adds the tables of the "noqa" directives found in files to the
+        collection, so that the files don't need to be read again to filter
+        their issues.
+
+        :param tables:
+            a dict whose keys are the paths to the files, and whose values are
+            their tables, as produced by ``tidypy.collector.get_noqa_table()``
+        :type tables: dict
+        """
+
+        with self._lock:
+            self._filters['noqa'].update(tables)
+            self._cleaned_issues = None
+            self._views = {}
+
+    def set_baseline(self, baseline):
+        """
+        Specifies the baseline of known issues that should be left out of the
+        issues the collection produces.
+
+        :param baseline:
+            the baseline to use, or ``None`` to stop using a baseline
+        :type baseline: tidypy.baseline.Baseline
+        """
+
+        with self._lock:
+            self._filters['baseline'] = baseline
+            self._cleaned_issues = None
+            self._views = {}
+
+    def get_noqa(self, filenames=None):
+        """
+        Retrieves the tables of the "noqa" directives that the collection
+        knows of.
+
+        :param filenames:
+            the files to retrieve the tables of. If not specified, all known
+            tables are retrieved.
+        :type filenames: list(str)
+        :rtype: dict
+        """
+
+        with self._lock:
+            if filenames is None:
+                return dict(self._filters['noqa'])
+            return {
+                filename: self._filters['noqa'][filename]
+                for filename in filenames
+                if filename in self._filters['noqa']
+            }
 
     def issue_count(self, include_unclean=False):
         """
@@ -68,22 +272,47 @@ class Collector:
 
         if include_unclean:
             return len(self._all_issues)
-        self._ensure_cleaned_issues()
-        return len(self._cleaned_issues)
+        with self._lock:
+            self._ensure_cleaned_issues()
+            return len(self._cleaned_issues)
 
-    def get_issues(self, sortby=None):
+    def get_issues(self, sortby=None, include_unclean=False, filenames=None):
         """
         Retrieves the issues in the collection.
 
         :param sortby: the properties to sort the issues by
         :type sortby: list(str)
+        :param include_unclean:
+            whether or not to include issues that are being ignored due to
+            being a duplicate, excluded, etc.
+        :type include_unclean: bool
+        :param filenames:
+            the files to retrieve the issues of. If not specified, the issues
+            of all files are retrieved.
+        :type filenames: list(str)
         :rtype: list(tidypy.Issue)
         """
 
-        self._ensure_cleaned_issues()
-        return self._sort_issues(self._cleaned_issues, sortby)
+        if filenames is not None:
+            issues = self._get_file_issues(filenames)
+            if not include_unclean:
+                issues = self._clean_issues(issues)
+            return self._sort_issues(issues, sortby)
 
-    def get_grouped_issues(self, keyfunc=None, sortby=None):
+        if sortby is None:
+            sortby = self.DEFAULT_SORT
+        view = ('issues', tuple(sortby), include_unclean)
+        with self._lock:
+            if view not in self._views:
+                if include_unclean:
+                    issues = self._all_issues
+                else:
+                    self._ensure_cleaned_issues()
+                    issues = self._cleaned_issues
+                self._views[view] = self._sort_issues(issues, sortby)
+            return list(self._views[view])
+
+    def get_grouped_issues(self, keyfunc=None, sortby=None, filenames=None):
         """
         Retrieves the issues in the collection grouped into buckets according
         to the key generated by the keyfunc.
@@ -96,6 +325,10 @@ class Collector:
         :type keyfunc: func
         :param sortby: the properties to sort the issues by
         :type sortby: list(str)
+        :param filenames:
+            the files to retrieve the issues of. If not specified, the issues
+            of all files are retrieved.
+        :type filenames: list(str)
         :rtype: OrderedDict
         """
 
@@ -103,70 +336,80 @@ class Collector:
             keyfunc = default_group
         if not sortby:
             sortby = self.DEFAULT_SORT
-        self._ensure_cleaned_issues()
-        return self._group_issues(self._cleaned_issues, keyfunc, sortby)
+        if filenames is not None:
+            return self._group_issues(
+                self._clean_issues(self._get_file_issues(filenames)),
+                keyfunc,
+                sortby,
+            )
+
+        with self._lock:
+            self._ensure_cleaned_issues()
+            if keyfunc is not default_group:
+                # Arbitrary functions (e.g., lambdas created for each call)
+                # would never be looked up again, so only the default grouping
+                # is remembered.
+                return self._group_issues(
+                    self._cleaned_issues,
+                    keyfunc,
+                    sortby,
+                )
+
+            view = ('grouped', tuple(sortby))
+            if view not in self._views:
+                self._views[view] = self._group_issues(
+                    self._cleaned_issues,
+                    keyfunc,
+                    sortby,
+                )
+            return OrderedDict([
+                (key, list(issues))
+                for key, issues in self._views[view].items()
+            ])
+
+    def _get_file_issues(self, filenames):
+        with self._lock:
+            return [
+                issue
+                for filename in dict.fromkeys(filenames)
+                for issue in self._file_issues.get(filename, [])
+            ]
 
     def _sort_issues(self, issues, sortby=None):
         if sortby is None:
             sortby = self.DEFAULT_SORT
-
-        for attr in reversed(sortby):
-            if attr in ('line', 'character'):
-                keyfunc = lambda i, attr=attr: getattr(i, attr) or 0
-            else:
-                keyfunc = lambda i, attr=attr: getattr(i, attr) or ''
-
-            issues = sorted(issues, key=keyfunc)
-
-        return issues
+        if not sortby:
+            return list(issues)
+        return sorted(issues, key=get_sort_key(sortby))
 
     def _group_issues(self, issues, keyfunc, sortby):
+        # Sorting before grouping leaves every group sorted, as each group
+        # receives its issues in order.
         grouped = defaultdict(list)
-        for issue in issues:
+        for issue in self._sort_issues(issues, sortby):
             grouped[keyfunc(issue)].append(issue)
 
         return OrderedDict([
-            (key, self._sort_issues(grouped[key], sortby))
+            (key, grouped[key])
             for key in sorted(grouped)
         ])
 
-    def _parse_noqa(self, filename):
-        lines = {}
-
-        if not RE_PYTHON_FILE.search(filename):
-            return lines
-
-        try:
-            content = read_file(filename)
-        except EnvironmentError:
-            return lines
-
-        for idx, line in enumerate(content.splitlines()):
-            match = RE_NOQA.search(line)
-            if not match:
-                continue
-
-            if match.groupdict()['codes']:
-                lines[idx + 1] = match.groupdict()['codes'].split(',')
-            else:
-                lines[idx + 1] = 'ALL'
-
-        return lines
-
     def _is_noqa(self, issue):
-        if issue.filename not in self._noqa:
-            self._noqa[issue.filename] = self._parse_noqa(issue.filename)
+        table = self._filters['noqa'].get(issue.filename)
+        if table is None:
+            table = get_noqa_table(issue.filename)
+            self._filters['noqa'][issue.filename] = table
 
-        if issue.line not in self._noqa[issue.filename]:
+        directive = table.get(issue.line)
+        if directive is None:
             return False
-
-        codes = self._noqa[issue.filename][issue.line]
-        if codes == 'ALL':
+        if directive == NOQA_ALL:
             return True
 
+        codes, tools, tool_codes = directive
         return issue.code in codes \
-            or ('@%s' % (issue.tool,)) in codes \
-            or ('%s:%s' % (issue.tool, issue.code)) in codes
+            or issue.tool in tools \
+            or (issue.tool, issue.code) in tool_codes
 
     def _ensure_cleaned_issues(self):
         if self._cleaned_issues is None:
@@ -191,32 +434,20 @@ class Collector:
                 if not self._is_noqa(issue)
             ]
 
-        # If merging is disabled, let's bail out here
-        if not self._config['merge-issues']:
-            return issues
-
-        # Group the issues by file & line
-        grouped = self._group_issues(
-            issues,
-            lambda x: '%s|%s' % (x.filename, x.line),
-            ('tool', 'code', 'character'),
-        )
-        issues = []
-        for group in grouped.values():
-            issues.extend(self._merge_group(group))
+        if self._config['merge-issues']:
+            # Strip out the dupes on each line of each file, which end up next
+            # to each other once sorted
+            deduped = []
+            last = None
+            for issue in sorted(issues, key=merge_key):
+                this = (issue.filename, issue.line, issue.tool, issue.code)
+                if this != last:
+                    last = this
+                    deduped.append(issue)
+            issues = deduped
+
+        # Filter out the issues that were already known
+        if self._filters['baseline'] is not None:
+            issues = self._filters['baseline'].filter(issues)
 
         return issues
-
-    def _merge_group(self, issues):
-        # Strip out dupes
-        deduped = []
-        last = (None, None)
-        for issue in issues:
-            this = (issue.tool, issue.code)
-            if this != last:
-                last = this
-                deduped.append(issue)
-        issues = deduped
-
-        return issues
-
@@ -1,73 +1,278 @@
-import multiprocessing
+import json
 import os
-import shutil
+import re
 import sys
 
-from hashlib import sha512
+from collections.abc import Mapping
+from copy import deepcopy
+from hashlib import sha256, sha512
+from importlib.util import find_spec
 
 import toml
-import pkg_resources
+
+try:
+    from importlib.metadata import entry_points
+except ImportError:  # pragma: no cover
+    entry_points = None
 
 from .extenders import DoesNotExistError
 from .extenders.filesys import FilesysExtender
-from .util import merge_dict, output_error
+from .util import merge_dict, output_error, get_available_cpus
 
 
-def get_tools():
-    """
-    Retrieves the TidyPy tools that are available in the current Python
-    environment.
+TOOL_METADATA_FILENAME = 'tools.json'
 
-    The returned dictionary has keys that are the tool names and values are the
-    tool classes.
+# The suffixes of the entries in a directory of packages that record the
+# distributions installed in it.
+DISTRIBUTION_SUFFIXES = ('.dist-info', '.egg-info', '.egg-link', '.pth')
 
-    :rtype: dict
+# The names of the files that cache configurations (see get_cache_path()).
+CONFIG_CACHE_NAME = re.compile(r'^[0-9a-f]{128}$')
+
+
+class PluginRegistry(Mapping):
     """
+    A mapping of the names of the plugins registered under an entry point
+    group to the classes that implement them.
 
-    # pylint: disable=protected-access
+    The names are available without importing anything; a plugin is only
+    imported the first time its class is retrieved. Plugins that cannot be
+    imported are reported and then dropped from the mapping.
+    """
 
-    if not hasattr(get_tools, '_CACHE'):
-        get_tools._CACHE = {}
-        for entry in pkg_resources.iter_entry_points('tidypy.tools'):
+    def __init__(self, group, kind):
+        """
+        :param group: the entry point group the plugins are registered under
+        :type group: str
+        :param kind: the type of plugin, for use in error messages
+        :type kind: str
+        """
+
+        self._kind = kind
+        self._entries = {
+            entry.name: entry
+            for entry in iter_entry_points(group)
+        }
+        self._loaded = {}
+
+    def _load(self, name):
+        if name not in self._loaded:
+            entry = self._entries[name]
             try:
-                get_tools._CACHE[entry.name] = entry.load()
+                self._loaded[name] = entry.load()
             except ImportError as exc:  # pragma: no cover
                 output_error(
-                    'Could not load tool "%s" defined by "%s": %s' % (
+                    'Could not load %s "%s": %s' % (
+                        self._kind,
                         entry,
-                        entry.dist,
                         exc,
                     ),
                 )
+                del self._entries[name]
+                raise KeyError(name) from None
+        return self._loaded[name]
+
+    def __getitem__(self, name):
+        return self._load(name)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_entry_point(self, name):
+        """
+        Retrieves the entry point that registered a plugin, without loading
+        it.
+
+        :param name: the name of the plugin
+        :type name: str
+        """
+
+        return self._entries[name]
+
+    def items(self):
+        items = []
+        for name in self:
+            try:
+                items.append((name, self._load(name)))
+            except KeyError:  # pragma: no cover
+                pass
+        return items
+
+    def values(self):
+        return [cls for _, cls in self.items()]
+
+
+def iter_entry_points(group):
+    """
+    Retrieves the entry points registered under the specified group in the
+    current Python environment, without loading them.
+
+    :param group: the name of the entry point group
+    :type group: str
+    :rtype: list
+    """
+
+    if entry_points is None:  # pragma: no cover
+        # Python 3.7
+        import pkg_resources  # noqa: import-outside-toplevel
+        return list(pkg_resources.iter_entry_points(group))
+
+    entries = entry_points()
+    if hasattr(entries, 'select'):
+        return list(entries.select(group=group))
+    return list(entries.get(group, []))  # pragma: no cover
+
+
+def get_tools():
+    """
+    Retrieves the TidyPy tools that are available in the current Python
+    environment.
+
+    The returned mapping has keys that are the tool names and values are the
+    tool classes. Tools are only imported when their classes are retrieved.
+
+    :rtype: tidypy.config.PluginRegistry
+    """
+
+    # pylint: disable=protected-access
+
+    if not hasattr(get_tools, '_CACHE'):
+        get_tools._CACHE = PluginRegistry('tidypy.tools', 'tool')
     return get_tools._CACHE
 
 
+def get_tool_metadata():
+    """
+    Retrieves what needs to be known about the TidyPy tools that are available
+    in the current Python environment before they're executed.
+
+    The returned dict has keys that are the tool names, and values that are
+    dicts containing the tool's default ``config``, whether or not it
+    ``can_be_sharded``, and its ``version`` (see ``tidypy.Tool``). Whether or
+    not a tool can be used depends on the conditions at the time it's executed,
+    so that isn't included.
+
+    This is recorded in TidyPy's cache when a tool is first imported, so
+    later invocations don't need to import the tools they don't execute. What
+    was recorded about a tool is forgotten when its module changes, or when
+    any distribution in the environment is installed, removed, or upgraded.
+
+    :rtype: dict
+    """
+
+    # pylint: disable=protected-access
+
+    if not hasattr(get_tool_metadata, '_CACHE'):
+        get_tool_metadata._CACHE = _load_tool_metadata()
+    return get_tool_metadata._CACHE
+
+
+def _get_environment_fingerprint():
+    # The names of the metadata directories of the installed distributions
+    # include their versions, and their timestamps change when an editable
+    # installation is redone.
+    installed = []
+    for path in sys.path:
+        try:
+            with os.scandir(path or '.') as entries:
+                installed.extend(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in entries
+                    if entry.name.endswith(DISTRIBUTION_SUFFIXES)
+                )
+        except EnvironmentError:
+            pass
+    return [sys.version, sorted(installed)]
+
+
+def _get_tool_fingerprint(environment, entry_point):
+    try:
+        spec = find_spec(entry_point.value.split(':')[0])
+        stamp = os.stat(spec.origin).st_mtime_ns
+    except Exception:  # noqa: broad-except
+        stamp = None
+    return sha256(json.dumps(
+        [environment, entry_point.value, stamp],
+    ).encode('utf-8')).hexdigest()
+
+
+def _read_tool_metadata(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as metadata_file:
+            cached = json.load(metadata_file)
+    except Exception:  # noqa: broad-except
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+def _write_tool_metadata(path, metadata):
+    try:
+        data = json.dumps(metadata)
+        temp_path = '%s.%s' % (path, os.getpid())
+        with open(temp_path, 'w', encoding='utf-8') as metadata_file:
+            metadata_file.write(data)
+        os.replace(temp_path, path)
+    except (EnvironmentError, TypeError, ValueError):
+        # The tools will just be imported again next time.
+        pass
+
+
+def _load_tool_metadata():
+    path = os.path.join(get_cache_path(), TOOL_METADATA_FILENAME)
+    cached = _read_tool_metadata(path)
+
+    tools = get_tools()
+    environment = _get_environment_fingerprint()
+    metadata = {}
+    for name in tools:
+        fingerprint = _get_tool_fingerprint(
+            environment,
+            tools.get_entry_point(name),
+        )
+        if isinstance(cached.get(name), dict) \
+                and cached[name].get('fingerprint') == fingerprint:
+            metadata[name] = cached[name]
+            continue
+
+        try:
+            cls = tools[name]
+        except KeyError:  # pragma: no cover
+            continue
+        metadata[name] = {
+            'fingerprint': fingerprint,
+            'config': cls.get_default_config(),
+            'can_be_sharded': cls.can_be_sharded(),
+            'version': cls.get_version(),
+        }
+
+    if metadata != cached:
+        _write_tool_metadata(path, metadata)
+
+    return metadata
+
+
 def get_reports():
     """
     Retrieves the TidyPy issue reports that are available in the current Python
     environment.
 
-    The returned dictionary has keys are the report names and values are the
-    report classes.
+    The returned mapping has keys are the report names and values are the
+    report classes. Reports are only imported when their classes are
+    retrieved.
 
-    :rtype: dict
+    :rtype: tidypy.config.PluginRegistry
     """
 
     # pylint: disable=protected-access
 
     if not hasattr(get_reports, '_CACHE'):
-        get_reports._CACHE = {}
-        for entry in pkg_resources.iter_entry_points('tidypy.reports'):
-            try:
-                get_reports._CACHE[entry.name] = entry.load()
-            except ImportError as exc:  # pragma: no cover
-                output_error(
-                    'Could not load report "%s" defined by "%s": %s' % (
-                        entry,
-                        entry.dist,
-                        exc,
-                    ),
-                )
+        get_reports._CACHE = PluginRegistry('tidypy.reports', 'report')
     return get_reports._CACHE
 
 
@@ -76,27 +281,17 @@ def get_extenders():
     Retrieves the TidyPy configuration extenders that are available in the
     current Python environment.
 
-    The returned dictionary has keys are the extender names and values are the
-    extender classes.
+    The returned mapping has keys are the extender names and values are the
+    extender classes. Extenders are only imported when their classes are
+    retrieved.
 
-    :rtype: dict
+    :rtype: tidypy.config.PluginRegistry
     """
 
     # pylint: disable=protected-access
 
     if not hasattr(get_extenders, '_CACHE'):
-        get_extenders._CACHE = {}
-        for entry in pkg_resources.iter_entry_points('tidypy.extenders'):
-            try:
-                get_extenders._CACHE[entry.name] = entry.load()
-            except ImportError as exc:  # pragma: no cover
-                output_error(
-                    'Could not load extender "%s" defined by "%s": %s' % (
-                        entry,
-                        entry.dist,
-                        exc,
-                    ),
-                )
+        get_extenders._CACHE = PluginRegistry('tidypy.extenders', 'extender')
     return get_extenders._CACHE
 
 
@@ -123,14 +318,21 @@ def purge_config_cache(location=None):
     """
     Clears out the cache of TidyPy configurations that were retrieved from
     outside the normal locations.
+
+    The other caches kept in TidyPy's cache directory (e.g., of the issues
+    found in previous executions) are left alone.
     """
 
     cache_path = get_cache_path(location)
 
     if location:
         os.remove(cache_path)
-    else:
-        shutil.rmtree(cache_path)
+        return
+
+    with os.scandir(cache_path) as entries:
+        for entry in entries:
+            if entry.is_file() and CONFIG_CACHE_NAME.match(entry.name):
+                os.remove(entry.path)
 
 
 def get_config_cache(location):
@@ -205,19 +407,22 @@ def get_default_config():
 
     config = {}
 
-    for name, cls in get_tools().items():
-        config[name] = cls.get_default_config()
+    for name, metadata in get_tool_metadata().items():
+        config[name] = deepcopy(metadata['config'])
 
-    try:
-        workers = multiprocessing.cpu_count() - 1
-    except NotImplementedError:  # pragma: no cover
-        workers = 1
-    workers = max(1, min(4, workers))
+    # Leave a CPU for the main process, which collects what the workers find.
+    workers = max(1, get_available_cpus() - 1)
 
     config.update({
         'exclude': [],
+        'finder-snapshot': False,
         'merge-issues': True,
         'workers': workers,
+        'sharding': False,
+        'shard-size': 50,
+        'result-cache': True,
+        'result-cache-size': 100,
+        'changed-project-tools': 'skip',
         'disabled': [],
         'noqa': True,
         'extends': [],
@@ -331,3 +536,25 @@ def get_project_config(project_path, use_cache=True):
         or get_user_config(project_path, use_cache=use_cache) \
         or get_default_config()
 
+
+def override_config(config, overrides=None, tools=None):
+    """
+    Applies settings that were specified outside of the configuration files
+    (e.g., on the command line) to a TidyPy configuration.
+
+    :param config: the configuration to modify
+    :type config: dict
+    :param overrides: the top-level options to replace in the configuration
+    :type overrides: dict
+    :param tools:
+        the names of the only tools to execute. If not specified, the tools
+        enabled by the configuration are left as-is.
+    :type tools: list(str)
+    :rtype: dict
+    """
+
+    config.update(overrides or {})
+    if tools:
+        for tool in get_tools():
+            config[tool]['use'] = tool in tools
+    return config
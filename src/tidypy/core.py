@@ -1,87 +1,675 @@
 
+import pickle  # noqa: B403
 import sys
 
-from multiprocessing import Process
-from multiprocessing.managers import SyncManager
+from collections import Counter
+from multiprocessing import Process, Queue
 
 from queue import Empty
 
-from .collector import Collector
-from .config import get_tools, get_reports
+from .cache import open_result_cache, load_tool_durations, \
+    store_tool_durations
+from .collector import Collector, get_noqa_table
+from .config import get_tools, get_tool_metadata, get_reports
 from .finder import Finder
+from .profiling import ToolProfiler, merge_profiles
 from .progress import QuietProgress
 from .tools import ToolIssue
 from .util import SysOutCapture
 
 
+# The maximum number of issues a worker sends to the parent process at once.
+ISSUE_BATCH_SIZE = 250
+
+
 class Worker(Process):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._environment = None
+        self._noqa_sent = set()
+
     def notify(self, notification):
         self._args[1].put(notification)
 
-    def start_tool(self):
-        try:
-            tool = self._args[0].get_nowait()
-        except Empty:
-            return None
+    def get_unit(self):
+        return self._args[0].get()
 
+    def start_tool(self, unit, tool):
         self.notify({
             'type': 'start',
+            'generation': unit['generation'],
             'tool': tool['name'],
         })
 
-        return tool
+    def get_noqa(self, issues):
+        # This process has usually just read the files, so it extracts their
+        # "noqa" directives rather than having the parent process read them
+        # again. Each table is only sent once per execution.
+        tables = {}
+        if self._environment['noqa']:
+            for issue in issues:
+                filename = issue.filename
+                if filename not in self._noqa_sent \
+                        and isinstance(filename, str):
+                    self._noqa_sent.add(filename)
+                    tables[filename] = get_noqa_table(filename)
+        return tables
 
-    def complete_tool(self, tool, issues):
+    def send_issues(self, unit, tool, issues):
         self.notify({
-            'type': 'complete',
+            'type': 'issues',
+            'generation': unit['generation'],
+            'id': unit['id'],
             'tool': tool['name'],
             'issues': issues,
+            'noqa': self.get_noqa(issues),
+        })
+
+    def complete_tool(self, unit, tool, profile):
+        self.notify({
+            'type': 'complete',
+            'generation': unit['generation'],
+            'id': unit['id'],
+            'tool': tool['name'],
+            'profile': profile,
         })
 
+    def execute_tool(self, unit, tool, finder):
+        issues = []
+        profiler = ToolProfiler(finder)
+        try:
+            with SysOutCapture() as capture:
+                impl = get_tools()[tool['name']](tool['config'])
+                profiler.per_file = impl.can_be_profiled_per_file()
+                for issue in impl.execute(profiler.finder):
+                    issues.append(issue)
+                    if len(issues) >= ISSUE_BATCH_SIZE:
+                        self.send_issues(unit, tool, issues)
+                        issues = []
+
+                out = capture.get_stdout()
+                if out:  # pragma: no cover
+                    issues.append(ToolIssue(
+                        '%s: Extraneous output to stdout' % (
+                            tool['name'],
+                        ),
+                        finder.project_path,
+                        details=out,
+                    ))
+                err = capture.get_stderr()
+                if err:  # pragma: no cover
+                    issues.append(ToolIssue(
+                        '%s: Extraneous output to stderr' % (
+                            tool['name'],
+                        ),
+                        finder.project_path,
+                        details=err,
+                    ))
+        except Exception:  # pragma: no cover  # noqa: broad-except
+            issues.append(ToolIssue(
+                '%s: Unexpected exception' % (tool['name'],),
+                finder.project_path,
+                details=sys.exc_info(),
+                failure=True,
+            ))
+
+        if issues:
+            self.send_issues(unit, tool, issues)
+
+        return profiler.finish()
+
+    def get_environment(self, generation, environment):
+        # Skip past the environments of any executions this worker didn't
+        # participate in.
+        while environment is None or environment['generation'] < generation:
+            # The parent process pickles each environment once for all the
+            # workers (rather than each queue pickling it again), so this is
+            # data that TidyPy itself produced.
+            environment = pickle.loads(  # noqa: B301,DUO103
+                self._args[2].get(),
+            )
+        return environment
+
     def run(self):
-        finder = self._args[2]['finder']
+        environment = self._args[3]
 
         while True:
-            tool = self.start_tool()
-            if not tool:
+            unit = self.get_unit()
+            if not unit:
                 break
 
-            issues = []
-            try:
-                with SysOutCapture() as capture:
-                    impl = get_tools()[tool['name']](tool['config'])
-                    issues = impl.execute(finder)
-
-                    out = capture.get_stdout()
-                    if out:  # pragma: no cover
-                        issues.append(ToolIssue(
-                            '%s: Extraneous output to stdout' % (
-                                tool['name'],
-                            ),
-                            finder.project_path,
-                            details=out,
-                        ))
-                    err = capture.get_stderr()
-                    if err:  # pragma: no cover
-                        issues.append(ToolIssue(
-                            '%s: Extraneous output to stderr' % (
-                                tool['name'],
-                            ),
-                            finder.project_path,
-                            details=err,
-                        ))
-            except Exception:  # pragma: no cover  # noqa: broad-except
-                issues = [ToolIssue(
-                    '%s: Unexpected exception' % (tool['name'],),
-                    finder.project_path,
-                    details=sys.exc_info(),
-                    failure=True,
-                )]
-
-            self.complete_tool(tool, issues)
-
-
-def execute_tools(config, path, progress=None):
+            environment = self.get_environment(unit['generation'], environment)
+            if environment['generation'] != unit['generation']:
+                # Left behind by an execution that was abandoned.
+                continue
+            if environment is not self._environment:
+                self._environment = environment
+                self._noqa_sent = set()
+
+            if unit['whole_project']:
+                finder = environment['project_finder']
+            else:
+                finder = environment['finder']
+            if unit['files'] is not None:
+                finder = finder.subset(unit['files'])
+
+            # All the tools in a unit analyze the same files, so executing
+            # them back-to-back lets them share this process's file and AST
+            # caches.
+            for tool in unit['tools']:
+                self.start_tool(unit, tool)
+                profile = self.execute_tool(unit, tool, finder)
+                self.complete_tool(unit, tool, profile)
+
+
+class WorkerPool:
+    """
+    A set of processes that execute the TidyPy tools.
+
+    A pool can be reused by several executions of the tool suite, which avoids
+    the cost of starting the processes each time, and lets the processes
+    reuse the files and ASTs they cached during the previous executions.
+    """
+
+    def __init__(self, num_workers, environment=None):
+        """
+        :param num_workers: the number of processes to start
+        :type num_workers: int
+        :param environment:
+            the objects the workers need for the first execution of the tool
+            suite (see ``begin()``). Specifying them here lets the workers
+            inherit them when they are started, rather than receiving a copy
+            of them later.
+        :type environment: dict
+        """
+
+        self._units = Queue()
+        self._notifications = Queue()
+        self._generation = 0
+        self._inherited = environment is not None
+
+        if self._inherited:
+            self._generation = 1
+            environment = dict(environment)
+            environment['generation'] = self._generation
+
+        self._workers = []
+        for _ in range(num_workers):
+            environments = Queue()
+            worker = Worker(
+                args=(
+                    self._units,
+                    self._notifications,
+                    environments,
+                    environment,
+                ),
+            )
+            worker.start()
+            self._workers.append((worker, environments))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def begin(self, environment):
+        """
+        Prepares the pool for a new execution of the tool suite.
+
+        Returns the generation number that identifies the execution; it must
+        be included in the units of work submitted for it, and is included in
+        the notifications the workers produce about them.
+
+        :param environment:
+            the objects the workers need to execute the tools (e.g., the
+            Finders)
+        :type environment: dict
+        :rtype: int
+        """
+
+        if self._inherited:
+            # The workers already have this environment.
+            self._inherited = False
+            return self._generation
+
+        self._generation += 1
+
+        # Discard anything left behind by an execution that was abandoned.
+        for queue in (self._units, self._notifications):
+            while True:
+                try:
+                    queue.get_nowait()
+                except Empty:
+                    break
+
+        environment = dict(environment)
+        environment['generation'] = self._generation
+        data = pickle.dumps(environment, pickle.HIGHEST_PROTOCOL)
+        for _, environments in self._workers:
+            environments.put(data)
+
+        return self._generation
+
+    def submit(self, unit):
+        """
+        Queues a unit of work for execution by the workers.
+
+        :param unit: the unit of work
+        :type unit: dict
+        """
+
+        self._units.put(unit)
+
+    def get_notification(self, timeout):
+        """
+        Retrieves the next notification produced by the workers. Raises
+        ``queue.Empty`` if none were produced within the timeout.
+
+        :param timeout: the number of seconds to wait
+        :type timeout: float
+        :rtype: dict
+        """
+
+        return self._notifications.get(True, timeout)
+
+    def close(self):
+        """
+        Stops the workers in the pool.
+        """
+
+        for _ in self._workers:
+            self._units.put(None)
+
+        # Workers can't exit until everything they've sent has been received.
+        for worker, _ in self._workers:
+            worker.join(0.1)
+            while worker.is_alive():
+                try:
+                    while True:
+                        self._notifications.get_nowait()
+                except Empty:
+                    pass
+                worker.join(0.1)
+        self._workers = []
+
+
+def get_shards(config, files):
+    """
+    Divides the files a tool will analyze into the batches that will be
+    distributed to the workers.
+
+    Each batch is a list of file paths, or ``None`` if the tool must analyze
+    the entire project in one execution.
+
+    :param config: the TidyPy configuration to use
+    :type config: dict
+    :param files:
+        the files the tool will analyze, or ``None`` if the tool must analyze
+        the entire project
+    :type files: list(str)
+    :rtype: list
+    """
+
+    if files is None:
+        return [None]
+
+    if not config['sharding']:
+        return [files]
+
+    size = config['shard-size']
+    return [
+        files[idx:idx + size]
+        for idx in range(0, len(files), size)
+    ]
+
+
+def estimate_cost(durations, unit):
+    """
+    Estimates how long it will take to execute a unit of work, based on how
+    long its tools took in previous executions. Returns ``None`` if any of the
+    tools have no history.
+
+    :param durations:
+        the durations of the tools in previous executions (see
+        ``tidypy.cache.load_tool_durations()``)
+    :type durations: dict
+    :param unit: the unit of work
+    :type unit: dict
+    :rtype: float
+    """
+
+    cost = 0
+    for tool in unit['tools']:
+        duration = durations.get(tool['name'])
+        if not isinstance(duration, dict):
+            return None
+        if unit['files'] is None or not duration.get('files'):
+            cost += duration['time']
+        else:
+            cost += duration['time'] * len(unit['files']) / duration['files']
+    return cost
+
+
+def order_units(units, durations):
+    """
+    Produces the order to submit units of work to the workers in, so that the
+    longest units start first and don't extend the execution at the end.
+
+    Units whose cost can't be estimated are treated as the longest, and units
+    with the same estimate keep their original order.
+
+    :param units: the units of work
+    :type units: list(dict)
+    :param durations:
+        the durations of the tools in previous executions (see
+        ``tidypy.cache.load_tool_durations()``)
+    :type durations: dict
+    :rtype: list(dict)
+    """
+
+    costs = {}
+    for unit in units:
+        cost = estimate_cost(durations, unit)
+        costs[unit['id']] = float('inf') if cost is None else cost
+    return sorted(units, key=lambda unit: -costs[unit['id']])
+
+
+def replay_cached_results(cache, name, files, config, collector):
+    """
+    Adds the issues stored in the result cache for the specified files to the
+    Collector.
+
+    Returns a tuple containing the list of files that still need to be
+    analyzed, and a dict that maps the files to the keys their results should
+    be stored under.
+
+    :param cache: the result cache to use
+    :type cache: tidypy.cache.ResultCache
+    :param name: the name of the tool
+    :type name: str
+    :param files: the files the tool will analyze
+    :type files: list(str)
+    :param config: the TidyPy configuration to use
+    :type config: dict
+    :param collector: the Collector to add the issues to
+    :type collector: tidypy.Collector
+    :rtype: tuple
+    """
+
+    signature = cache.get_signature(
+        name,
+        get_tool_metadata()[name]['version'],
+        config[name],
+    )
+    if not signature:
+        return files, {}
+
+    keys = {}
+    for filepath in files:
+        key = cache.get_key(signature, filepath)
+        if key:
+            keys[filepath] = key
+
+    hits = cache.get(keys.values())
+    for key in keys.values():
+        if key in hits:
+            collector.add_issues(hits[key])
+
+    return [
+        filepath
+        for filepath in files
+        if keys.get(filepath) not in hits
+    ], keys
+
+
+def _get_unit(execution, shard, whole_project):
+    # When sharding, the batches of different tools that cover the same files
+    # are executed together, so that each file is only read and parsed by one
+    # worker.
+    shared = execution['config']['sharding'] and shard
+    if shared and tuple(shard) in execution['shared_units']:
+        return execution['shared_units'][tuple(shard)]
+
+    unit = {
+        'id': len(execution['units']),
+        'files': shard,
+        'whole_project': whole_project,
+        'tools': [],
+        'keys': {},
+        'issues': {},
+    }
+    execution['units'].append(unit)
+    if shared:
+        execution['shared_units'][tuple(shard)] = unit
+    return unit
+
+
+def _plan_tool(execution, name, metadata):
+    # Returns the files the tool must analyze (None meaning everything), along
+    # with the result cache keys of those files, or an empty list if there is
+    # nothing left for the tool to do.
+    config = execution['config']
+
+    if execution['paths'] is not None and not metadata['can_be_sharded']:
+        if config['changed-project-tools'] != 'filter':
+            return [], {}
+        if not execution['project_finder']:
+            execution['project_finder'] = Finder(execution['path'], config)
+        return None, {}
+
+    if not metadata['can_be_sharded'] \
+            or not (config['sharding'] or execution['cache']):
+        return None, {}
+
+    files = list(execution['finder'].files(config[name]['filters'])) \
+        or None
+    if not execution['cache'] or not files:
+        return files, {}
+
+    return replay_cached_results(
+        execution['cache'],
+        name,
+        files,
+        config,
+        execution['collector'],
+    )
+
+
+def _plan_units(execution):
+    config = execution['config']
+    for name, metadata in get_tool_metadata().items():
+        if not config[name]['use'] or not get_tools()[name].can_be_used():
+            continue
+        if not execution['finder']:
+            execution['finder'] = Finder(
+                execution['path'],
+                config,
+                paths=execution['paths'],
+            )
+
+        files, keys = _plan_tool(execution, name, metadata)
+        if files == []:
+            execution['progress'].on_tool_start(name)
+            execution['progress'].on_tool_finish(name)
+            continue
+
+        whole_project = execution['paths'] is not None \
+            and not metadata['can_be_sharded']
+        shards = get_shards(config, files)
+        execution['pending'][name] = len(shards)
+        for shard in shards:
+            unit = _get_unit(execution, shard, whole_project)
+            unit['tools'].append({
+                'name': name,
+                'config': config[name],
+            })
+            unit['keys'][name] = {
+                filepath: keys[filepath]
+                for filepath in shard or []
+                if filepath in keys
+            }
+            unit['issues'][name] = []
+
+
+def _restore_cached_noqa(execution):
+    # Restore the noqa tables of the files whose issues were cached, so that
+    # those files don't need to be read again.
+    collector = execution['collector']
+    collector.add_noqa(execution['cache'].load_noqa({
+        issue.filename
+        for issue in collector.get_issues(
+            sortby=Collector.NO_SORT,
+            include_unclean=True,
+        )
+    }))
+
+
+def _track_files(execution, on_files_complete):
+    # Track which files are still waiting on tools, so that they can be
+    # reported as soon as they're complete.
+    for unit in execution['units']:
+        if unit['files'] is None:
+            execution['blocking'] += len(unit['tools'])
+        else:
+            for filepath in unit['files']:
+                execution['waiting'][filepath] += len(unit['tools'])
+
+    if on_files_complete:
+        execution['ready'] = [
+            filepath
+            for filepath in execution['finder'].files()
+            if not execution['waiting'][filepath]
+        ]
+
+
+def _handle_issues(execution, notification):
+    unit = execution['units'][notification['id']]
+    name = notification['tool']
+    issues = notification['issues']
+    if unit['whole_project']:
+        issues = [
+            issue
+            for issue in issues
+            if issue.filename in execution['analyzed']
+            or isinstance(issue, ToolIssue)  # noqa: W503
+        ]
+
+    execution['collector'].add_noqa(notification['noqa'])
+    execution['noqa'].update(notification['noqa'])
+    execution['collector'].add_issues(issues)
+    if execution['cache'] and unit['keys'][name]:
+        unit['issues'][name].extend(issues)
+
+
+def _handle_complete(execution, notification):
+    unit = execution['units'][notification['id']]
+    name = notification['tool']
+    if execution['cache'] and unit['keys'][name]:
+        execution['cache'].store_results(
+            unit['keys'][name],
+            unit['issues'][name],
+        )
+        unit['issues'][name] = []
+
+    if unit['files'] is None:
+        execution['blocking'] -= 1
+    else:
+        for filepath in unit['files']:
+            execution['waiting'][filepath] -= 1
+            if not execution['waiting'][filepath]:
+                execution['ready'].append(filepath)
+
+    profiles = execution['profiles']
+    profiles[name] = merge_profiles(
+        profiles.get(name),
+        notification['profile'],
+    )
+
+    execution['pending'][name] -= 1
+    if not execution['pending'][name]:
+        execution['progress'].on_tool_profile(name, profiles[name])
+        execution['progress'].on_tool_finish(name)
+
+
+def _handle_notification(execution, notification):
+    name = notification['tool']
+    if notification['type'] == 'start':
+        if name not in execution['started']:
+            execution['started'].add(name)
+            execution['progress'].on_tool_start(name)
+    elif notification['type'] == 'issues':
+        _handle_issues(execution, notification)
+    elif notification['type'] == 'complete':
+        _handle_complete(execution, notification)
+
+
+def _get_environment(execution):
+    return {
+        'finder': execution['finder'],
+        'project_finder': execution['project_finder'],
+        'noqa': execution['config']['noqa'],
+    }
+
+
+def _run_units(execution, pool, on_files_complete):
+    generation = pool.begin(_get_environment(execution))
+    durations = load_tool_durations(execution['finder'].project_path)
+    for unit in order_units(execution['units'], durations):
+        pool.submit({
+            'generation': generation,
+            'id': unit['id'],
+            'files': unit['files'],
+            'whole_project': unit['whole_project'],
+            'tools': unit['tools'],
+        })
+
+    while any(execution['pending'].values()):
+        if on_files_complete \
+                and execution['ready'] \
+                and not execution['blocking']:
+            on_files_complete(execution['collector'], execution['ready'])
+            execution['ready'] = []
+
+        try:
+            notification = pool.get_notification(0.25)
+        except Empty:
+            continue
+        if notification['generation'] == generation:
+            _handle_notification(execution, notification)
+
+    if on_files_complete and execution['ready']:
+        on_files_complete(execution['collector'], execution['ready'])
+
+
+def _finish_execution(execution):
+    if execution['pending']:
+        store_tool_durations(
+            execution['finder'].project_path,
+            execution['profiles'],
+        )
+
+    cache = execution['cache']
+    if cache:
+        if execution['pending']:
+            cache.store_noqa(execution['noqa'])
+            cache.prune(
+                execution['config']['result-cache-size'] * 1024 * 1024,
+            )
+        cache.close()
+
+    execution['progress'].on_finish()
+
+
+def execute_tools(
+        config,
+        path,
+        progress=None,
+        paths=None,
+        *,
+        pool=None,
+        on_files_complete=None,
+        baseline=None):
     """
     Executes the suite of TidyPy tools upon the project and returns the
     issues that are found.
@@ -95,61 +683,112 @@ def execute_tools(config, path, progress=None):
         execution of the tool suite. If not specified, not progress
         notifications will occur.
     :type progress: tidypy.Progress
+    :param paths:
+        the paths to the only files in the project that should be analyzed
+        (e.g., the files that were changed), relative to the project. Tools
+        that analyze the project as a whole are skipped, or, if the
+        ``changed-project-tools`` option is ``filter``, only have the issues
+        they find in these files reported. If not specified, the entire
+        project is analyzed.
+    :type paths: list(str)
+    :param pool:
+        the WorkerPool to execute the tools with. If not specified, a pool of
+        the configured number of workers is started for this execution.
+    :type pool: tidypy.core.WorkerPool
+    :param on_files_complete:
+        a function that is called with the Collector and a list of files once
+        every tool has finished analyzing those files, so that their issues
+        can be reported before the execution of the tool suite completes.
+    :type on_files_complete: func
+    :param baseline:
+        the baseline of known issues to leave out of the issues that are
+        reported
+    :type baseline: tidypy.baseline.Baseline
     :rtype: tidypy.Collector
     """
 
-    progress = progress or QuietProgress()
-    progress.on_start()
-
-    with SyncManager() as manager:
-        num_tools = 0
-        tools = manager.Queue()
-        for name, cls in get_tools().items():
-            if config[name]['use'] and cls.can_be_used():
-                num_tools += 1
-                tools.put({
-                    'name': name,
-                    'config': config[name],
-                })
-
-        collector = Collector(config)
-        if not num_tools:
-            progress.on_finish()
-            return collector
-
-        notifications = manager.Queue()
-        environment = manager.dict({
-            'finder': Finder(path, config),
-        })
+    execution = {
+        'config': config,
+        'path': path,
+        'paths': paths,
+        'progress': progress or QuietProgress(),
+        'collector': Collector(config),
+        'cache': None,
+        'finder': None,
+        'project_finder': None,
+        'units': [],
+        'shared_units': {},
+        'pending': {},
+        'started': set(),
+        'analyzed': set(),
+        'waiting': Counter(),
+        'blocking': 0,
+        'ready': [],
+        'profiles': {},
+        'noqa': {},
+    }
+    execution['progress'].on_start()
+    execution['collector'].set_baseline(baseline)
+    if config['result-cache']:
+        execution['cache'] = open_result_cache()
 
-        workers = []
-        for _ in range(config['workers']):
-            worker = Worker(
-                args=(
-                    tools,
-                    notifications,
-                    environment,
-                ),
+    _plan_units(execution)
+    if execution['cache'] and config['noqa']:
+        _restore_cached_noqa(execution)
+
+    if execution['pending']:
+        if execution['project_finder']:
+            execution['analyzed'] = set(execution['finder'].files())
+        _track_files(execution, on_files_complete)
+
+        own_pool = pool is None
+        if own_pool:
+            pool = WorkerPool(
+                config['workers'],
+                environment=_get_environment(execution),
             )
-            worker.start()
-            workers.append(worker)
+        try:
+            _run_units(execution, pool, on_files_complete)
+        finally:
+            if own_pool:
+                pool.close()
 
-        while num_tools:
-            try:
-                notification = notifications.get(True, 0.25)
-            except Empty:
-                pass
-            else:
-                if notification['type'] == 'start':
-                    progress.on_tool_start(notification['tool'])
-                elif notification['type'] == 'complete':
-                    collector.add_issues(notification['issues'])
-                    progress.on_tool_finish(notification['tool'])
-                    num_tools -= 1
+    _finish_execution(execution)
+
+    return execution['collector']
 
-    progress.on_finish()
 
-    return collector
+def create_reports(config, path, output_file=None):
+    """
+    Creates the configured suite of issue reports.
+
+    Returns a list of tuples containing the report's request and the report
+    itself.
+
+    :param config: the TidyPy configuration to use
+    :type config: dict
+    :param path: that path to the project that is analyzed
+    :type path: str
+    :rtype: list(tuple)
+    """
+
+    reporters = []
+
+    reports = get_reports()
+    for report in config.get('requested_reports', []):
+        if report.get('type') and report['type'] in reports:
+            cfg = config.get('report', {}).get(report['type'], {})
+            cfg.update(report)
+            reporters.append((
+                report,
+                reports[report['type']](
+                    cfg,
+                    path,
+                    output_file=output_file,
+                ),
+            ))
+
+    return reporters
 
 
 def execute_reports(
@@ -157,7 +796,8 @@ def execute_reports(
         path,
         collector,
         on_report_finish=None,
-        output_file=None):
+        output_file=None,
+        reporters=None):
     """
     Executes the configured suite of issue reports.
 
@@ -167,19 +807,16 @@ def execute_reports(
     :type path: str
     :param collector: the issues to report
     :type collector: tidypy.Collector
+    :param reporters:
+        the reports to execute, as produced by ``create_reports()``. If not
+        specified, the reports are created from the configuration.
+    :type reporters: list(tuple)
     """
 
-    reports = get_reports()
-    for report in config.get('requested_reports', []):
-        if report.get('type') and report['type'] in reports:
-            cfg = config.get('report', {}).get(report['type'], {})
-            cfg.update(report)
-            reporter = reports[report['type']](
-                cfg,
-                path,
-                output_file=output_file,
-            )
-            reporter.produce(collector)
-            if on_report_finish:
-                on_report_finish(report)
+    if reporters is None:
+        reporters = create_reports(config, path, output_file=output_file)
 
+    for report, reporter in reporters:
+        reporter.produce(collector)
+        if on_report_finish:
+            on_report_finish(report)
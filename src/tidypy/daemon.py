@@ -0,0 +1,498 @@
+
+import os
+import pickle  # noqa: B403
+import socket
+import struct
+
+from .collector import Collector
+from .config import (
+    get_tools,
+    get_default_config,
+    get_specific_config,
+    get_project_config,
+    get_cache_path,
+    override_config,
+)
+from .core import WorkerPool, execute_tools
+from .progress import Progress, QuietProgress
+
+
+DAEMON_SOCKET_FILENAME = 'daemon.sock'
+
+HEADER = struct.Struct('>I')
+
+# The process, user, and group IDs reported by SO_PEERCRED.
+PEER_CREDENTIALS = struct.Struct('3i')
+
+
+class DaemonError(Exception):
+    """
+    An exception indicating that a request to the TidyPy daemon could not be
+    completed.
+    """
+
+
+def get_daemon_socket_path():
+    return os.path.join(get_cache_path(), DAEMON_SOCKET_FILENAME)
+
+
+def is_daemon_supported():
+    """
+    Indicates whether or not the TidyPy daemon can be used on this platform.
+
+    :rtype: bool
+    """
+
+    return hasattr(socket, 'AF_UNIX')
+
+
+def get_peer_uid(connection):
+    """
+    Retrieves the ID of the user that owns the process at the other end of a
+    Unix socket. Returns ``None`` if the platform doesn't report it.
+
+    :param connection: the connected socket
+    :type connection: socket.socket
+    :rtype: int
+    """
+
+    if not hasattr(socket, 'SO_PEERCRED'):  # pragma: no cover
+        return None
+    credentials = connection.getsockopt(
+        socket.SOL_SOCKET,
+        socket.SO_PEERCRED,
+        PEER_CREDENTIALS.size,
+    )
+    return PEER_CREDENTIALS.unpack(credentials)[1]
+
+
+def is_trusted_peer(connection):
+    """
+    Indicates whether or not the process at the other end of a Unix socket
+    belongs to the current user, and can therefore be exchanged messages with.
+
+    Where the platform can't identify the peer, the permissions of the
+    daemon's socket are what keep other users out.
+
+    :param connection: the connected socket
+    :type connection: socket.socket
+    :rtype: bool
+    """
+
+    uid = get_peer_uid(connection)
+    return uid is None or uid == os.getuid()
+
+
+def send_message(connection, message):
+    data = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    connection.sendall(HEADER.pack(len(data)) + data)
+
+
+def _receive_exactly(connection, size):
+    chunks = []
+    while size:
+        chunk = connection.recv(min(size, 65536))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def receive_message(connection):
+    header = _receive_exactly(connection, HEADER.size)
+    if header is None:
+        return None
+    data = _receive_exactly(connection, HEADER.unpack(header)[0])
+    if data is None:
+        return None
+    # Messages are only received from peers that is_trusted_peer() accepted.
+    return pickle.loads(data)  # noqa: B301,DUO103
+
+
+class DaemonProgress(Progress):
+    """
+    An implementation of ``tidypy.Progress`` that forwards the events to a
+    client of the TidyPy daemon.
+    """
+
+    def __init__(self, connection):
+        super().__init__()
+        self._connection = connection
+
+    def _forward(self, event, *args):
+        send_message(self._connection, {
+            'type': 'progress',
+            'event': event,
+            'args': args,
+        })
+
+    def on_start(self):
+        self._forward('on_start')
+
+    def on_tool_start(self, tool):
+        super().on_tool_start(tool)
+        self._forward('on_tool_start', tool)
+
+    def on_tool_finish(self, tool):
+        super().on_tool_finish(tool)
+        self._forward('on_tool_finish', tool)
+
+    def on_tool_profile(self, tool, profile):
+        super().on_tool_profile(tool, profile)
+        self._forward('on_tool_profile', tool, profile)
+
+    def on_finish(self):
+        self._forward('on_finish')
+
+
+class DaemonServer:
+    """
+    A long-running process that executes the TidyPy tool suite on behalf of
+    clients that connect to it through a Unix socket.
+
+    The daemon keeps the tools loaded and a pool of workers running between
+    requests, so the workers can reuse the files and ASTs they've already
+    cached when a project is analyzed again.
+    """
+
+    def __init__(self, socket_path=None, workers=None):
+        """
+        :param socket_path:
+            the path to the socket to listen on. If not specified, the socket
+            is created in TidyPy's cache directory.
+        :type socket_path: str
+        :param workers:
+            the number of workers to execute the tools with. If not specified,
+            the default number of workers is used.
+        :type workers: int
+        """
+
+        self.socket_path = socket_path or get_daemon_socket_path()
+        self.workers = workers
+        self._pool = None
+        self._stopped = False
+
+    def _claim_socket(self):
+        if os.path.exists(self.socket_path):
+            try:
+                DaemonClient(socket_path=self.socket_path).ping()
+            except DaemonError:
+                # Left behind by a daemon that didn't shut down cleanly.
+                os.remove(self.socket_path)
+            else:
+                raise DaemonError('The TidyPy daemon is already running')
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        # Create the socket so that only the current user can connect to it.
+        umask = os.umask(0o077)
+        try:
+            listener.bind(self.socket_path)
+        except EnvironmentError as exc:
+            listener.close()
+            raise DaemonError(
+                'Could not listen on %s: %s' % (self.socket_path, exc),
+            ) from None
+        finally:
+            os.umask(umask)
+
+        return listener
+
+    def serve_forever(self):
+        """
+        Listens for and handles requests until a client asks the daemon to
+        stop.
+
+        Raises a ``DaemonError`` if another daemon is already listening on the
+        socket.
+        """
+
+        listener = self._claim_socket()
+
+        try:
+            # Import all the tools now, so that the workers inherit them.
+            list(get_tools().items())
+            self._pool = WorkerPool(
+                self.workers or get_default_config()['workers'],
+            )
+
+            listener.listen(5)
+            while not self._stopped:
+                connection, _ = listener.accept()
+                with connection:
+                    if not is_trusted_peer(connection):
+                        continue
+                    try:
+                        self.handle(connection)
+                    except (EnvironmentError, EOFError):
+                        # The client went away; nothing more to do.
+                        pass
+        finally:
+            listener.close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+            if self._pool:
+                self._pool.close()
+
+    def handle(self, connection):
+        request = receive_message(connection)
+        if not request:
+            return
+
+        if request['command'] == 'ping':
+            send_message(connection, {
+                'type': 'pong',
+                'pid': os.getpid(),
+            })
+
+        elif request['command'] == 'stop':
+            self._stopped = True
+            send_message(connection, {
+                'type': 'stopped',
+            })
+
+        elif request['command'] == 'check':
+            self.check(connection, request)
+
+        else:
+            send_message(connection, {
+                'type': 'error',
+                'message': 'Unknown command: %s' % (request['command'],),
+            })
+
+    def check(self, connection, request):
+        path = request['path']
+        try:
+            if request['config_file']:
+                config = get_specific_config(
+                    request['config_file'],
+                    path,
+                    use_cache=request['use_cache'],
+                )
+            else:
+                config = get_project_config(
+                    path,
+                    use_cache=request['use_cache'],
+                )
+            override_config(config, request['overrides'], request['tools'])
+        except Exception as exc:  # pylint: disable=broad-except
+            send_message(connection, {
+                'type': 'error',
+                'message': 'Could not parse config file: %s' % (exc,),
+            })
+            return
+
+        send_message(connection, {
+            'type': 'config',
+            'config': config,
+        })
+
+        streamed = set()
+
+        def on_files_complete(collector, filenames):
+            send_message(connection, {
+                'type': 'files_complete',
+                'filenames': filenames,
+                'issues': collector.get_issues(
+                    sortby=Collector.NO_SORT,
+                    include_unclean=True,
+                    filenames=filenames,
+                ),
+                'noqa': collector.get_noqa(filenames),
+            })
+            streamed.update(filenames)
+
+        try:
+            collector = execute_tools(
+                config,
+                path,
+                progress=DaemonProgress(connection),
+                paths=request['paths'],
+                pool=self._pool,
+                on_files_complete=on_files_complete
+                if request['stream'] else None,
+            )
+        except EnvironmentError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            send_message(connection, {
+                'type': 'error',
+                'message': 'Could not execute the tools: %s' % (exc,),
+            })
+            return
+
+        send_message(connection, {
+            'type': 'issues',
+            'issues': [
+                issue
+                for issue in collector.get_issues(
+                    sortby=Collector.NO_SORT,
+                    include_unclean=True,
+                )
+                if issue.filename not in streamed
+            ],
+            'noqa': {
+                filename: table
+                for filename, table in collector.get_noqa().items()
+                if filename not in streamed
+            },
+        })
+
+
+class DaemonClient:
+    """
+    Submits requests to a running TidyPy daemon.
+    """
+
+    def __init__(self, socket_path=None):
+        """
+        :param socket_path:
+            the path to the socket the daemon listens on. If not specified,
+            the socket in TidyPy's cache directory is used.
+        :type socket_path: str
+        """
+
+        self.socket_path = socket_path or get_daemon_socket_path()
+
+    def _connect(self):
+        if not is_daemon_supported():  # pragma: no cover
+            raise DaemonError('The daemon is not supported on this platform')
+
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            connection.connect(self.socket_path)
+        except EnvironmentError:
+            connection.close()
+            raise DaemonError(
+                'The TidyPy daemon is not running (start it with'
+                ' "tidypy daemon")'
+            ) from None
+
+        if not is_trusted_peer(connection):
+            connection.close()
+            raise DaemonError(
+                'The TidyPy daemon socket %s belongs to another user' % (
+                    self.socket_path,
+                ),
+            )
+        return connection
+
+    def _receive(self, connection):
+        message = receive_message(connection)
+        if message is None:
+            raise DaemonError('The TidyPy daemon closed the connection')
+        if message['type'] == 'error':
+            raise DaemonError(message['message'])
+        return message
+
+    def ping(self):
+        """
+        Checks that the daemon is running.
+
+        :returns: the process ID of the daemon
+        :rtype: int
+        """
+
+        with self._connect() as connection:
+            send_message(connection, {'command': 'ping'})
+            return self._receive(connection)['pid']
+
+    def stop(self):
+        """
+        Asks the daemon to stop once it finishes handling this request.
+        """
+
+        with self._connect() as connection:
+            send_message(connection, {'command': 'stop'})
+            self._receive(connection)
+
+    def check(
+            self,
+            path,
+            *,
+            config_file=None,
+            use_cache=True,
+            overrides=None,
+            tools=None,
+            paths=None,
+            progress_factory=None,
+            on_files_complete=None,
+            baseline=None):
+        """
+        Asks the daemon to execute the tool suite upon a project.
+
+        Returns a tuple containing the configuration the daemon used, and the
+        Collector of the issues that it found.
+
+        :param path: the absolute path to the project to analyze
+        :type path: str
+        :param config_file:
+            the absolute path to the TidyPy configuration file to use. If not
+            specified, the project's configuration is used.
+        :type config_file: str
+        :param use_cache:
+            whether or not to use cached versions of any remote/referenced
+            TidyPy configurations
+        :type use_cache: bool
+        :param overrides:
+            the top-level options to replace in the configuration
+        :type overrides: dict
+        :param tools: the names of the only tools to execute
+        :type tools: list(str)
+        :param paths:
+            the paths to the only files in the project that should be analyzed,
+            relative to the project
+        :type paths: list(str)
+        :param progress_factory:
+            a function that receives the configuration and returns the
+            progress reporter object that will receive the callbacks that occur
+            during the execution of the tool suite
+        :type progress_factory: func
+        :param on_files_complete:
+            a function that is called with the Collector and a list of files
+            once every tool has finished analyzing those files
+        :type on_files_complete: func
+        :param baseline:
+            the baseline of known issues to leave out of the issues that are
+            reported
+        :type baseline: tidypy.baseline.Baseline
+        :rtype: tuple
+        """
+
+        with self._connect() as connection:
+            send_message(connection, {
+                'command': 'check',
+                'path': path,
+                'config_file': config_file,
+                'use_cache': use_cache,
+                'overrides': overrides or {},
+                'tools': list(tools or []),
+                'paths': paths,
+                'stream': on_files_complete is not None,
+            })
+
+            config = self._receive(connection)['config']
+            if progress_factory:
+                progress = progress_factory(config)
+            else:
+                progress = QuietProgress()
+
+            collector = Collector(config)
+            collector.set_baseline(baseline)
+            while True:
+                message = self._receive(connection)
+                if message['type'] == 'progress':
+                    # Progress implementations that predate an event (e.g.,
+                    # on_tool_profile) don't receive it.
+                    handler = getattr(progress, message['event'], None)
+                    if handler:
+                        handler(*message['args'])
+                elif message['type'] == 'files_complete':
+                    collector.add_noqa(message['noqa'])
+                    collector.add_issues(message['issues'])
+                    on_files_complete(collector, message['filenames'])
+                elif message['type'] == 'issues':
+                    collector.add_noqa(message['noqa'])
+                    collector.add_issues(message['issues'])
+                    return config, collector
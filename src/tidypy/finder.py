@@ -1,6 +1,13 @@
 
+import json
+import os
+import time
+
+from copy import copy
+from hashlib import sha256
 from pathlib import Path
 
+from .config import get_cache_path
 from .util import read_file, compile_masks, matches_masks
 
 
@@ -15,6 +22,51 @@ ALWAYS_EXCLUDED_DIRS = compile_masks([
     r'^.+\.egg-info$',
 ])
 
+SNAPSHOT_DIRNAME = 'finder'
+
+# Directories modified this recently (in nanoseconds) before a snapshot is
+# taken are always scanned again, as further changes made within the
+# resolution of the filesystem's timestamps would go unnoticed.
+SNAPSHOT_RACE_WINDOW = 2 * 10 ** 9
+
+
+def get_snapshot_path(base_path, excludes):
+    """
+    Produces the path to the file that stores the snapshot of the specified
+    project's directories.
+
+    :param base_path: the absolute path to the base of the project
+    :type base_path: str
+    :param excludes: the exclusion expressions the snapshot was taken with
+    :type excludes: list(str)
+    :rtype: str
+    """
+
+    key = sha256(json.dumps(
+        [base_path, list(excludes)],
+    ).encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_path(), SNAPSHOT_DIRNAME, key + '.json')
+
+
+def load_snapshot(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except Exception:  # noqa: broad-except
+        return {}
+    return snapshot if isinstance(snapshot, dict) else {}
+
+
+def save_snapshot(path, snapshot):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = '%s.%s' % (path, os.getpid())
+        with open(temp_path, 'w', encoding='utf-8') as snapshot_file:
+            json.dump(snapshot, snapshot_file)
+        os.replace(temp_path, path)
+    except EnvironmentError:
+        pass
+
 
 class Finder:
     """
@@ -22,19 +74,40 @@ class Finder:
     be analyzed.
     """
 
-    def __init__(self, base_path, config):
+    def __init__(self, base_path, config, paths=None):
         """
         :param base_path: the path to the base of the project
         :type base_path: str
         :param config: the configuration to use when searching the project
         :type config: dict
+        :param paths:
+            the paths to the only files in the project that should be
+            considered (e.g., the files that were changed), relative to the
+            base of the project. If not specified, the entire project is
+            searched.
+        :type paths: list(str)
         """
 
         self.base_path = Path(base_path).resolve()
         self.excludes = compile_masks(config['exclude'])
 
         self._found = {}
-        self._find(self.base_path)
+        if paths is None:
+            if config['finder-snapshot']:
+                snapshot_path = get_snapshot_path(
+                    self.project_path,
+                    config['exclude'],
+                )
+                snapshot = load_snapshot(snapshot_path)
+                self._snapshot_time = time.time_ns()
+                self._new_snapshot = {}
+                self._find(self.project_path, snapshot)
+                save_snapshot(snapshot_path, self._new_snapshot)
+                del self._new_snapshot
+            else:
+                self._find(self.project_path)
+        else:
+            self._find_paths(paths)
         self._found = {
             dirname: files
             for dirname, files in self._found.items()
@@ -60,18 +133,91 @@ class Finder:
 
         return str(Path(filepath).relative_to(self.base_path))
 
-    def _find(self, path):
-        for subpath in path.iterdir():
-            if subpath.is_dir():
-                if not self.is_excluded_dir(subpath):
-                    self._found[str(subpath)] = []
-                    self._find(subpath)
-
-            elif subpath.is_file():
-                if not self.is_excluded(subpath):
-                    if str(path) not in self._found:
-                        self._found[str(path)] = []
-                    self._found[str(path)].append(str(subpath))
+    def subset(self, files):
+        """
+        Produces a copy of this Finder that only contains the specified files.
+
+        :param files:
+            the paths to the files to keep; they must have been found by this
+            Finder.
+        :type files: list(str)
+        :rtype: tidypy.Finder
+        """
+
+        files = set(files)
+
+        finder = copy(self)
+        # pylint: disable=protected-access
+        finder._found = {}
+        for dirname, dir_files in self._found.items():
+            dir_files = [
+                file_
+                for file_ in dir_files
+                if file_ in files
+            ]
+            if dir_files:
+                finder._found[dirname] = dir_files
+
+        return finder
+
+    def _scan(self, dirname):
+        dirs = []
+        files = []
+        prefix_len = len(os.path.join(self.project_path, ''))
+
+        with os.scandir(dirname) as entries:
+            for entry in entries:
+                relpath = entry.path[prefix_len:].replace(os.sep, '/')
+                if entry.is_dir():
+                    excluded = matches_masks(relpath, self.excludes) \
+                        or matches_masks(entry.name, ALWAYS_EXCLUDED_DIRS)
+                    if not excluded:
+                        dirs.append(entry.path)
+                elif entry.is_file():
+                    if not matches_masks(relpath, self.excludes):
+                        files.append(entry.path)
+
+        return dirs, files
+
+    def _find(self, dirname, snapshot=None):
+        if snapshot is None:
+            dirs, files = self._scan(dirname)
+        else:
+            mtime = os.stat(dirname).st_mtime_ns
+            cached = snapshot.get(dirname)
+            if cached and cached[0] == mtime:
+                dirs, files = cached[1], cached[2]
+            else:
+                dirs, files = self._scan(dirname)
+            if self._snapshot_time - mtime < SNAPSHOT_RACE_WINDOW:
+                mtime = None
+            self._new_snapshot[dirname] = (mtime, dirs, files)
+
+        self._found[dirname] = list(files)
+        for subdir in dirs:
+            self._find(subdir, snapshot)
+
+    def _find_paths(self, paths):
+        for path in paths:
+            path = self.base_path / path
+            if not path.is_file():
+                continue
+
+            try:
+                relpath = path.relative_to(self.base_path)
+            except ValueError:
+                continue
+
+            excluded = self.is_excluded(path) or any(
+                self.is_excluded_dir(self.base_path / parent)
+                for parent in list(relpath.parents)[:-1]
+            )
+            if excluded:
+                continue
+
+            files = self._found.setdefault(str(path.parent), [])
+            if str(path) not in files:
+                files.append(str(path))
 
     def is_excluded(self, path):
         """
@@ -39,9 +39,72 @@ def git_config(*args):
     return out.strip()
 
 
+def git_files(project_path, *args):
+    with subprocess.Popen(  # noqa: bandit:B603,bandit:B607
+            ['git', '-C', project_path] + list(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE) as proc:
+        out, err = proc.communicate()
+    if proc.returncode != 0:
+        raise Exception(err.decode('utf-8', 'replace').strip())
+
+    return [
+        path
+        for path in out.decode('utf-8').split('\0')
+        if path
+    ]
+
+
+def get_changed_files(project_path, since=None, staged=False):
+    """
+    Retrieves the paths (relative to the project) of the files in the project
+    that Git considers to have been added or modified.
+
+    :param project_path: the path to the project
+    :type project_path: str
+    :param since:
+        the Git revision to compare the working tree against. If not
+        specified, ``HEAD`` is used.
+    :type since: str
+    :param staged:
+        whether or not to only retrieve the changes staged for the next
+        commit. If not specified, defaults to ``False``.
+    :type staged: bool
+    :rtype: list(str)
+    """
+
+    diff = ['diff', '--name-only', '-z', '--relative', '--diff-filter=ACMR']
+    if staged:
+        return git_files(project_path, *(diff + ['--cached']))
+
+    if not since:
+        try:
+            git_files(project_path, 'rev-parse', '--verify', 'HEAD')
+        except Exception:  # pylint: disable=broad-except
+            # Nothing has been committed yet, so everything is staged.
+            diff.append('--cached')
+        else:
+            diff.append('HEAD')
+    else:
+        diff.append(since)
+
+    paths = git_files(project_path, *diff)
+    for path in git_files(
+            project_path,
+            'ls-files', '-z', '--others', '--exclude-standard'):
+        if path not in paths:
+            paths.append(path)
+
+    return paths
+
+
 def hook(project_path, strict):
     cfg = get_project_config(project_path)
-    collector = execute_tools(cfg, project_path)
+    collector = execute_tools(
+        cfg,
+        project_path,
+        paths=get_changed_files(project_path, staged=True),
+    )
 
     report = ConsoleReport(cfg, project_path)
     report.execute(collector)
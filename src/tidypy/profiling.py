@@ -0,0 +1,201 @@
+
+import heapq
+import json
+import sys
+import time
+
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+from .util import get_distribution_version
+
+
+# The number of the slowest files that are kept in a tool's profile.
+PROFILE_SLOWEST_FILES = 20
+
+
+def get_peak_rss():
+    """
+    Retrieves the peak resident set size of the current process, in bytes.
+    Returns ``None`` if it can't be determined on this platform.
+
+    :rtype: int
+    """
+
+    if resource is None:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':  # pragma: no cover
+        return peak
+    return peak * 1024
+
+
+class TimedFinder:
+    """
+    A wrapper around a Finder that records how long a tool spends on each of
+    the files it retrieves from ``files()``.
+
+    The time between the tool receiving one file and asking for the next is
+    attributed to the file it received, so only tools that analyze the files
+    as they iterate over them get meaningful timings.
+    """
+
+    def __init__(self, finder):
+        """
+        :param finder: the Finder to wrap
+        :type finder: tidypy.Finder
+        """
+
+        self._finder = finder
+        self._current = None
+        self._started = None
+        self.timings = {}
+
+    def __getattr__(self, name):
+        return getattr(self._finder, name)
+
+    def __reduce__(self):
+        # Tools that hand the Finder to other processes send the wrapped
+        # Finder itself, since the timings can't follow it.
+        return (_unwrap_finder, (self._finder,))
+
+    def _stop_current(self):
+        if self._current is not None:
+            self.timings[self._current] = self.timings.get(self._current, 0) \
+                + time.perf_counter() - self._started
+            self._current = None
+
+    def files(self, filters=None):
+        try:
+            for filepath in self._finder.files(filters=filters):
+                self._stop_current()
+                self._current = filepath
+                self._started = time.perf_counter()
+                yield filepath
+        finally:
+            self._stop_current()
+
+
+def _unwrap_finder(finder):
+    return finder
+
+
+class ToolProfiler:
+    """
+    Measures the resources used during an execution of a tool.
+    """
+
+    def __init__(self, finder, per_file=True):
+        """
+        :param finder: the Finder the tool will use
+        :type finder: tidypy.Finder
+        :param per_file:
+            whether or not to record the slowest files the tool analyzed (see
+            ``tidypy.Tool.can_be_profiled_per_file()``)
+        :type per_file: bool
+        """
+
+        self.finder = TimedFinder(finder)
+        self.per_file = per_file
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def finish(self):
+        """
+        Produces the profile of the execution of the tool.
+
+        :rtype: dict
+        """
+
+        timings = self.finder.timings
+        slowest = []
+        if self.per_file:
+            slowest = heapq.nlargest(
+                PROFILE_SLOWEST_FILES,
+                timings.items(),
+                key=lambda timing: timing[1],
+            )
+        return {
+            'wall_time': time.perf_counter() - self._wall,
+            'cpu_time': time.process_time() - self._cpu,
+            'worker_peak_rss': get_peak_rss(),
+            'files': len(timings),
+            'slowest_files': slowest,
+        }
+
+
+def merge_profiles(first, second):
+    """
+    Combines the profiles of two executions of a tool (e.g., of two batches of
+    files executed by different workers).
+
+    :param first: the first profile; ``None`` if there isn't one yet
+    :type first: dict
+    :param second: the second profile
+    :type second: dict
+    :rtype: dict
+    """
+
+    if first is None:
+        return dict(second)
+
+    rss = [
+        profile['worker_peak_rss']
+        for profile in (first, second)
+        if profile['worker_peak_rss'] is not None
+    ]
+    return {
+        'wall_time': first['wall_time'] + second['wall_time'],
+        'cpu_time': first['cpu_time'] + second['cpu_time'],
+        'worker_peak_rss': max(rss) if rss else None,
+        'files': first['files'] + second['files'],
+        'slowest_files': heapq.nlargest(
+            PROFILE_SLOWEST_FILES,
+            first['slowest_files'] + second['slowest_files'],
+            key=lambda timing: timing[1],
+        ),
+    }
+
+
+def write_profile(path, base_path, profiles):
+    """
+    Writes the profiles of the tools to a file as a JSON object.
+
+    :param path: the path to the file to write
+    :type path: str
+    :param base_path: the path to the project that was analyzed
+    :type base_path: str
+    :param profiles: the profiles of the tools, keyed by their names
+    :type profiles: dict
+    """
+
+    base_path = Path(base_path).resolve()
+
+    def relative(filename):
+        try:
+            return Path(filename).relative_to(base_path).as_posix()
+        except ValueError:
+            return str(filename)
+
+    tools = {}
+    for tool, profile in sorted(profiles.items()):
+        tools[tool] = dict(profile)
+        tools[tool]['slowest_files'] = [
+            {'filename': relative(filename), 'time': elapsed}
+            for filename, elapsed in profile['slowest_files']
+        ]
+
+    with open(path, 'w', encoding='utf-8') as profile_file:
+        json.dump(
+            {
+                'tidypy': get_distribution_version('tidypy'),
+                'tools': tools,
+            },
+            profile_file,
+            indent=2,
+        )
+        profile_file.write('\n')
@@ -17,6 +17,7 @@ class Progress:
     def __init__(self):
         self.current_tools = []
         self.completed_tools = []
+        self.tool_profiles = {}
         self._lock = Lock()
 
     def on_start(self):
@@ -48,6 +49,30 @@ class Progress:
                 self.current_tools.remove(tool)
                 self.completed_tools.append(tool)
 
+    def on_tool_profile(self, tool, profile):
+        """
+        Called when an individual tool completes execution, with the resources
+        it used.
+
+        The profile is a dict containing the ``wall_time`` and ``cpu_time``
+        (in seconds) the tool spent across all the workers that executed it,
+        the ``worker_peak_rss`` (in bytes) of the largest of those workers
+        (which is the most memory that worker used at any point, including
+        while executing other tools, rather than what this tool alone used),
+        the number of ``files`` it analyzed, and its ``slowest_files`` (a list
+        of tuples containing the path to a file and the number of seconds the
+        tool spent analyzing it, which is empty for the tools whose time can't
+        be attributed to individual files).
+
+        :param tool: the name of the tool that completed
+        :type tool: str
+        :param profile: the resources the tool used
+        :type profile: dict
+        """
+
+        with self._lock:
+            self.tool_profiles[tool] = profile
+
     def on_finish(self):
         """
         Called after all tools in the suite have completed.
@@ -20,6 +20,7 @@ class Report:
 
         self.config = config
         self.base_path = base_path
+        self.streamed_files = set()
         self._output_needs_closing = False
         if output_file:
             self.output_file = output_file
@@ -43,6 +44,22 @@ class Report:
         :type collector: tidypy.Collector
         """
 
+    def stream(self, collector, filenames):
+        """
+        Produces the contents of the report for files whose analysis has
+        completed while the rest of the project is still being analyzed.
+
+        Reports that can produce their contents incrementally should output
+        the issues of the specified files, and add the files to
+        ``streamed_files`` so that ``execute()`` can skip them. Unless
+        overridden, does nothing.
+
+        :param collector: the collection of issues to report on
+        :type collector: tidypy.Collector
+        :param filenames: the files whose analysis has completed
+        :type filenames: list(str)
+        """
+
     def produce(self, collector):
         self.execute(collector)
         if self._output_needs_closing:
@@ -23,46 +23,60 @@ class ConsoleReport(Report):
     were found in.
     """
 
-    def execute(self, collector):
-        issues = collector.get_grouped_issues()
+    def __init__(self, config, base_path, output_file=None):
+        super().__init__(config, base_path, output_file=output_file)
+        self._streamed_issues = 0
+
+    def output_file_issues(self, filename, file_issues):
+        self.output(TMPL_FILENAME.format(
+            filename=self.relative_filename(filename),
+            num_errors=len(file_issues),
+        ))
+
+        for issue in file_issues:
+            location = TMPL_LOCATION.format(
+                line=issue.line,
+                position_splitter=' ' if issue.character is None else ':',
+                character=issue.character or '',
+            )
 
-        total_issues = 0
-        for filename in sorted(issues.keys()):
-            file_issues = issues[filename]
-            total_issues += len(file_issues)
-
-            self.output(TMPL_FILENAME.format(
-                filename=self.relative_filename(filename),
-                num_errors=len(file_issues),
-            ))
-
-            for issue in file_issues:
-                location = TMPL_LOCATION.format(
-                    line=issue.line,
-                    position_splitter=' ' if issue.character is None else ':',
-                    character=issue.character or '',
-                )
+            toolinfo = TMPL_TOOLINFO.format(
+                tool=issue.tool,
+                code=issue.code,
+            )
 
-                toolinfo = TMPL_TOOLINFO.format(
-                    tool=issue.tool,
-                    code=issue.code,
+            message = issue.message
+            if '\n' in message:
+                pad = '\n' + (' ' * len(click.unstyle(location)))
+
+                message = pad.join(
+                    issue.message.replace('\t', TAB).splitlines()
                 )
 
-                message = issue.message
-                if '\n' in message:
-                    pad = '\n' + (' ' * len(click.unstyle(location)))
+                toolinfo = pad + toolinfo
+            else:
+                toolinfo = ' ' + toolinfo
+
+            self.output(location + message + toolinfo)
 
-                    message = pad.join(
-                        issue.message.replace('\t', TAB).splitlines()
-                    )
+        self.output('')
 
-                    toolinfo = pad + toolinfo
-                else:
-                    toolinfo = ' ' + toolinfo
+    def stream(self, collector, filenames):
+        issues = collector.get_grouped_issues(filenames=filenames)
+        for filename in sorted(issues.keys()):
+            self._streamed_issues += len(issues[filename])
+            self.output_file_issues(filename, issues[filename])
+        self.streamed_files.update(filenames)
 
-                self.output(location + message + toolinfo)
+    def execute(self, collector):
+        issues = collector.get_grouped_issues()
 
-            self.output('')
+        total_issues = self._streamed_issues
+        for filename in sorted(issues.keys()):
+            if filename in self.streamed_files:
+                continue
+            total_issues += len(issues[filename])
+            self.output_file_issues(filename, issues[filename])
 
         is_windows = sys.platform == 'win32'
         if total_issues:
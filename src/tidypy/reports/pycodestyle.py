@@ -7,8 +7,7 @@ class PyCodeStyleReport(Report):
     output.
     """
 
-    def execute(self, collector):
-        issues = collector.get_issues(sortby=('filename', 'line', 'character'))
+    def output_issues(self, issues):
         for issue in issues:
             self.output(
                 '{filename}:{line}:{character} {code}@{tool} {message}'.format(
@@ -21,3 +20,17 @@ class PyCodeStyleReport(Report):
                 )
             )
 
+    def stream(self, collector, filenames):
+        self.output_issues(collector.get_issues(
+            sortby=('filename', 'line', 'character'),
+            filenames=filenames,
+        ))
+        self.streamed_files.update(filenames)
+
+    def execute(self, collector):
+        issues = collector.get_issues(sortby=('filename', 'line', 'character'))
+        self.output_issues([
+            issue
+            for issue in issues
+            if issue.filename not in self.streamed_files
+        ])
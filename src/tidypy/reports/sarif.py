@@ -0,0 +1,125 @@
+
+from pathlib import Path
+
+from ..config import get_tools
+from .structured import StreamingReport, encode_json
+
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+SARIF_VERSION = '2.1.0'
+
+# How the pylint categories of issues translate to SARIF levels.
+SARIF_LEVELS = {
+    'F': 'error',
+    'E': 'error',
+    'W': 'warning',
+    'R': 'note',
+    'C': 'note',
+}
+
+
+def get_code_descriptions(tool):
+    """
+    Retrieves the descriptions of the codes that the specified tool can
+    produce. Returns an empty dict if the tool isn't known or can't describe
+    its codes.
+
+    :param tool: the name of the tool
+    :type tool: str
+    :rtype: dict
+    """
+
+    tools = get_tools()
+    if tool not in tools:
+        return {}
+
+    try:
+        return dict(tools[tool].get_all_codes())
+    except Exception:  # noqa: broad-except
+        return {}
+
+
+class SarifReport(StreamingReport):
+    """
+    Generates a SARIF log that contains the results of the analysis.
+
+    Each tool gets its own run, whose rules describe the codes the tool found,
+    and whose results refer to those rules by index.
+    """
+
+    def execute(self, collector):
+        self.write('{"$schema": %s, "version": %s, "runs": [' % (
+            encode_json(SARIF_SCHEMA),
+            encode_json(SARIF_VERSION),
+        ))
+
+        # The issues are retrieved in order of their tools so that each run
+        # can be written as its issues are reached. A run's rules are written
+        # after its results, once every code the tool found is known.
+        tool = None
+        rules = {}
+        issues = collector.get_issues(
+            sortby=('tool',) + collector.DEFAULT_SORT,
+        )
+        for issue in issues:
+            if issue.tool != tool:
+                if tool is not None:
+                    self.end_run(tool, rules)
+                    self.write(',')
+                tool = issue.tool
+                rules = {}
+                self.start_run()
+            else:
+                self.write(',')
+
+            if issue.code not in rules:
+                rules[issue.code] = len(rules)
+            self.write('\n%s' % (
+                encode_json(self.get_result(issue, rules[issue.code])),
+            ))
+        if tool is not None:
+            self.end_run(tool, rules)
+
+        self.write('\n]}\n')
+        self.flush()
+
+    def start_run(self):
+        self.write(
+            '\n{"originalUriBaseIds": {"%%SRCROOT%%": {"uri": %s}},'
+            ' "results": [' % (
+                encode_json(Path(self.base_path).resolve().as_uri() + '/'),
+            )
+        )
+
+    def end_run(self, tool, rules):
+        descriptions = get_code_descriptions(tool)
+        self.write('\n], "tool": {"driver": {"name": %s, "rules": [' % (
+            encode_json(tool),
+        ))
+        for code, idx in rules.items():
+            rule = {'id': code}
+            if descriptions.get(code):
+                rule['shortDescription'] = {'text': descriptions[code]}
+            self.write('%s\n%s' % (',' if idx else '', encode_json(rule)))
+        self.write(']}}}')
+
+    def get_result(self, issue, rule_index):
+        location = {
+            'artifactLocation': {
+                'uri': self.relative_filename(issue.filename),
+                'uriBaseId': '%SRCROOT%',
+            },
+        }
+        if issue.line:
+            location['region'] = {'startLine': issue.line}
+            if issue.character:
+                location['region']['startColumn'] = issue.character
+
+        return {
+            'ruleId': issue.code,
+            'ruleIndex': rule_index,
+            'level': SARIF_LEVELS.get(issue.pylint_type, 'warning'),
+            'message': {'text': issue.message},
+            'locations': [{'physicalLocation': location}],
+        }
@@ -1,14 +1,56 @@
 
 import csv
+import json
 
 from collections import OrderedDict
+from io import StringIO
 
 import basicserial
-import pkg_resources
 
+from ..util import get_distribution_version
 from .base import Report
 
 
+# The number of pieces of formatted text that the streaming reports collect
+# before writing them to the output at once.
+WRITE_CHUNK_SIZE = 1000
+
+# The pieces of the JSON report, with and without pretty-printing. The output
+# is identical to what serializing the entire structure at once produces.
+JSON_LAYOUTS = {
+    True: {
+        'start': '{\n  "tidypy": %s,\n  "issues": {',
+        'file_start': '\n    %s: [',
+        'issue': '\n      {'
+                 '\n        "line": %s,'
+                 '\n        "character": %s,'
+                 '\n        "code": %s,'
+                 '\n        "tool": %s,'
+                 '\n        "message": %s'
+                 '\n      }',
+        'separator': ',',
+        'file_end': '\n    ]',
+        'end': '\n  }\n}\n',
+        'empty_end': '}\n}\n',
+    },
+    False: {
+        'start': '{"tidypy": %s, "issues": {',
+        'file_start': '%s: [',
+        'issue': '{"line": %s, "character": %s, "code": %s, "tool": %s,'
+                 ' "message": %s}',
+        'separator': ', ',
+        'file_end': ']',
+        'end': '}}\n',
+        'empty_end': '}}\n',
+    },
+}
+
+JSONL_ISSUE = '{"filename": %s, "line": %s, "character": %s, "tool": %s,' \
+    ' "code": %s, "message": %s}\n'
+
+encode_json = json.JSONEncoder().encode
+
+
 class StructuredReport(Report):
     def get_structure(self, collector):
         issues = OrderedDict()
@@ -27,21 +69,95 @@ class StructuredReport(Report):
         return OrderedDict((
             (
                 'tidypy',
-                str(pkg_resources.get_distribution('tidypy').version),
+                get_distribution_version('tidypy'),
             ),
             ('issues', issues),
         ))
 
 
-class CsvReport(StructuredReport):
+class StreamingReport(StructuredReport):
     """
-    Generates a set of CSV records that contains the results of the analysis.
+    The base class for the structured reports that format the issues one at a
+    time and write them to the output in chunks, rather than building the
+    entire structure in memory first.
+    """
+
+    def __init__(self, config, base_path, output_file=None):
+        super().__init__(config, base_path, output_file=output_file)
+        self._chunks = []
+        self._relative_filenames = {}
+
+    def relative_filename(self, filename):
+        if filename not in self._relative_filenames:
+            self._relative_filenames[filename] = \
+                super().relative_filename(filename)
+        return self._relative_filenames[filename]
+
+    def write(self, text):
+        """
+        Queues text to be written to the output target of the report. The
+        queued text is written once enough of it has accumulated.
+
+        :param text: the text to write
+        :type text: str
+        """
+
+        self._chunks.append(text)
+        if len(self._chunks) >= WRITE_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all the queued text to the output target of the report.
+        """
+
+        if self._chunks:
+            self.output(''.join(self._chunks), newline=False)
+            self._chunks = []
+
+
+class RecordReport(StreamingReport):
+    """
+    The base class for the structured reports that output a record for each
+    issue, which lets them output the issues of each file as soon as its
+    analysis is complete.
     """
 
+    def output_issues(self, issues):
+        """
+        Writes the records of the specified issues to the output target of the
+        report.
+
+        Must be implemented by concrete classes.
+
+        :param issues: the issues to write
+        :type issues: list(tidypy.Issue)
+        """
+
+        raise NotImplementedError()
+
+    def stream(self, collector, filenames):
+        self.output_issues(collector.get_issues(filenames=filenames))
+        self.streamed_files.update(filenames)
+
     def execute(self, collector):
-        issues = self.get_structure(collector)
-        writer = csv.writer(self.output_file, lineterminator='\n')  # noqa: @2to3
-        writer.writerow([
+        self.output_issues(
+            issue
+            for issue in collector.get_issues()
+            if issue.filename not in self.streamed_files
+        )
+
+
+class CsvReport(RecordReport):
+    """
+    Generates a set of CSV records that contains the results of the analysis.
+    """
+
+    def __init__(self, config, base_path, output_file=None):
+        super().__init__(config, base_path, output_file=output_file)
+        self._buffer = StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')  # noqa: @2to3
+        self._writer.writerow([
             'filename',
             'line',
             'character',
@@ -50,27 +166,81 @@ class CsvReport(StructuredReport):
             'message',
         ])
 
-        for filename, file_issues in issues['issues'].items():
-            for issue in file_issues:
-                writer.writerow([
-                    filename,
-                    issue['line'],
-                    issue['character'],
-                    issue['tool'],
-                    issue['code'],
-                    issue['message'],
-                ])
+    def _write_buffer(self):
+        self.write(self._buffer.getvalue())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def output_issues(self, issues):
+        for idx, issue in enumerate(issues):
+            self._writer.writerow([
+                self.relative_filename(issue.filename),
+                issue.line,
+                issue.character or 0,
+                issue.tool,
+                issue.code,
+                issue.message,
+            ])
+            if idx % 100 == 99:
+                self._write_buffer()
+
+        self._write_buffer()
+        self.flush()
 
 
-class JsonReport(StructuredReport):
+class JsonLinesReport(RecordReport):
+    """
+    Generates a JSON-serialized object for each issue found during the
+    analysis, one per line.
+    """
+
+    def output_issues(self, issues):
+        for issue in issues:
+            self.write(JSONL_ISSUE % (
+                encode_json(self.relative_filename(issue.filename)),
+                encode_json(issue.line),
+                encode_json(issue.character or 0),
+                encode_json(issue.tool),
+                encode_json(issue.code),
+                encode_json(issue.message),
+            ))
+        self.flush()
+
+
+class JsonReport(StreamingReport):
     """
     Generates a JSON-serialized object that contains the results of the
     analysis.
     """
 
     def execute(self, collector):
-        issues = self.get_structure(collector)
-        self.output(basicserial.to_json(issues, pretty=True))
+        layout = JSON_LAYOUTS[bool(self.config.get('pretty', True))]
+
+        self.write(layout['start'] % (
+            encode_json(get_distribution_version('tidypy')),
+        ))
+
+        grouped = collector.get_grouped_issues()
+        for file_idx, (filename, issues) in enumerate(grouped.items()):
+            if file_idx:
+                self.write(layout['separator'])
+            self.write(layout['file_start'] % (
+                encode_json(self.relative_filename(filename)),
+            ))
+            for idx, issue in enumerate(issues):
+                if idx:
+                    self.write(layout['separator'])
+                self.write(layout['issue'] % (
+                    encode_json(issue.line),
+                    encode_json(issue.character or 0),
+                    encode_json(issue.code),
+                    encode_json(issue.tool),
+                    encode_json(issue.message),
+                ))
+            self.write(layout['file_end'])
+
+        self.write(layout['end'] if grouped else layout['empty_end'])
+        self.flush()
 
 
 class TomlReport(StructuredReport):
@@ -93,4 +263,3 @@ class YamlReport(StructuredReport):
     def execute(self, collector):
         issues = self.get_structure(collector)
         self.output(basicserial.to_yaml(issues, pretty=True))
-
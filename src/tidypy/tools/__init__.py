@@ -9,4 +9,7 @@ from .base import (
     ParseIssue,
     ToolIssue,
 )
-
+from .dispatch import (
+    AstChecker,
+    AstDispatcher,
+)
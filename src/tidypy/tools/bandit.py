@@ -1,14 +1,22 @@
 
+import multiprocessing
 import re
 import sys
+import tokenize
+
+from io import BytesIO
 
 from bandit import manager, config as bandit_config
-from bandit.core import extension_loader
+from bandit.core import extension_loader, node_visitor
 
 from .base import PythonTool, Issue, ParseIssue, AccessIssue, UnknownIssue
+from ..util import get_distribution_version, get_file_shards, read_file, \
+    parse_python_file, get_python_comments
 
 
 class BanditIssue(Issue):
+    __slots__ = ()
+
     tool = 'bandit'
     pylint_type = 'R'
 
@@ -28,6 +36,27 @@ RATING = {
 }
 
 
+class TidyPyBanditNodeVisitor(node_visitor.BanditNodeVisitor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.context = {}
+
+    # This is a copy of the base implementation of this method, except that it
+    # receives the AST TidyPy has already parsed rather than parsing the
+    # source again.
+    def process(self, data):
+        self.generic_visit(data)
+        self.context = {
+            'file_data': self.fdata,
+            'filename': self.fname,
+            'lineno': 0,
+            'linerange': [0, 1],
+            'col_offset': 0,
+        }
+        self.update_scores(self.tester.run_tests(self.context, 'File'))
+        return self.scores
+
+
 class TidyPyBanditManager(manager.BanditManager):
     def __init__(self, *args, **kwargs):  # pylint: disable=unused-argument
         self.config = kwargs.pop('config')
@@ -46,6 +75,80 @@ class TidyPyBanditManager(manager.BanditManager):
         self.skipped = []
         self.excluded_files = []
 
+    def run_tests(self):
+        min_severity = RATING[self.config['options']['severity'].upper()]
+        min_confidence = RATING[self.config['options']['confidence'].upper()]
+
+        for filepath in self.files_list:
+            try:
+                results = self._check_file(filepath)
+            except KeyboardInterrupt:  # pragma: no cover
+                sys.exit(2)
+            except SyntaxError:
+                self.skipped.append(
+                    (filepath, 'syntax error while parsing AST from file'),
+                )
+                continue
+            except EnvironmentError as exc:
+                self.skipped.append((filepath, exc.strerror))
+                continue
+            except Exception:  # noqa: broad-except
+                self.skipped.append(
+                    (filepath, 'exception while scanning file'),
+                )
+                continue
+
+            # Only keep the results that will be reported.
+            self.results.extend(
+                result
+                for result in results
+                if RATING.get(result.severity, 0) >= min_severity
+                if RATING.get(result.confidence, 0) >= min_confidence
+            )
+
+        self.metrics.aggregate()
+
+    def _check_file(self, filepath):
+        # This mirrors the base implementation of _parse_file(), except that
+        # the source, AST, and comments come from TidyPy's caches.
+
+        # pylint: disable=protected-access
+
+        source = read_file(filepath)
+        tree = parse_python_file(filepath)
+
+        nosec_lines = {}
+        if not self.ignore_nosec:
+            try:
+                for comment in get_python_comments(filepath):
+                    nosec_lines[comment.start[0]] = \
+                        manager._parse_nosec_comment(comment.string)
+            except tokenize.TokenError:
+                pass
+
+        if source.isascii():
+            # The file-level tests expect the raw contents of the file, which
+            # can only differ from what was decoded if there's non-ASCII text.
+            fdata = BytesIO(source.encode('ascii'))
+        else:
+            with open(filepath, 'rb') as raw:
+                fdata = BytesIO(raw.read())
+
+        self.metrics.begin(filepath)
+        visitor = TidyPyBanditNodeVisitor(
+            filepath,
+            fdata,
+            self.b_ma,
+            self.b_ts,
+            self.debug,
+            nosec_lines,
+            self.metrics,
+        )
+        score = visitor.process(tree)
+        self.scores.append(score)
+        self.metrics.count_issues([score])
+        return visitor.tester.results
+
     def get_issues(self):
         issues = []
 
@@ -57,13 +160,7 @@ class TidyPyBanditManager(manager.BanditManager):
             else:
                 issues.append(UnknownIssue(reason, filepath))
 
-        min_severity = RATING[self.config['options']['severity'].upper()]
-        min_confidence = RATING[self.config['options']['confidence'].upper()]
-        for issue in self.get_issue_list():
-            if RATING[issue.severity] < min_severity \
-                    or RATING[issue.confidence] < min_confidence:
-                continue
-
+        for issue in self.results:
             issues.append(BanditIssue(
                 issue.test_id,
                 issue.text,
@@ -79,12 +176,25 @@ class BanditTool(PythonTool):
     Bandit is a security linter for Python source code.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def can_be_profiled_per_file(cls):
+        return False
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('bandit')
+
     @classmethod
     def get_default_config(cls):
         config = PythonTool.get_default_config()
         config['options']['confidence'] = 'low'
         config['options']['severity'] = 'low'
         config['options']['ignore-nosec'] = False
+        config['options']['jobs'] = 1
         return config
 
     @classmethod
@@ -107,6 +217,33 @@ class BanditTool(PythonTool):
 
     def execute(self, finder):
         self.bandit.discover_files(finder)
-        self.bandit.run_tests()
-        return self.bandit.get_issues()
+        files = self.bandit.files_list
+        shards = get_file_shards(files, self.config['options']['jobs'])
+        if len(shards) < 2:
+            self.bandit.run_tests()
+            return self.bandit.get_issues()
+
+        with multiprocessing.Pool(len(shards)) as pool:
+            results = pool.starmap(
+                _check_shard,
+                [(self.config, shard) for shard in shards],
+            )
+
+        # Put the issues back in the order they're produced in serially: the
+        # files that couldn't be checked first, then the findings, each in the
+        # order of the files.
+        order = {filepath: idx for idx, filepath in enumerate(files)}
+        issues = [issue for result in results for issue in result]
+        issues.sort(key=lambda issue: (
+            isinstance(issue, BanditIssue),
+            order.get(issue.filename, -1),
+        ))
+        return issues
+
+
+def _check_shard(config, files):
+    bandit = TidyPyBanditManager(config=config)
+    bandit.files_list = files
+    bandit.run_tests()
+    return bandit.get_issues()
 
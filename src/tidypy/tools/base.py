@@ -1,4 +1,5 @@
 
+import sys
 import traceback
 
 
@@ -21,6 +22,51 @@ class Tool:
 
         return True
 
+    @classmethod
+    def can_be_sharded(cls):
+        """
+        Indicates whether or not this tool analyzes each file independently of
+        the others. Tools that do can have their work split into batches of
+        files that are executed separately (and concurrently).
+
+        Unless overridden, always returns ``False``.
+
+        :rtype: bool
+        """
+
+        return False
+
+    @classmethod
+    def can_be_profiled_per_file(cls):
+        """
+        Indicates whether or not this tool finishes analyzing each file it
+        retrieves from the Finder's ``files()`` before retrieving the next one,
+        so the time it spends on each file can be measured. Only the resources
+        used by the tools that don't (e.g., because they retrieve all of their
+        files first) are profiled, rather than their slowest files.
+
+        Unless overridden, always returns ``True``.
+
+        :rtype: bool
+        """
+
+        return True
+
+    @classmethod
+    def get_version(cls):
+        """
+        Produces a string that identifies the version of the analysis logic
+        this tool uses. It's used to invalidate the cached results of the tool
+        when it changes. Tools that return ``None`` will not have their results
+        cached.
+
+        Unless overridden, always returns ``None``.
+
+        :rtype: str
+        """
+
+        return None
+
     @classmethod
     def get_default_config(cls):
         """
@@ -66,6 +112,10 @@ class Tool:
         Analyzes the project and generates a list of issues found during that
         analysis.
 
+        Instead of a list, tools may return any iterable of issues (e.g., a
+        generator), in which case the issues are passed along to be reported
+        as soon as they're produced.
+
         Must be implemented by concrete classes.
 
         :param finder:
@@ -95,35 +145,72 @@ class PythonTool(Tool):
         return config
 
 
+def intern_string(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def restore_issue(cls, values, state=None):
+    code, message, filename, line, character = values
+    issue = cls.__new__(cls)
+    issue.code = intern_string(code)
+    issue.message = message
+    issue.filename = intern_string(filename)
+    issue.line = line
+    issue.character = character
+    if state:
+        for name, value in state.items():
+            setattr(issue, name, value)
+    return issue
+
+
 class Issue:
     """
     A class that encapsulates an issue found during the analysis of a project.
+
+    Projects can produce a very large number of issues, so the core attributes
+    are stored in slots and the strings that are shared between many issues
+    (e.g., the filename and code) are interned. Subclasses that don't declare
+    ``__slots__`` of their own can still set arbitrary attributes.
     """
 
-    #: A string containing name of the tool that found the issue.
-    tool = None
+    __slots__ = (
+        #: A string containing a code that identifies the type of issue found.
+        'code',
 
-    #: A string containing a code that identifies the type of issue found.
-    code = None
+        #: A string containing a description of the issue.
+        'message',
 
-    #: A string containing a description of the issue.
-    message = None
+        #: A string containing the full path to the file where the issue was
+        #: found.
+        'filename',
 
-    #: A string containing the full path to the file where the issue was found.
-    filename = None
+        #: The line number within the file where the issue was found (if
+        #: known). The first line in a file is notated as 1 (not zero).
+        'line',
 
-    #: The line number within the file where the issue was found (if known).
-    #: The first line in a file is notated as 1 (not zero).
-    line = None
+        #: The character number within the line of the file where the issue
+        #: was found (if known). The first column in a line is notated as 1
+        #: (not zero).
+        'character',
+    )
 
-    #: The character number within the line of the file where the issue was
-    #: found (if known). The first column in a line is notated as 1 (not zero).
-    character = None
+    #: A string containing name of the tool that found the issue.
+    tool = None
 
     #: A character indicating the comparable pylint category this issue would
     #: fall into: E=error, W=warning, R=refactor, C=convention
     pylint_type = 'E'
 
+    def __new__(cls, *args, **kwargs):  # noqa: unused-argument
+        issue = super().__new__(cls)
+        # Subclasses that don't set every attribute in their constructors
+        # still get the defaults of None that they've always had.
+        for name in Issue.__slots__:
+            setattr(issue, name, None)
+        return issue
+
     def __init__(
             self,
             code=None,
@@ -131,12 +218,44 @@ class Issue:
             filename=None,
             line=None,
             character=None):
-        self.code = code
+        self.code = intern_string(code)
         self.message = message
-        self.filename = filename
+        self.filename = intern_string(filename)
         self.line = line if line is not None else 1
         self.character = character or None
 
+    def __reduce__(self):
+        # Issues are pickled as a flat tuple of their values (rather than the
+        # default name/value mapping of their slots) to keep the payloads sent
+        # by the workers and stored in the result cache small.
+        args = (
+            self.__class__,
+            (
+                self.code,
+                self.message,
+                self.filename,
+                self.line,
+                self.character,
+            ),
+        )
+        state = self._get_extra_state()
+        if state:
+            args += (state,)
+        return restore_issue, args
+
+    def _get_extra_state(self):
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in self.__class__.__mro__:
+            if cls is Issue:
+                break
+            slots = cls.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
     def __repr__(self):
         return '%s(%s)' % (
             self.__class__.__name__,
@@ -155,6 +274,8 @@ class TidyPyIssue(Issue):
     The base class for all TidyPy application issues that are produced.
     """
 
+    __slots__ = ()
+
     tool = 'tidypy'
     pylint_type = 'F'
 
@@ -165,6 +286,8 @@ class UnknownIssue(TidyPyIssue):
     execution of a tool.
     """
 
+    __slots__ = ()
+
     def __init__(self, exc, filename):
         super().__init__(
             'unexpected',
@@ -179,6 +302,8 @@ class AccessIssue(TidyPyIssue):
     due to permissions).
     """
 
+    __slots__ = ()
+
     def __init__(self, exc, filename):
         super().__init__(
             'access',
@@ -193,6 +318,8 @@ class ParseIssue(TidyPyIssue):
     Python source file with invalid syntax).
     """
 
+    __slots__ = ()
+
     def __init__(self, exc, filename, line=None, character=None):
         if isinstance(exc, SyntaxError):
             line = exc.lineno
@@ -213,6 +340,8 @@ class ToolIssue(TidyPyIssue):
     execution.
     """
 
+    __slots__ = ('pylint_type',)
+
     def __init__(self, message, project_path, details=None, failure=False):
         if details:
             if isinstance(details, tuple):
@@ -0,0 +1,136 @@
+
+import ast
+
+
+# The fields of the AST nodes that can contain statements.
+STATEMENT_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+
+class AstChecker:
+    """
+    The base class for checks that examine the nodes of a Python module's AST
+    as an ``AstDispatcher`` walks it.
+
+    Checkers receive the nodes by defining methods named after the classes of
+    the nodes they're interested in: ``visit_<Class>(node)`` is called when
+    the walk reaches a node, and ``leave_<Class>(node)`` is called once all of
+    the node's descendants have been visited.
+    """
+
+    #: Whether or not this checker only examines statements. When every
+    #: checker in a walk does, the walk doesn't descend into expressions.
+    statements_only = False
+
+
+def _is_handler(checker, name):
+    method = getattr(checker.__class__, name, None)
+    if method is None:
+        return False
+    # Checkers based on ast.NodeVisitor inherit compatibility shims (e.g.,
+    # visit_Constant) that only make sense when they drive their own walk.
+    return method is not getattr(ast.NodeVisitor, name, None)
+
+
+class AstDispatcher:
+    """
+    Walks an AST once and passes each node to all of the checkers interested
+    in it, rather than having each checker walk the tree on its own.
+
+    Besides ``AstChecker`` subclasses, the checkers can be
+    ``ast.NodeVisitor`` instances whose ``visit_<Class>()`` methods recurse by
+    calling ``generic_visit()``; since the dispatcher visits every node
+    anyway, their ``generic_visit()`` is replaced with one that does nothing.
+    """
+
+    def __init__(self, checkers):
+        """
+        :param checkers: the checkers to pass the nodes to
+        :type checkers: list
+        """
+
+        self.checkers = list(checkers)
+        self.statements_only = all(
+            getattr(checker, 'statements_only', False)
+            for checker in self.checkers
+        )
+        self._handlers = {}
+
+        for checker in self.checkers:
+            if isinstance(checker, ast.NodeVisitor):
+                checker.generic_visit = _ignore_node
+
+    def _get_handlers(self, cls):
+        visit_name = 'visit_' + cls.__name__
+        leave_name = 'leave_' + cls.__name__
+
+        if self.statements_only:
+            fields = tuple(
+                field
+                for field in STATEMENT_FIELDS
+                if field in cls._fields
+            )
+        else:
+            fields = cls._fields
+
+        handlers = (
+            [
+                getattr(checker, visit_name)
+                for checker in self.checkers
+                if _is_handler(checker, visit_name)
+            ],
+            [
+                getattr(checker, leave_name)
+                for checker in reversed(self.checkers)
+                if _is_handler(checker, leave_name)
+            ],
+            fields,
+        )
+        self._handlers[cls] = handlers
+        return handlers
+
+    def walk(self, tree):
+        """
+        Passes the nodes of the tree to the checkers, in depth-first order.
+
+        :param tree: the root of the tree to walk
+        :type tree: ast.AST
+        """
+
+        # pylint: disable=unidiomatic-typecheck
+
+        all_handlers = self._handlers
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+
+            if type(node) is tuple:
+                # The node's descendants have all been visited.
+                for leaver in all_handlers[node[0].__class__][1]:
+                    leaver(node[0])
+                continue
+
+            handlers = all_handlers.get(node.__class__) \
+                or self._get_handlers(node.__class__)
+            for visitor in handlers[0]:
+                visitor(node)
+            if handlers[1]:
+                stack.append((node,))
+
+            children = []
+            for field in handlers[2]:
+                value = getattr(node, field, None)
+                if isinstance(value, list):
+                    children.extend(
+                        child
+                        for child in value
+                        if isinstance(child, ast.AST)
+                    )
+                elif isinstance(value, ast.AST):
+                    children.append(value)
+            if children:
+                children.reverse()
+                stack.extend(children)
+
+
+def _ignore_node(node):  # noqa: unused-argument
+    pass
@@ -1,11 +1,15 @@
 
 from dlint import linters
+from dlint.namespace import Namespace
 
 from .base import PythonTool, Issue, AccessIssue, ParseIssue
-from ..util import parse_python_file
+from .dispatch import AstDispatcher
+from ..util import parse_python_file, get_distribution_version
 
 
 class DlintIssue(Issue):
+    __slots__ = ()
+
     tool = 'dlint'
     pylint_type = 'W'
 
@@ -26,6 +30,14 @@ class DlintTool(PythonTool):
     we're writing secure Python code.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('dlint')
+
     @classmethod
     def get_all_codes(cls):
         return [
@@ -52,11 +64,16 @@ class DlintTool(PythonTool):
                 issues.append(AccessIssue(exc, filepath))
                 continue
 
-            for linter in dlinters:
-                linter_instance = linter()
-                linter_instance.visit(tree)
+            # Every linter examines the same walk of the tree, and shares the
+            # same view of what the module imports.
+            instances = [linter() for linter in dlinters]
+            namespace = Namespace.from_module_node(tree)
+            for instance in instances:
+                instance.namespace = namespace
+            AstDispatcher(instances).walk(tree)
 
-                for result in linter_instance.get_results():
+            for linter, instance in zip(dlinters, instances):
+                for result in instance.get_results():
                     issues.append(DlintIssue(
                         code=linter._code,
                         message=get_linter_msg(linter, result.message),
@@ -1,10 +1,15 @@
 
+import tokenize
+
 from eradicate import Eradicator
 
 from .base import PythonTool, Issue, AccessIssue
+from ..util import get_distribution_version, get_python_comments
 
 
 class EradicateIssue(Issue):
+    __slots__ = ()
+
     tool = 'eradicate'
     pylint_type = 'R'
 
@@ -18,6 +23,14 @@ class EradicateTool(PythonTool):
     Eradicate finds commented-out code in Python files.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('eradicate')
+
     @classmethod
     def get_all_codes(cls):
         return [(CODE, DESCRIPTION)]
@@ -37,7 +50,22 @@ class EradicateTool(PythonTool):
                 issues.append(AccessIssue(exc, filepath))
                 continue
 
-            for line in eradicator.commented_out_code_line_numbers(source):
+            try:
+                comments = get_python_comments(filepath)
+            except (tokenize.TokenError, SyntaxError):
+                # Let eradicate report what it finds before the error.
+                lines = eradicator.commented_out_code_line_numbers(source)
+            else:
+                lines = [
+                    comment.start[0]
+                    for comment in comments
+                    if comment.line.lstrip().startswith('#')
+                    and eradicator.comment_contains_code(  # noqa: W503
+                        comment.line,
+                    )
+                ]
+
+            for line in lines:
                 issues.append(EradicateIssue(
                     CODE,
                     DESCRIPTION,
@@ -2,9 +2,12 @@
 from demjson3 import decode, JSONError
 
 from .base import Tool, Issue, AccessIssue, UnknownIssue
+from ..util import get_distribution_version
 
 
 class JsonLintIssue(Issue):
+    __slots__ = ()
+
     tool = 'jsonlint'
     pylint_type = 'E'
 
@@ -16,6 +19,14 @@ class JsonLintTool(Tool):
     portability issues.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('demjson3')
+
     @classmethod
     def get_default_config(cls):
         config = Tool.get_default_config()
@@ -12,6 +12,8 @@ IGNORE_MSGS = (
 
 
 class CheckManifestIssue(Issue):
+    __slots__ = ()
+
     tool = 'manifest'
     pylint_type = 'W'
 
@@ -1,11 +1,12 @@
 
-from mccabe import PathGraphingAstVisitor
-
 from .base import PythonTool, Issue, AccessIssue, ParseIssue
-from ..util import parse_python_file
+from .dispatch import AstChecker, AstDispatcher
+from ..util import parse_python_file, get_distribution_version
 
 
 class McCabeIssue(Issue):
+    __slots__ = ()
+
     tool = 'mccabe'
     pylint_type = 'W'
 
@@ -14,12 +15,141 @@ CODE = 'complex'
 DESCRIPTION = '"{entity}" is too complex ({score})'
 
 
+class ComplexityGraph:
+    def __init__(self, entity, lineno, column):
+        self.entity = entity
+        self.lineno = lineno
+        self.column = column
+        self.complexity = 1
+
+
+class ComplexityChecker(AstChecker):
+    """
+    Calculates the same complexities as mccabe's ``PathGraphingAstVisitor``,
+    by counting the branches its path graphs would contain rather than
+    building them.
+
+    Like mccabe, only the statements it would reach are considered: those in
+    the bodies of functions and classes, and in the bodies, handlers, and
+    ``else`` blocks of ``if``, ``for``, ``while``, ``try``, and ``with``
+    statements (but not their ``finally`` blocks).
+    """
+
+    statements_only = True
+
+    def __init__(self):
+        self.graphs = {}
+        self._graph = None
+        self._owner = None
+        self._classname = []
+        self._reached = set()
+
+    def _reach(self, *blocks):
+        for block in blocks:
+            self._reached.update(id(stmt) for stmt in block)
+
+    def _is_reached(self, node):
+        return id(node) in self._reached
+
+    def _start_graph(self, node, entity, name, branches):
+        if self._graph is None:
+            self._graph = ComplexityGraph(
+                entity,
+                node.lineno,
+                node.col_offset,
+            )
+            self._owner = (node, ''.join(self._classname) + name)
+        self._graph.complexity += branches
+
+    def _finish_graph(self, node):
+        if self._owner and self._owner[0] is node:
+            self.graphs[self._owner[1]] = self._graph
+            self._graph = None
+            self._owner = None
+
+    def visit_Module(self, node):  # noqa: invalid-name,N802
+        self._reach(node.body)
+
+    def visit_FunctionDef(self, node):  # noqa: invalid-name,N802
+        if not self._is_reached(node):
+            return
+        self._reach(node.body)
+        entity = ''.join(self._classname) + node.name
+        # A function within a graph is a closure, which adds a branch to it.
+        self._start_graph(
+            node,
+            entity,
+            node.name,
+            1 if self._graph else 0,
+        )
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # noqa: N815
+
+    def leave_FunctionDef(self, node):  # noqa: invalid-name,N802
+        self._finish_graph(node)
+
+    leave_AsyncFunctionDef = leave_FunctionDef  # noqa: N815
+
+    def visit_ClassDef(self, node):  # noqa: invalid-name,N802
+        if not self._is_reached(node):
+            return
+        self._reach(node.body)
+        self._classname.append(node.name + '.')
+
+    def leave_ClassDef(self, node):  # noqa: invalid-name,N802
+        if self._is_reached(node):
+            self._classname.pop()
+
+    def _visit_branch(self, node, name, branches):
+        if not self._is_reached(node):
+            return
+        self._reach(node.body, node.orelse)
+        self._start_graph(node, name, name, branches)
+
+    def visit_If(self, node):  # noqa: invalid-name,N802
+        self._visit_branch(node, 'If %d' % (node.lineno,), 1)
+
+    def visit_For(self, node):  # noqa: invalid-name,N802
+        self._visit_branch(node, 'Loop %d' % (node.lineno,), 1)
+
+    visit_AsyncFor = visit_While = visit_For  # noqa: N815
+
+    def visit_Try(self, node):  # noqa: invalid-name,N802
+        if self._is_reached(node):
+            self._reach(*[handler.body for handler in node.handlers])
+        self._visit_branch(
+            node,
+            'TryExcept %d' % (node.lineno,),
+            1 + len(node.handlers),
+        )
+
+    def leave_If(self, node):  # noqa: invalid-name,N802
+        self._finish_graph(node)
+
+    leave_For = leave_AsyncFor = leave_If  # noqa: N815
+    leave_While = leave_Try = leave_If  # noqa: N815
+
+    def visit_With(self, node):  # noqa: invalid-name,N802
+        if self._is_reached(node):
+            self._reach(node.body)
+
+    visit_AsyncWith = visit_With  # noqa: N815
+
+
 class McCabeTool(PythonTool):
     """
     Ned Batchelder's script to check the McCabe the cyclomatic complexity of
     Python code.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('mccabe')
+
     @classmethod
     def get_default_config(cls):
         config = PythonTool.get_default_config()
@@ -47,11 +177,11 @@ class McCabeTool(PythonTool):
                 issues.append(AccessIssue(exc, filepath))
                 continue
 
-            visitor = PathGraphingAstVisitor()
-            visitor.preorder(tree, visitor)
+            checker = ComplexityChecker()
+            AstDispatcher([checker]).walk(tree)
 
-            for graph in visitor.graphs.values():
-                complexity = graph.complexity()
+            for graph in checker.graphs.values():
+                complexity = graph.complexity
                 if complexity > self.config['options']['max-complexity']:
                     issues.append(McCabeIssue(
                         'complex',
@@ -11,9 +11,12 @@ from dennis.templatelinter import (
 from dennis.tools import get_available_formats
 
 from .base import Tool, Issue, AccessIssue, UnknownIssue, ParseIssue
+from ..util import get_distribution_version
 
 
 class PoLintIssue(Issue):
+    __slots__ = ('pylint_type',)
+
     tool = 'polint'
 
 
@@ -23,6 +26,14 @@ class PoLintTool(Tool):
     problems.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('dennis')
+
     @classmethod
     def get_default_config(cls):
         config = Tool.get_default_config()
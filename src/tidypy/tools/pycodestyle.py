@@ -1,11 +1,22 @@
 
+import multiprocessing
+import tokenize
+
+from inspect import signature
+from io import StringIO
+
 from pep8ext_naming import NamingChecker
-from pycodestyle import StyleGuide, BaseReport, register_check
+from pycodestyle import Checker, StyleGuide, BaseReport, register_check, \
+    noqa
 
 from .base import PythonTool, Issue, AccessIssue, ParseIssue
+from ..util import get_distribution_version, get_file_shards, read_file, \
+    tokenize_python_file
 
 
 class PyCodeStyleIssue(Issue):
+    __slots__ = ()
+
     tool = 'pycodestyle'
     pylint_type = 'C'
 
@@ -26,6 +37,10 @@ class TidyPyReport(BaseReport):
         super().__init__(*args, **kwargs)
         self._tidypy_issues = []
 
+    def start(self):
+        super().start()
+        self._tidypy_issues = []
+
     def error(self, line_number, offset, text, check):
         code = super().error(
             line_number,
@@ -61,9 +76,57 @@ class TidyPyReport(BaseReport):
         return self._tidypy_issues
 
 
+# Versions of pycodestyle before 2.6 keep track of the previous physical line
+# themselves, rather than being told it with each token.
+PASSES_PREVIOUS_PHYSICAL = \
+    len(signature(Checker.maybe_check_physical).parameters) > 2
+
+
+class TidyPyChecker(Checker):
+    def _get_cached_tokens(self):
+        if self._io_error:
+            return None
+        try:
+            source = read_file(self.filename)
+            tokens = tokenize_python_file(self.filename)
+        except (EnvironmentError, SyntaxError, tokenize.TokenError):
+            return None
+        if ''.join(self.lines) != source:
+            # e.g., pycodestyle stripped a BOM that wasn't decoded as one.
+            return None
+        return tokens
+
+    def generate_tokens(self):
+        tokens = None
+        if PASSES_PREVIOUS_PHYSICAL:
+            tokens = self._get_cached_tokens()
+        if tokens is None:
+            # Let pycodestyle tokenize the file itself so it can report the
+            # tokens before an error, and the error itself (or so that older
+            # versions can track the physical lines the way they expect).
+            yield from super().generate_tokens()
+            return
+
+        prev_physical = ''
+        for token in tokens:
+            if token[2][0] > self.total_lines:
+                return
+
+            # The physical line checks expect the lines to have been read up
+            # to where tokenize would have stopped to produce this token.
+            while self.line_number < token[3][0]:
+                self.readline()
+
+            self.noqa = token[4] and noqa(token[4])
+            self.maybe_check_physical(token, prev_physical)
+            yield token
+            prev_physical = token[4]
+
+
 class TidyPyStyleGuide(StyleGuide):
     def __init__(self, config):
         kwargs = {
+            'checker_class': TidyPyChecker,
             'reporter': TidyPyReport,
             'ignore': config['disabled'],
         }
@@ -71,6 +134,19 @@ class TidyPyStyleGuide(StyleGuide):
         self.options.max_line_length = config['options']['max-line-length']
         self.options.hang_closing = config['options']['hang-closing']
 
+    def input_file(self, filename, lines=None, expected=None, line_offset=0):
+        if lines is None:
+            try:
+                lines = StringIO(read_file(filename)).readlines()
+            except EnvironmentError:
+                pass
+        return super().input_file(
+            filename,
+            lines=lines,
+            expected=expected,
+            line_offset=line_offset,
+        )
+
 
 class PyCodeStyleTool(PythonTool):
     """
@@ -78,12 +154,28 @@ class PyCodeStyleTool(PythonTool):
     conventions in PEP 8.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def can_be_profiled_per_file(cls):
+        return False
+
+    @classmethod
+    def get_version(cls):
+        return ','.join([
+            get_distribution_version('pycodestyle'),
+            get_distribution_version('pep8-naming'),
+        ])
+
     @classmethod
     def get_default_config(cls):
         config = PythonTool.get_default_config()
         config['options'] = {
             'max-line-length': 79,
             'hang-closing': False,
+            'jobs': 1,
         }
         return config
 
@@ -97,10 +189,37 @@ class PyCodeStyleTool(PythonTool):
         self.checker = TidyPyStyleGuide(self.config)
 
     def execute(self, finder):
-        report = self.checker.check_files(
-            finder.files(self.config['filters']),
-        )
-        return report.get_issues()
+        files = list(finder.files(self.config['filters']))
+        shards = get_file_shards(files, self.config['options']['jobs'])
+        if len(shards) < 2:
+            return self.checker.check_files(files).get_issues()
+
+        with multiprocessing.Pool(
+                len(shards),
+                initializer=_init_worker,
+                initargs=(self.config,)) as pool:
+            results = pool.map(_check_shard, shards)
+
+        # Put the issues back in the order the files would have been checked
+        # in serially.
+        order = {filepath: idx for idx, filepath in enumerate(files)}
+        issues = [issue for result in results for issue in result]
+        issues.sort(key=lambda issue: order.get(issue.filename, -1))
+        return issues
+
+
+_WORKER_CHECKER = None
+
+
+def _init_worker(config):
+    # Each process of the pool sets up its StyleGuide once, and reuses it for
+    # every batch of files it's given.
+    global _WORKER_CHECKER  # pylint: disable=global-statement
+    _WORKER_CHECKER = TidyPyStyleGuide(config)
+
+
+def _check_shard(files):
+    return _WORKER_CHECKER.check_files(files).get_issues()
 
 
 register_check(NamingChecker)
@@ -7,6 +7,8 @@ from .base import PythonTool, Issue, AccessIssue
 
 
 class PyDiatraIssue(Issue):
+    __slots__ = ()
+
     tool = 'pydiatra'
 
 
@@ -1,14 +1,19 @@
 
 import logging
+import multiprocessing
+import tokenize
 
-from pydocstyle import check, Error
+from pydocstyle import ConventionChecker, Error
 from pydocstyle.parser import ParseError, AllError
 from pydocstyle.violations import ErrorRegistry
 
 from .base import PythonTool, Issue, AccessIssue, ParseIssue, UnknownIssue
+from ..util import get_distribution_version, get_file_shards, read_file
 
 
 class PyDocStyleIssue(Issue):
+    __slots__ = ()
+
     tool = 'pydocstyle'
     pylint_type = 'C'
 
@@ -19,6 +24,24 @@ class PyDocStyleTool(PythonTool):
     docstring conventions (e.g., PEP 257).
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def can_be_profiled_per_file(cls):
+        return False
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('pydocstyle')
+
+    @classmethod
+    def get_default_config(cls):
+        config = PythonTool.get_default_config()
+        config['options']['jobs'] = 1
+        return config
+
     @classmethod
     def get_all_codes(cls):
         return [
@@ -28,20 +51,56 @@ class PyDocStyleTool(PythonTool):
         ]
 
     def execute(self, finder):
-        issues = []
+        files = list(finder.files(self.config['filters']))
+        shards = get_file_shards(files, self.config['options']['jobs'])
+        if len(shards) < 2:
+            return self.check(files)
+
+        with multiprocessing.Pool(len(shards)) as pool:
+            results = pool.starmap(
+                _check_shard,
+                [(self.config, shard) for shard in shards],
+            )
+
+        # Put the issues back in the order the files would have been checked
+        # in serially.
+        order = {filepath: idx for idx, filepath in enumerate(files)}
+        issues = [issue for result in results for issue in result]
+        issues.sort(key=lambda issue: order.get(issue.filename, -1))
+        return issues
 
-        logging.disable(logging.CRITICAL)
+    def check(self, files):
+        """
+        Checks the specified files with a single pydocstyle checker.
 
-        for filepath in finder.files(self.config['filters']):
-            issues += [
-                self.make_issue(error, filepath)
-                for error in check(
-                    (filepath,),
-                    ignore=self.config['disabled'],
-                )
-            ]
+        :param files: the paths to the files
+        :type files: list(str)
+        :rtype: list(tidypy.Issue)
+        """
 
-        logging.disable(logging.NOTSET)
+        checker = ConventionChecker()
+        checked_codes = set(ErrorRegistry.get_error_codes()) \
+            - set(self.config['disabled'])
+
+        # pydocstyle logs the problems it has with files, which are reported
+        # as issues instead.
+        logger = logging.getLogger('pydocstyle')
+        level = logger.level
+        logger.setLevel(logging.CRITICAL + 1)
+
+        issues = []
+        try:
+            for filepath in files:
+                issues += [
+                    self.make_issue(error, filepath)
+                    for error in _check_file(
+                        checker,
+                        checked_codes,
+                        filepath,
+                    )
+                ]
+        finally:
+            logger.setLevel(level)
 
         return issues
 
@@ -62,3 +121,21 @@ class PyDocStyleTool(PythonTool):
 
         return UnknownIssue(error, filename)
 
+
+def _check_file(checker, checked_codes, filepath):
+    # This mirrors pydocstyle.check(), except that the checker is reused
+    # and the source comes from TidyPy's cache.
+    try:
+        source = read_file(filepath)
+        for error in checker.check_source(source, filepath):
+            if getattr(error, 'code', None) in checked_codes:
+                yield error
+    except (EnvironmentError, AllError, ParseError) as error:
+        yield error
+    except tokenize.TokenError:
+        yield SyntaxError('invalid syntax in file %s' % (filepath,))
+
+
+def _check_shard(config, files):
+    tool = PyDocStyleTool(config)
+    return tool.check(files)
@@ -1,14 +1,17 @@
 
 import inspect
 
-from pyflakes import messages
+from pyflakes import checker, messages
 from pyflakes.api import check
 from pyflakes.reporter import Reporter
 
 from .base import PythonTool, Issue, AccessIssue, ParseIssue
+from ..util import get_distribution_version, parse_python_file
 
 
 class PyFlakesIssue(Issue):
+    __slots__ = ()
+
     tool = 'pyflakes'
 
 
@@ -57,6 +60,14 @@ class PyFlakesTool(PythonTool):
     Pyflakes is a simple program which checks Python source files for errors.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('pyflakes')
+
     @classmethod
     def get_all_codes(cls):
         codes = []
@@ -70,6 +81,29 @@ class PyFlakesTool(PythonTool):
 
         return codes
 
+    def _check(self, source, filepath, reporter):
+        if not hasattr(checker, 'make_tokens'):
+            # Versions of pyflakes before 2.1 can't be given the tokens the
+            # way check() does, so they parse the file themselves.
+            check(source, filepath, reporter)
+            return
+
+        try:
+            tree = parse_python_file(filepath)
+        except Exception:  # noqa: broad-except
+            # Let pyflakes report the problem the way it normally would.
+            check(source, filepath, reporter)
+            return
+
+        flakes = checker.Checker(
+            tree,
+            file_tokens=checker.make_tokens(source),
+            filename=filepath,
+        )
+        flakes.messages.sort(key=lambda message: message.lineno)
+        for message in flakes.messages:
+            reporter.flake(message)
+
     def execute(self, finder):
         issues = []
         reporter = TidyPyReporter(self.config)
@@ -81,6 +115,6 @@ class PyFlakesTool(PythonTool):
                     AccessIssue(exc, filepath)
                 )
             else:
-                check(source, filepath, reporter)
+                self._check(source, filepath, reporter)
         return reporter.get_issues() + issues
 
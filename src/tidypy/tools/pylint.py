@@ -1,19 +1,25 @@
 
+import multiprocessing
 import os.path
 
 from pathlib import Path
 
 import astroid
 
+from astroid.modutils import get_module_files
 from pylint.exceptions import UnknownMessageError
 from pylint.lint import PyLinter
 from pylint.reporters import BaseReporter
 
-from ..util import mod_sys_path, compile_masks, matches_masks
+from ..finder import Finder
+from ..util import mod_sys_path, compile_masks, matches_masks, \
+    get_file_shards
 from .base import Tool, Issue, AccessIssue, ParseIssue
 
 
 class PyLintIssue(Issue):
+    __slots__ = ()
+
     tool = 'pylint'
 
     def __init__(self, *args, **kwargs):
@@ -150,12 +156,28 @@ class PyLintTool(Tool):
         'suppressed-message',
     ]
 
+    # Messages that can only be found by analyzing all the modules together.
+    WHOLE_PROJECT_MESSAGES = [
+        'duplicate-code',
+        'cyclic-import',
+    ]
+
+    # Options that are interpreted by TidyPy rather than passed to pylint.
+    TIDYPY_OPTIONS = [
+        'jobs',
+    ]
+
+    @classmethod
+    def can_be_profiled_per_file(cls):
+        return False
+
     @classmethod
     def get_default_config(cls):
         config = Tool.get_default_config()
         config['filters'] = []
         config['options']['plugins'] = []
         config['options']['extension-pkg-whitelist'] = []
+        config['options']['jobs'] = 1
         return config
 
     @classmethod
@@ -172,17 +194,7 @@ class PyLintTool(Tool):
 
         return codes
 
-    def execute(self, finder):
-        packages = list(finder.packages(filters=self.config['filters']))
-        modules = [
-            mod
-            for mod in finder.modules(filters=self.config['filters'])
-            if os.path.dirname(mod) not in packages
-        ]
-        targets = modules + finder.topmost_directories(packages)
-        if not targets:
-            return []
-
+    def _create_linter(self, finder, targets):
         pylint = PyLinter()
 
         pylint.load_default_plugins()
@@ -203,6 +215,8 @@ class PyLintTool(Tool):
             if not hasattr(checker, 'options'):
                 continue
             for option in checker.options:
+                if option[0] in self.TIDYPY_OPTIONS:
+                    continue
                 if option[0] in self.config['options']:
                     checker.set_option(
                         option[0],
@@ -215,9 +229,129 @@ class PyLintTool(Tool):
             except UnknownMessageError:
                 pass
 
+        return pylint, reporter
+
+    def check(self, finder, targets, only=None, exclude=None):
+        """
+        Executes pylint upon the specified targets.
+
+        :param finder: the Finder of the project
+        :type finder: tidypy.Finder
+        :param targets: the modules and packages to analyze
+        :type targets: list(str)
+        :param only: the only messages to check for
+        :type only: list(str)
+        :param exclude: the messages to not check for
+        :type exclude: list(str)
+        :rtype: list(tidypy.Issue)
+        """
+
+        pylint, reporter = self._create_linter(finder, targets)
+
+        if only is not None:
+            enabled = [
+                msg
+                for msg in only
+                if pylint.is_message_enabled(msg)
+            ]
+            if not enabled:
+                return []
+            pylint.disable('all')
+            for msg in enabled:
+                pylint.enable(msg)
+
+        for msg in exclude or []:
+            pylint.disable(msg)
+
         sys_paths = finder.sys_paths(filters=self.config['filters'])
         with mod_sys_path(sys_paths):
             pylint.check(targets)
 
         return reporter.get_issues()
 
+    def execute(self, finder):
+        packages = list(finder.packages(filters=self.config['filters']))
+        modules = [
+            mod
+            for mod in finder.modules(filters=self.config['filters'])
+            if os.path.dirname(mod) not in packages
+        ]
+        targets = modules + finder.topmost_directories(packages)
+        if not targets:
+            return []
+
+        # The modules of the project that astroid cached during a previous
+        # execution in this process (e.g., in a daemon) may have changed since.
+        prefix = os.path.join(finder.project_path, '')
+        for name, module in list(astroid.MANAGER.astroid_cache.items()):
+            if (module.file or '').startswith(prefix):
+                del astroid.MANAGER.astroid_cache[name]
+
+        shards = get_file_shards(
+            list(finder.modules(filters=self.config['filters'])),
+            self.config['options']['jobs'],
+        )
+        if len(shards) < 2:
+            return self.check(finder, targets)
+
+        # The shards are only sent what they need to rebuild the parts of the
+        # Finder that pylint uses.
+        project = (
+            finder.project_path,
+            [mask.pattern for mask in finder.excludes],
+            list(finder.files(filters=self.config['filters'])),
+        )
+        with multiprocessing.Pool(len(shards)) as pool:
+            results = [
+                pool.apply_async(
+                    _check_shard,
+                    (self.config, project, shard),
+                )
+                for shard in shards
+            ]
+
+            # The messages that need to see every module at once are checked
+            # while the shards are being analyzed.
+            issues = self.check(
+                finder,
+                targets,
+                only=self.WHOLE_PROJECT_MESSAGES,
+            )
+
+            for result in results:
+                issues.extend(result.get())
+
+        # Put the issues back in the order pylint would have reported them in
+        # if it had checked the targets itself, where the messages about the
+        # whole project come after those of the individual modules.
+        order = _get_module_order(targets)
+        issues.sort(key=lambda issue: (
+            issue.code in self.WHOLE_PROJECT_MESSAGES,
+            order.get(issue.filename, len(order)),
+        ))
+        return issues
+
+
+def _get_module_order(targets):
+    # pylint checks a package's __init__ module before walking the rest of its
+    # directory.
+    order = {}
+    for target in targets:
+        if os.path.isdir(target):
+            paths = [os.path.join(target, '__init__.py')]
+            paths += get_module_files(target, ())
+        else:
+            paths = [target]
+        for path in paths:
+            order.setdefault(path, len(order))
+    return order
+
+
+def _check_shard(config, project, modules):
+    project_path, excludes, files = project
+    finder = Finder(project_path, {'exclude': excludes}, paths=files)
+    return PyLintTool(config).check(
+        finder,
+        modules,
+        exclude=PyLintTool.WHOLE_PROJECT_MESSAGES,
+    )
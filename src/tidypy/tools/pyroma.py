@@ -48,6 +48,8 @@ TIDYPY_ISSUES = {
 
 
 class PyromaIssue(Issue):
+    __slots__ = ()
+
     tool = 'pyroma'
 
 
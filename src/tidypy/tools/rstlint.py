@@ -11,6 +11,7 @@ from docutils.utils import Reporter
 from restructuredtext_lint import lint
 
 from .base import Tool, Issue, AccessIssue, UnknownIssue, ToolIssue
+from ..util import get_distribution_version
 
 
 class DummyDirective(Directive):
@@ -30,6 +31,8 @@ dummy_role.content = True
 
 
 class RstLintIssue(Issue):
+    __slots__ = ()
+
     tool = 'rstlint'
 
     @property
@@ -45,6 +48,17 @@ class RstLintTool(Tool):
     reStructuredText files.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return ','.join([
+            get_distribution_version('restructuredtext-lint'),
+            get_distribution_version('docutils'),
+        ])
+
     @classmethod
     def get_default_config(cls):
         config = Tool.get_default_config()
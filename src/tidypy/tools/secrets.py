@@ -6,9 +6,12 @@ from detect_secrets.core.plugins.util import \
 from detect_secrets.settings import transient_settings
 
 from .base import Tool, Issue, AccessIssue, UnknownIssue
+from ..util import get_distribution_version
 
 
 class DetectSecretsIssue(Issue):
+    __slots__ = ()
+
     tool = 'secrets'
     pylint_type = 'W'
 
@@ -24,6 +27,14 @@ class DetectSecretsTool(Tool):
     embedded in your codebase.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('detect-secrets')
+
     @classmethod
     def get_all_codes(cls):
         return [
@@ -1,14 +1,18 @@
 
+import multiprocessing
+
 from pathlib import Path
 
 from vulture import Vulture, noqa
 from vulture.utils import VultureInputException
 
 from .base import PythonTool, Issue, ParseIssue, AccessIssue
-from ..util import parse_python_file
+from ..util import parse_python_file, get_file_shards, read_file
 
 
 class VultureIssue(Issue):
+    __slots__ = ()
+
     tool = 'vulture'
     pylint_type = 'R'
 
@@ -23,6 +27,17 @@ class TidyPyVulture(Vulture):
         ('unused-attribute', 'Unused attribute {entity}', 'unused_attrs')
     )
 
+    # The collections of the definitions found in the scanned files.
+    DEFINITIONS = (
+        'defined_attrs',
+        'defined_classes',
+        'defined_funcs',
+        'defined_imports',
+        'defined_methods',
+        'defined_props',
+        'defined_vars',
+    )
+
     def __init__(self, config):
         ignore_names = config['options']['ignore-names']
         if isinstance(ignore_names, str):
@@ -48,9 +63,46 @@ class TidyPyVulture(Vulture):
                 filename='VultureWhitelist',
             )
 
-        for filepath in finder.files(self.config['filters']):
+        files = list(finder.files(self.config['filters']))
+        shards = get_file_shards(files, self.config['options']['jobs'])
+        if len(shards) < 2:
+            self.scan_files(files)
+            return
+
+        # Only finding out which definitions are never used needs to see every
+        # file at once, so the files are scanned concurrently and what was
+        # found in them is combined afterwards.
+        with multiprocessing.Pool(len(shards)) as pool:
+            partials = pool.starmap(
+                _scan_shard,
+                [(self.config, shard) for shard in shards],
+            )
+        for partial in partials:
+            self.merge_partial(partial)
+
+        # Put the definitions and issues back in the order the files would
+        # have been scanned in serially, as that's the order the unused
+        # definitions are reported in.
+        order = {filepath: idx for idx, filepath in enumerate(files)}
+        for name in self.DEFINITIONS:
+            getattr(self, name).sort(
+                key=lambda item: order.get(str(item.filename), -1),
+            )
+        self._tidypy_issues.sort(
+            key=lambda issue: order.get(issue.filename, -1),
+        )
+
+    def scan_files(self, files):
+        """
+        Scans the specified files for definitions and the names they use.
+
+        :param files: the paths to the files
+        :type files: list(str)
+        """
+
+        for filepath in files:
             try:
-                source = finder.read_file(filepath)
+                source = read_file(filepath)
             except VultureInputException as exc:
                 self._tidypy_issues.append(ParseIssue(exc, filepath))
                 continue
@@ -75,6 +127,36 @@ class TidyPyVulture(Vulture):
         else:
             self.visit(node)
 
+    def get_partial(self):
+        """
+        Produces the definitions, used names, and issues found in the files
+        scanned so far, in a form that can be sent to another process and
+        combined with those of other scans using ``merge_partial()``.
+
+        :rtype: dict
+        """
+
+        partial = {
+            name: list(getattr(self, name))
+            for name in self.DEFINITIONS
+        }
+        partial['used_names'] = set(self.used_names)
+        partial['issues'] = list(self._tidypy_issues)
+        return partial
+
+    def merge_partial(self, partial):
+        """
+        Adds the results of another scan (see ``get_partial()``) to this one.
+
+        :param partial: the results of the other scan
+        :type partial: dict
+        """
+
+        for name in self.DEFINITIONS:
+            getattr(self, name).extend(partial[name])
+        self.used_names.update(partial['used_names'])
+        self._tidypy_issues.extend(partial['issues'])
+
     def get_issues(self):
         issues = []
         min_confidence = self.config['options']['min-confidence']
@@ -102,6 +184,10 @@ class VultureTool(PythonTool):
     Vulture finds unused code in Python programs.
     """
 
+    @classmethod
+    def can_be_profiled_per_file(cls):
+        return False
+
     @classmethod
     def get_default_config(cls):
         config = PythonTool.get_default_config()
@@ -110,6 +196,7 @@ class VultureTool(PythonTool):
             'ignore-decorators': None,
             'min-confidence': 0,
             'whitelist': [],
+            'jobs': 1,
         }
         return config
 
@@ -128,3 +215,8 @@ class VultureTool(PythonTool):
         self.vulture.scavenge(finder)
         return self.vulture.get_issues()
 
+
+def _scan_shard(config, files):
+    vulture = TidyPyVulture(config)
+    vulture.scan_files(files)
+    return vulture.get_partial()
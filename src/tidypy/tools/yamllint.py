@@ -5,9 +5,12 @@ from yamllint import linter
 from yamllint.config import YamlLintConfig
 
 from .base import Tool, Issue, AccessIssue, UnknownIssue
+from ..util import get_distribution_version
 
 
 class YamlLintIssue(Issue):
+    __slots__ = ('pylint_type',)
+
     tool = 'yamllint'
 
     def __init__(self, *args, **kwargs):
@@ -20,6 +23,14 @@ class YamlLintTool(Tool):
     The yamllint tool, as its name implies, is a linter for YAML files.
     """
 
+    @classmethod
+    def can_be_sharded(cls):
+        return True
+
+    @classmethod
+    def get_version(cls):
+        return get_distribution_version('yamllint')
+
     @classmethod
     def get_default_config(cls):
         config = Tool.get_default_config()
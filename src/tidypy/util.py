@@ -1,5 +1,7 @@
 
 import ast
+import math
+import os
 import re
 import sys
 import threading
@@ -9,8 +11,11 @@ from contextlib import contextmanager
 from io import StringIO
 
 import click
-import pkg_resources
-import requests
+
+try:
+    from importlib import metadata
+except ImportError:  # pragma: no cover
+    metadata = None
 
 
 def merge_list(list1, list2):
@@ -185,6 +190,11 @@ def _read_file(filepath):
             return target.read()
 
 
+def _get_file_stamp(filepath):
+    stat = os.stat(filepath)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 _FILE_CACHE = {}
 _FILE_CACHE_LOCK = threading.Lock()
 
@@ -194,17 +204,20 @@ def read_file(filepath):
     Retrieves the contents of the specified file.
 
     This function performs simple caching so that the same file isn't read more
-    than once per process.
+    than once per process (unless it has been modified since it was read).
 
     :param filepath: the file to read
     :type filepath: str
     :returns: str
     """
 
+    stamp = _get_file_stamp(filepath)
     with _FILE_CACHE_LOCK:
-        if filepath not in _FILE_CACHE:
-            _FILE_CACHE[filepath] = _read_file(filepath)
-    return _FILE_CACHE[filepath]
+        cached = _FILE_CACHE.get(filepath)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, _read_file(filepath))
+            _FILE_CACHE[filepath] = cached
+    return cached[1]
 
 
 _AST_CACHE = {}
@@ -216,30 +229,198 @@ def parse_python_file(filepath):
     Retrieves the AST of the specified file.
 
     This function performs simple caching so that the same file isn't read or
-    parsed more than once per process.
+    parsed more than once per process (unless it has been modified since it
+    was parsed).
 
     :param filepath: the file to parse
     :type filepath: str
     :returns: ast.AST
     """
 
+    stamp = _get_file_stamp(filepath)
     with _AST_CACHE_LOCK:
-        if filepath not in _AST_CACHE:
+        cached = _AST_CACHE.get(filepath)
+        if cached is None or cached[0] != stamp:
+            source = read_file(filepath)
+            cached = (stamp, ast.parse(source, filename=filepath))
+            _AST_CACHE[filepath] = cached
+    return cached[1]
+
+
+_TOKEN_CACHE = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _get_tokens(filepath):
+    stamp = _get_file_stamp(filepath)
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(filepath)
+        if cached is None or cached[0] != stamp:
             source = read_file(filepath)
-            _AST_CACHE[filepath] = ast.parse(source, filename=filepath)
-    return _AST_CACHE[filepath]
+            tokens = tuple(tokenize.generate_tokens(StringIO(source).readline))
+            comments = tuple(
+                token
+                for token in tokens
+                if token.type == tokenize.COMMENT
+            )
+            cached = (stamp, tokens, comments)
+            _TOKEN_CACHE[filepath] = cached
+    return cached
+
+
+def tokenize_python_file(filepath):
+    """
+    Retrieves the tokens of the specified file.
+
+    This function performs simple caching so that the same file isn't read or
+    tokenized more than once per process (unless it has been modified since
+    it was tokenized). Files that can't be tokenized raise the
+    ``tokenize.TokenError`` or ``SyntaxError`` produced by ``tokenize``.
+
+    :param filepath: the file to tokenize
+    :type filepath: str
+    :returns: tuple(tokenize.TokenInfo)
+    """
+
+    return _get_tokens(filepath)[1]
+
+
+def get_python_comments(filepath):
+    """
+    Retrieves the comment tokens of the specified file.
+
+    This function shares its cache with ``tokenize_python_file()``, so the
+    file is only tokenized once no matter which of the two is used.
+
+    :param filepath: the file to retrieve the comments of
+    :type filepath: str
+    :returns: tuple(tokenize.TokenInfo)
+    """
+
+    return _get_tokens(filepath)[2]
+
+
+def get_distribution_version(name):
+    """
+    Retrieves the version of the specified Python distribution that is
+    installed in the current environment.
+
+    :param name: the name of the distribution
+    :type name: str
+    :returns: str
+    """
+
+    if metadata is None:  # pragma: no cover
+        # Python 3.7
+        import pkg_resources  # noqa: import-outside-toplevel
+        return pkg_resources.get_distribution(name).version
+    return metadata.version(name)
 
 
-_REQUESTS = requests.Session()
-_REQUESTS.headers.update({
-    'User-Agent': 'TidyPy/%s' % (
-        pkg_resources.get_distribution('tidypy').version,
-    ),
-})
+# The files that describe the CPU quota of the process's control group, with
+# cgroups v2 and v1.
+CGROUP_CPU_MAX = '/sys/fs/cgroup/cpu.max'
+CGROUP_CPU_QUOTA = '/sys/fs/cgroup/cpu/cpu.cfs_quota_us'
+CGROUP_CPU_PERIOD = '/sys/fs/cgroup/cpu/cpu.cfs_period_us'
+
+
+def _read_cgroup_file(path):
+    try:
+        with open(path, 'r') as cgroup_file:
+            return cgroup_file.read().split()
+    except (EnvironmentError, ValueError):
+        return []
+
+
+def get_cgroup_cpu_quota():
+    """
+    Determines how many CPUs' worth of time the control group of the current
+    process is allowed to use (e.g., when running in a container with a CPU
+    limit). Returns ``None`` if there is no such limit.
+
+    :rtype: float
+    """
+
+    values = _read_cgroup_file(CGROUP_CPU_MAX)
+    if not values:
+        values = _read_cgroup_file(CGROUP_CPU_QUOTA) \
+            + _read_cgroup_file(CGROUP_CPU_PERIOD)
+
+    try:
+        quota, period = int(values[0]), int(values[1])
+    except (IndexError, ValueError):
+        # No files, or the quota is "max" (unlimited).
+        return None
+    if quota <= 0 or period <= 0:
+        return None
+    return quota / period
+
+
+def get_available_cpus():
+    """
+    Determines the number of CPUs the current process can make use of, taking
+    into account the CPUs it is allowed to run on and the CPU quota of its
+    control group.
+
+    :rtype: int
+    """
+
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover
+        # Not available on Windows or macOS.
+        cpus = os.cpu_count() or 1
+
+    quota = get_cgroup_cpu_quota()
+    if quota:
+        cpus = min(cpus, int(math.ceil(quota)))
+
+    return max(1, cpus)
+
+
+def get_file_shards(files, jobs):
+    """
+    Divides a list of files into batches of roughly equal size that can be
+    analyzed concurrently.
+
+    :param files: the paths to the files
+    :type files: list(str)
+    :param jobs: the maximum number of batches to produce
+    :type jobs: int
+    :rtype: list(list(str))
+    """
+
+    jobs = max(1, min(jobs, len(files)))
+    if jobs == 1:
+        return [files] if files else []
+
+    def get_size(filepath):
+        try:
+            return os.path.getsize(filepath)
+        except EnvironmentError:
+            return 0
+
+    shards = [[] for _ in range(jobs)]
+    sizes = [0] * jobs
+    for filepath in sorted(files, key=get_size, reverse=True):
+        idx = sizes.index(min(sizes))
+        shards[idx].append(filepath)
+        sizes[idx] += get_size(filepath)
+
+    return shards
 
 
 def get_requests():
     """Retrieves a ``requests`` object to use within TidyPy."""
 
-    return _REQUESTS
-
+    # pylint: disable=protected-access
+
+    if not hasattr(get_requests, '_SESSION'):
+        import requests  # noqa: import-outside-toplevel
+        get_requests._SESSION = requests.Session()
+        get_requests._SESSION.headers.update({
+            'User-Agent': 'TidyPy/%s' % (
+                get_distribution_version('tidypy'),
+            ),
+        })
+    return get_requests._SESSION
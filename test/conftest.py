@@ -0,0 +1,72 @@
+
+import pytest
+
+from tidypy import execute_tools, get_default_config, get_tools, Finder
+
+
+PROJECT = 'test/project1'
+
+
+def get_issue_keys(issues):
+    return [
+        (issue.filename, issue.line, issue.character, issue.code)
+        for issue in issues
+    ]
+
+
+def get_collector_keys(collector):
+    return sorted(
+        (issue.tool, issue.code, issue.filename, issue.line, issue.character or 0, issue.message)
+        for issue in collector.get_issues()
+    )
+
+
+@pytest.fixture
+def issue_keys():
+    return get_issue_keys
+
+
+@pytest.fixture
+def collector_keys():
+    return get_collector_keys
+
+
+def _check_jobs(tool, options=None, jobs=2):
+    cfg = get_default_config()
+    cfg['result-cache'] = False
+    for name in get_tools():
+        cfg[name]['use'] = name == tool
+    cfg[tool]['options'].update(options or {})
+    finder = Finder(PROJECT, cfg)
+    tool_class = get_tools()[tool]
+
+    expected = tool_class(cfg[tool]).execute(finder)
+    assert expected
+    serial = execute_tools(cfg, PROJECT)
+    assert not [
+        issue
+        for issue in serial.get_issues()
+        if issue.code == 'tool'
+    ]
+
+    cfg[tool]['options']['jobs'] = jobs
+    actual = tool_class(cfg[tool]).execute(finder)
+    assert get_issue_keys(actual) == get_issue_keys(expected)
+
+    # Tools executed by execute_tools() are given a Finder that's wrapped to
+    # profile them, which has to make it to their jobs too.
+    parallel = execute_tools(cfg, PROJECT)
+    assert get_collector_keys(parallel) == get_collector_keys(serial)
+
+    return expected
+
+
+@pytest.fixture
+def check_jobs():
+    """
+    Checks that a tool reports the same issues on the test project with
+    several jobs as it does serially, both when it's executed on its own and
+    through execute_tools(), and returns the issues it reported.
+    """
+
+    return _check_jobs
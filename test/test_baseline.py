@@ -0,0 +1,88 @@
+import pytest
+
+from tidypy import Collector, Issue, get_default_config
+from tidypy.baseline import Baseline, BaselineError
+
+
+class FooIssue(Issue):
+    tool = 'foo'
+
+class BarIssue(Issue):
+    tool = 'bar'
+
+
+def test_round_trip(tmpdir):
+    module = tmpdir.join('module.py')
+    module.write('import os\nimport sys\n')
+    filename = str(module)
+
+    issues = [
+        FooIssue('unused', 'os is unused', filename, 1),
+        FooIssue('unused', 'sys is unused', filename, 2),
+        BarIssue('unused', 'os is unused', filename, 1),
+    ]
+    baseline = Baseline.from_issues(str(tmpdir), issues)
+    assert len(baseline) == 3
+
+    baseline_file = str(tmpdir.join('baseline'))
+    baseline.save(baseline_file)
+    loaded = Baseline.load(baseline_file, str(tmpdir))
+    assert loaded.fingerprints == baseline.fingerprints
+    assert loaded.filter(issues) == []
+
+
+def test_line_shifts(tmpdir):
+    module = tmpdir.join('module.py')
+    module.write('import os\n')
+    filename = str(module)
+
+    baseline = Baseline.from_issues(str(tmpdir), [
+        FooIssue('unused', 'os is unused', filename, 1),
+    ])
+
+    module.write('import re\n\n  import  os\n')
+    new_issue = FooIssue('unused', 're is unused', filename, 1)
+    issues = [new_issue, FooIssue('unused', 'os is unused', filename, 3)]
+    assert baseline.filter(issues) == [new_issue]
+
+
+def test_counts(tmpdir):
+    module = tmpdir.join('module.py')
+    module.write('x = 1; y = 2\n')
+    filename = str(module)
+
+    baseline = Baseline.from_issues(str(tmpdir), [
+        FooIssue('semicolon', 'too many', filename, 1),
+    ])
+    issues = [
+        FooIssue('semicolon', 'too many', filename, 1),
+        FooIssue('semicolon', 'too many', filename, 1),
+    ]
+    assert baseline.filter(issues) == issues[1:]
+
+
+def test_bad_file(tmpdir):
+    baseline_file = tmpdir.join('baseline')
+    baseline_file.write('this is not a baseline')
+    with pytest.raises(BaselineError):
+        Baseline.load(str(baseline_file), str(tmpdir))
+
+    with pytest.raises(BaselineError):
+        Baseline.load(str(tmpdir.join('nothere')), str(tmpdir))
+
+
+def test_collector(tmpdir):
+    module = tmpdir.join('module.py')
+    module.write('import os\nimport sys\n')
+    filename = str(module)
+
+    old_issue = FooIssue('unused', 'os is unused', filename, 1)
+    new_issue = FooIssue('unused', 'sys is unused', filename, 2)
+
+    collector = Collector(get_default_config())
+    collector.add_issues([old_issue, new_issue])
+    collector.set_baseline(Baseline.from_issues(str(tmpdir), [old_issue]))
+    assert collector.get_issues() == [new_issue]
+
+    collector.set_baseline(None)
+    assert collector.issue_count() == 2
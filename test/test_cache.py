@@ -0,0 +1,215 @@
+import os
+
+from tidypy import execute_tools, get_default_config, get_tools, \
+    purge_result_cache, TidyPyIssue, ToolIssue
+from tidypy.cache import ResultCache, get_result_cache_path, \
+    open_result_cache, load_tool_durations, store_tool_durations
+
+
+def test_get_put(tmpdir):
+    cache = ResultCache(str(tmpdir.join('results.sqlite')))
+
+    assert cache.get(['foo', 'bar']) == {}
+
+    cache.put({
+        'foo': [TidyPyIssue('code1', 'message 1', 'test/file.py', 2)],
+        'bar': [],
+    })
+    actual = cache.get(['foo', 'bar', 'baz'])
+    assert sorted(actual.keys()) == ['bar', 'foo']
+    assert actual['bar'] == []
+    assert len(actual['foo']) == 1
+    assert actual['foo'][0].code == 'code1'
+    assert actual['foo'][0].line == 2
+
+    cache.close()
+
+
+def test_get_key(tmpdir):
+    cache = ResultCache(str(tmpdir.join('results.sqlite')))
+    target = tmpdir.join('file.py')
+    target.write('foo = 1\n')
+
+    cfg = get_default_config()
+    version = get_tools()['pyflakes'].get_version()
+    signature = cache.get_signature('pyflakes', version, cfg['pyflakes'])
+    assert signature
+    assert cache.get_signature('pylint', None, cfg['pylint']) is None
+
+    cfg['pyflakes']['disabled'] = ['UnusedImport']
+    assert signature != cache.get_signature('pyflakes', version, cfg['pyflakes'])
+
+    key = cache.get_key(signature, str(target))
+    assert key
+    assert key == cache.get_key(signature, str(target))
+    assert cache.get_key(signature, str(tmpdir.join('missing.py'))) is None
+
+    cache.close()
+
+
+def test_store_results(tmpdir):
+    cache = ResultCache(str(tmpdir.join('results.sqlite')))
+
+    cache.store_results(
+        {'file1.py': 'key1', 'file2.py': 'key2'},
+        [
+            TidyPyIssue('code1', 'message 1', 'file1.py', 2),
+            TidyPyIssue('code2', 'message 2', 'file3.py', 2),
+        ],
+    )
+    actual = cache.get(['key1', 'key2'])
+    assert [issue.code for issue in actual['key1']] == ['code1']
+    assert actual['key2'] == []
+
+    cache.store_results(
+        {'file4.py': 'key4'},
+        [
+            TidyPyIssue('code1', 'message 1', 'file4.py', 2),
+            ToolIssue('failed', str(tmpdir)),
+        ],
+    )
+    assert cache.get(['key4']) == {}
+
+    cache.close()
+
+
+def test_prune(tmpdir):
+    cache = ResultCache(str(tmpdir.join('results.sqlite')))
+
+    for idx in range(10):
+        cache.put({
+            'key%s' % (idx,): [TidyPyIssue('code', 'message', 'file.py', idx)],
+        })
+    cache.get(['key0'])
+
+    cache.prune(10 ** 9)
+    assert len(cache.get(['key%s' % (idx,) for idx in range(10)])) == 10
+
+    size = len(cache._connection.execute(
+        'SELECT issues FROM results WHERE key = ?', ('key1',)
+    ).fetchone()[0])
+    cache.get(['key0'])
+    cache.prune(size * 3)
+    remaining = cache.get(['key%s' % (idx,) for idx in range(10)])
+    assert len(remaining) <= 3
+    assert 'key0' in remaining
+
+    cache.close()
+
+
+def test_purge(tmpdir, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+
+    ResultCache().close()
+    assert os.path.exists(get_result_cache_path())
+
+    purge_result_cache()
+    assert not os.path.exists(get_result_cache_path())
+
+    purge_result_cache()
+
+
+def test_tool_durations(tmpdir, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+    project = str(tmpdir.join('project'))
+    assert load_tool_durations(project) == {}
+
+    store_tool_durations(project, {
+        'pylint': {'wall_time': 10.0, 'files': 10},
+        'pyroma': {'wall_time': 2.0, 'files': 0},
+    })
+    assert load_tool_durations(project) == {
+        'pylint': {'time': 10.0, 'files': 10},
+        'pyroma': {'time': 2.0, 'files': 0},
+    }
+
+    # Only half the files were analyzed, at half the rate.
+    store_tool_durations(project, {
+        'pylint': {'wall_time': 10.0, 'files': 5},
+        'pyroma': {'wall_time': 4.0, 'files': 0},
+    })
+    assert load_tool_durations(project) == {
+        'pylint': {'time': 7.5, 'files': 5},
+        'pyroma': {'time': 3.0, 'files': 0},
+    }
+
+    assert load_tool_durations(str(tmpdir.join('other'))) == {}
+
+
+def test_execute_tools(tmpdir, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir.mkdir('cache')))
+    project_dir = tmpdir.mkdir('project')
+    module1 = project_dir.join('module1.py')
+    module1.write('import os\n')
+    module2 = project_dir.join('module2.py')
+    module2.write('import sys\n')
+
+    cfg = get_default_config()
+    for tool in get_tools():
+        cfg[tool]['use'] = tool == 'pyflakes'
+
+    def get_codes():
+        collector = execute_tools(cfg, str(project_dir))
+        return sorted(
+            (os.path.basename(issue.filename), issue.message)
+            for issue in collector.get_issues()
+        )
+
+    expected = [
+        ('module1.py', "'os' imported but unused"),
+        ('module2.py', "'sys' imported but unused"),
+    ]
+    assert get_codes() == expected
+
+    # The results of each module, plus the noqa table of each module.
+    cache = ResultCache()
+    assert cache._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0] == 4
+    assert cache.load_noqa([str(module1), str(module2)]) == {
+        str(module1): {},
+        str(module2): {},
+    }
+    cache.close()
+
+    assert get_codes() == expected
+
+    module2.write('import sys\nimport re\n')
+    expected = sorted(expected + [('module2.py', "'re' imported but unused")])
+    assert get_codes() == expected
+
+    cfg['result-cache'] = False
+    assert get_codes() == expected
+
+
+def test_execute_tools_unusable(tmpdir, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir.mkdir('cache')))
+    project_dir = tmpdir.mkdir('project')
+    project_dir.join('module1.py').write('import os\n')
+
+    # A database that sqlite can't make sense of.
+    with open(get_result_cache_path(), 'wb') as corrupt:
+        corrupt.write(b'this is not a database' * 100)
+    assert open_result_cache() is None
+
+    cfg = get_default_config()
+    for tool in get_tools():
+        cfg[tool]['use'] = tool == 'pyflakes'
+    collector = execute_tools(cfg, str(project_dir))
+    assert [issue.message for issue in collector.get_issues()] == [
+        "'os' imported but unused",
+    ]
+
+
+def test_get_corrupt(tmpdir):
+    cache = ResultCache(str(tmpdir.join('results.sqlite')))
+    cache.put({'foo': [], 'bar': []})
+    with cache._connection:
+        cache._connection.execute(
+            "UPDATE results SET issues = X'00' WHERE key = 'foo'",
+        )
+
+    assert cache.get(['foo', 'bar']) == {'bar': []}
+    assert cache._connection.execute(
+        'SELECT key FROM results',
+    ).fetchall() == [('bar',)]
+
+    cache.close()
@@ -1,5 +1,8 @@
 
+import json
+import os
 import subprocess
+import sys
 
 import pytest
 
@@ -39,6 +42,48 @@ def test_check(tmpdir):
     assert result.output == ''
 
 
+def test_baseline(tmpdir):
+    project_dir = tmpdir.mkdir('project')
+    project_dir.join('module.py').write('import os\n')
+    baseline_file = text_type(tmpdir.join('baseline'))
+    args = ['check', text_type(project_dir), '--disable-progress', '--disable-result-cache', '--tool=pyflakes', '--report=pycodestyle']
+
+    runner = CliRunner()
+
+    result = runner.invoke(main, args + ['--write-baseline=%s' % (baseline_file,)])
+    assert result.exit_code == 0
+    assert result.output == ''
+
+    project_dir.join('module.py').write('import sys\n\nimport os\n')
+    result = runner.invoke(main, args + ['--baseline=%s' % (baseline_file,)])
+    assert result.exit_code == 1
+    assert "'sys' imported but unused" in result.output
+    assert "'os' imported but unused" not in result.output
+
+    tmpdir.join('baseline').write('junk')
+    result = runner.invoke(main, args + ['--baseline=%s' % (baseline_file,)])
+    assert result.exit_code == 1
+    assert 'is not a TidyPy baseline' in result.output
+
+
+def test_profile(tmpdir):
+    profile_file = tmpdir.join('profile.json')
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['check', 'test/project1', '--disable-progress', '--disable-result-cache', '--tool=pyflakes', '--report=null', '--profile=%s' % (text_type(profile_file),)])
+    assert result.exit_code == 1
+    assert result.output == ''
+
+    profile = json.loads(profile_file.read())
+    assert list(profile['tools']) == ['pyflakes']
+    assert profile['tools']['pyflakes']['files'] == 8
+    assert 'worker_peak_rss' in profile['tools']['pyflakes']
+    assert 'project1/module1.py' in [
+        timing['filename']
+        for timing in profile['tools']['pyflakes']['slowest_files']
+    ]
+
+
 def test_list_codes():
     runner = CliRunner()
 
@@ -100,6 +145,14 @@ def test_purge_config_cache():
     assert result.exit_code == 0
 
 
+def test_purge_result_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+    runner = CliRunner()
+
+    result = runner.invoke(main, ['purge-result-cache'])
+    assert result.exit_code == 0
+
+
 def executable_exists(executable):
     try:
         subprocess.call([executable])
@@ -137,6 +190,23 @@ def test_vcs_git(tmpdir):
     assert result.exit_code == 0
 
 
+@pytest.mark.skipif(not executable_exists('git'), reason='git not available')
+def test_check_changed(tmpdir):
+    git_dir = text_type(tmpdir.mkdir('git'))
+    subprocess.call(['git', 'init', git_dir])
+    tmpdir.join('git').join('module.py').write('import os\n')
+
+    runner = CliRunner()
+
+    result = runner.invoke(main, ['check', git_dir, '--changed', '--disable-progress', '--disable-result-cache', '--tool=pyflakes', '--report=pycodestyle'])
+    assert result.exit_code == 1
+    assert 'module.py' in result.output
+
+    result = runner.invoke(main, ['check', git_dir, '--since=doesntexist', '--disable-progress', '--report=null'])
+    assert result.exit_code == 1
+    assert 'Could not retrieve the changed files' in result.output
+
+
 @pytest.mark.skipif(not executable_exists('hg'), reason='hg not available')
 def test_vcs_mercurial(tmpdir):
     hg_dir = text_type(tmpdir.mkdir('mercurial'))
@@ -194,3 +264,54 @@ def test_extensions():
     assert csv_result.output != json_result.output
     assert csv_result.output != yaml_result.output
 
+
+
+def test_lazy_tools():
+    output = subprocess.check_output([
+        sys.executable,
+        '-c',
+        'import sys\n'
+        'from tidypy.cli import main\n'
+        'try:\n'
+        '    main(["--version"])\n'
+        'except SystemExit:\n'
+        '    pass\n'
+        'print(",".join(sorted(\n'
+        '    name for name in ("pylint", "astroid", "tidypy.tools.pylint", "pkg_resources")\n'
+        '    if name in sys.modules\n'
+        ')))\n',
+    ], universal_newlines=True)
+    assert output.splitlines()[-1] == ''
+
+
+def test_lazy_tool_metadata(tmpdir):
+    env = dict(os.environ)
+    env['XDG_CACHE_HOME'] = str(tmpdir)
+    script = (
+        'import sys\n'
+        'from tidypy.config import get_default_config\n'
+        'from tidypy.cli import validate_tools\n'
+        'cfg = get_default_config()\n'
+        'assert cfg["pylint"]["use"]\n'
+        'validate_tools(None, None, ["pyflakes"])\n'
+        'print(",".join(sorted(\n'
+        '    name for name in ("pylint", "tidypy.tools.pylint", "tidypy.tools.pyflakes")\n'
+        '    if name in sys.modules\n'
+        ')))\n'
+    )
+
+    # The first invocation has to import the tools to learn about them.
+    output = subprocess.check_output(
+        [sys.executable, '-c', script],
+        env=env,
+        universal_newlines=True,
+    )
+    assert 'tidypy.tools.pylint' in output.splitlines()[-1]
+
+    # Later ones only import the tools that are going to be used.
+    output = subprocess.check_output(
+        [sys.executable, '-c', script],
+        env=env,
+        universal_newlines=True,
+    )
+    assert output.splitlines()[-1] == 'tidypy.tools.pyflakes'
@@ -1,6 +1,11 @@
+import pickle
 import random
 
-from tidypy import Collector, Issue, TidyPyIssue, get_default_config
+from threading import Thread
+
+from tidypy import Collector, Issue, TidyPyIssue, ToolIssue, \
+    get_default_config
+from tidypy.collector import NOQA_ALL, parse_noqa
 
 
 class FooIssue(Issue):
@@ -10,6 +15,45 @@ class BarIssue(Issue):
     tool = 'bar'
 
 
+def test_issue_pickle():
+    issue = TidyPyIssue('test', 'test message', 'test/file.ext', 2, 3)
+    assert not hasattr(issue, '__dict__')
+    actual = pickle.loads(pickle.dumps(issue))
+    assert type(actual) is TidyPyIssue
+    assert repr(actual) == repr(issue)
+    assert actual.pylint_type == 'F'
+
+    issue = ToolIssue('test message', 'test/project')
+    actual = pickle.loads(pickle.dumps(issue))
+    assert actual.pylint_type == 'E'
+    assert actual.filename == 'test/project'
+
+    issue = FooIssue('test', 'test message', 'test/file.ext', 2)
+    issue.extra = 'foo'
+    actual = pickle.loads(pickle.dumps(issue))
+    assert repr(actual) == repr(issue)
+    assert actual.extra == 'foo'
+
+
+class PartialIssue(Issue):
+    tool = 'partial'
+
+    def __init__(self, message):
+        self.message = message
+
+
+def test_issue_defaults():
+    issue = PartialIssue('test message')
+    assert issue.message == 'test message'
+    assert issue.code is None
+    assert issue.filename is None
+    assert issue.line is None
+    assert issue.character is None
+
+    actual = pickle.loads(pickle.dumps(issue))
+    assert repr(actual) == repr(issue)
+
+
 def test_basics():
     collector = Collector(get_default_config())
     assert collector.get_issues() == []
@@ -27,6 +71,28 @@ def test_basics():
     assert collector.issue_count(include_unclean=True) == 3
 
 
+def test_get_issues_filenames():
+    cfg = get_default_config()
+    collector = Collector(cfg)
+    issue1 = FooIssue('test', 'test message', 'test/file.ext', 5)
+    issue2 = FooIssue('test', 'test message', 'test/file.ext', 2)
+    issue3 = BarIssue('test', 'test message', 'test/file2.ext', 2)
+    issue4 = TidyPyIssue('test', 'test message', 'test/file3.ext', 2)
+    collector.add_issues([issue1, issue2, issue3, issue4])
+
+    assert collector.get_issues(filenames=['test/file.ext']) == [issue2, issue1]
+    assert collector.get_issues(filenames=['test/file2.ext', 'test/file.ext']) == [issue2, issue1, issue3]
+    assert collector.get_issues(filenames=['test/nothere.ext']) == []
+    assert collector.get_grouped_issues(filenames=['test/file3.ext', 'test/file2.ext']) == {
+        'test/file2.ext': [issue3],
+        'test/file3.ext': [issue4],
+    }
+
+    cfg['disabled'] = ['test']
+    assert collector.get_issues(filenames=['test/file3.ext']) == []
+    assert collector.get_issues(filenames=['test/file3.ext'], include_unclean=True) == [issue4]
+
+
 def test_disabled():
     cfg = get_default_config()
     cfg['disabled'] = ['foo']
@@ -214,6 +280,61 @@ def test_merging_dupes():
     assert collector.issue_count(include_unclean=True) == 5
 
 
+def test_memoized_views():
+    collector = Collector(get_default_config())
+    issue1 = FooIssue('test', 'test message', 'test/file.ext', 10)
+    issue2 = FooIssue('test', 'test message', 'test/file.ext', 9)
+    collector.add_issues([issue1, issue2])
+
+    issues = collector.get_issues()
+    assert issues == [issue2, issue1]
+    issues.append(issue1)
+    assert collector.get_issues() == [issue2, issue1]
+
+    grouped = collector.get_grouped_issues()
+    assert grouped == {'test/file.ext': [issue2, issue1]}
+    grouped['test/file.ext'].pop()
+    assert collector.get_grouped_issues() == {'test/file.ext': [issue2, issue1]}
+
+    issue3 = BarIssue('test', 'test message', 'test/file.ext', 9)
+    collector.add_issues(issue3)
+    assert collector.get_issues() == [issue3, issue2, issue1]
+    assert collector.get_grouped_issues() == {'test/file.ext': [issue3, issue2, issue1]}
+
+    # Groupings by other functions reflect the issues added since.
+    assert collector.get_grouped_issues(lambda x: x.tool) == {'bar': [issue3], 'foo': [issue2, issue1]}
+    issue4 = BarIssue('test', 'test message', 'test/file.ext', 11)
+    collector.add_issues(issue4)
+    assert collector.get_grouped_issues(lambda x: x.tool) == {'bar': [issue3, issue4], 'foo': [issue2, issue1]}
+
+
+def test_concurrent_views():
+    collector = Collector(get_default_config())
+    errors = []
+
+    def produce():
+        for line in range(200):
+            collector.add_issues(FooIssue('test', 'test message', 'test/file.ext', line))
+
+    def consume():
+        try:
+            for _ in range(200):
+                collector.get_issues()
+                collector.get_grouped_issues()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [Thread(target=produce)] + [Thread(target=consume) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert collector.get_grouped_issues() == {'test/file.ext': collector.get_issues()}
+    assert collector.issue_count() == 200
+
+
 def test_noqa(tmpdir):
     project_dir = tmpdir.mkdir('noqa')
     py_file = project_dir.join('file.py')
@@ -246,6 +367,42 @@ def test_noqa(tmpdir):
     assert collector.issue_count(include_unclean=True) == len(good_issues + filtered_issues)
 
 
+def test_add_noqa():
+    collector = Collector(get_default_config())
+    issues = [
+        FooIssue('test1', 'test message', 'test/file.py', 1),
+        FooIssue('test2', 'test message', 'test/file.py', 2),
+        FooIssue('test3', 'test message', 'test/file.py', 3),
+        BarIssue('test4', 'test message', 'test/file.py', 3),
+        FooIssue('test5', 'test message', 'test/file.py', 4),
+    ]
+    collector.add_issues(issues)
+    assert collector.issue_count() == 5
+
+    table = parse_noqa('a\nb  # noqa\nc  # noqa: test1, @bar\nd  # noqa: foo:test5')
+    assert table == {
+        2: NOQA_ALL,
+        3: (frozenset(['test1']), frozenset(['bar']), frozenset()),
+        4: (frozenset(), frozenset(), frozenset([('foo', 'test5')])),
+    }
+    collector.add_noqa({'test/file.py': table})
+    assert collector.get_issues() == [issues[0], issues[2]]
+    assert collector.get_noqa() == {'test/file.py': table}
+    assert collector.get_noqa(['test/other.py']) == {}
+
+    collector.add_noqa({'test/file.py': parse_noqa('# noqa: foo:test1')})
+    assert collector.get_issues() == [issues[1], issues[3], issues[2], issues[4]]
+
+
+def test_parse_noqa_separators():
+    table = parse_noqa('a  # noqa: test1 test2\nb  # noqa: test3 ,test4,  \nc  # noqa: test5\nd = 1')
+    assert table == {
+        1: (frozenset(['test1 test2']), frozenset(), frozenset()),
+        2: (frozenset(['test3', 'test4']), frozenset(), frozenset()),
+        3: (frozenset(['test5']), frozenset(), frozenset()),
+    }
+
+
 def test_noqa_disabled(tmpdir):
     project_dir = tmpdir.mkdir('noqa')
     py_file = project_dir.join('file.py')
@@ -17,7 +17,9 @@ from tidypy import (
     get_project_config,
     purge_config_cache,
     DoesNotExistError,
+    util,
 )
+from tidypy.cache import get_result_cache_path
 from tidypy.config import put_config_cache, get_config_cache
 
 
@@ -56,10 +58,12 @@ def test_get_reports():
         'csv',
         'custom',
         'json',
+        'jsonl',
         'null',
         'pycodestyle',
         'pylint',
         'pylint-parseable',
+        'sarif',
         'toml',
         'yaml',
     ])
@@ -94,10 +98,13 @@ def test_get_extenders():
 def test_get_default_config():
     actual = get_default_config()
     assert actual['exclude'] == []
+    assert actual['finder-snapshot'] == False
     assert actual['merge-issues'] == True
     assert isinstance(actual['workers'], int)
     assert actual['workers'] >= 1
-    assert actual['workers'] <= 4
+    assert actual['workers'] <= max(1, util.get_available_cpus() - 1)
+    assert actual['sharding'] == False
+    assert actual['shard-size'] == 50
     assert actual['disabled'] == []
     assert actual['noqa'] == True
     assert actual['extends'] == []
@@ -350,8 +357,13 @@ def test_purge_config_cache(tmpdir, monkeypatch):
     assert get_config_cache('foo') is None
     assert get_config_cache('bar') == {'bar': 1}
 
+    result_cache = get_result_cache_path()
+    with open(result_cache, 'w') as cache_file:
+        cache_file.write('results')
+
     purge_config_cache()
 
     assert get_config_cache('foo') is None
     assert get_config_cache('bar') is None
+    assert os.path.exists(result_cache)
 
@@ -1,8 +1,11 @@
 
+import os
+
 import six
 
 from tidypy import execute_tools, execute_reports, get_default_config, \
-    get_tools, Collector, QuietProgress
+    get_tools, get_tool_metadata, Collector, QuietProgress
+from tidypy.core import WorkerPool, order_units
 
 
 def test_execute_tools(capsys):
@@ -39,6 +42,26 @@ def test_execute_tools(capsys):
     assert err == ''
 
 
+def test_execute_tools_unusable(monkeypatch):
+    cfg = get_default_config()
+    cfg['result-cache'] = False
+    for tool in get_tools():
+        cfg[tool]['use'] = tool in ('pyflakes', 'pycodestyle')
+
+    # Whether or not a tool can be used is asked each time it's planned,
+    # rather than remembered along with the rest of its metadata.
+    assert 'can_be_used' not in get_tool_metadata()['pycodestyle']
+    monkeypatch.setattr(
+        get_tools()['pycodestyle'],
+        'can_be_used',
+        classmethod(lambda cls: False),
+    )
+
+    progress = QuietProgress()
+    execute_tools(cfg, 'test/project1', progress=progress)
+    assert ['pyflakes'] == sorted(progress.completed_tools)
+
+
 def test_execute_reports(capsys):
     cfg = get_default_config()
     cfg['requested_reports'] = [
@@ -58,3 +81,180 @@ def test_execute_reports(capsys):
     assert out == ''
     assert err == ''
 
+
+def test_execute_tools_sharding(collector_keys):
+    cfg = get_default_config()
+    for tool in get_tools():
+        cfg[tool]['use'] = tool in ('pyflakes', 'eradicate', 'yamllint', 'pyroma')
+    expected = execute_tools(cfg, 'test/project1')
+
+    cfg['sharding'] = True
+    cfg['shard-size'] = 1
+    progress = QuietProgress()
+    actual = execute_tools(cfg, 'test/project1', progress=progress)
+
+    assert collector_keys(expected) == collector_keys(actual)
+    assert [] == sorted(progress.current_tools)
+    assert ['eradicate', 'pyflakes', 'pyroma', 'yamllint'] == sorted(progress.completed_tools)
+
+
+def test_execute_tools_sharding_shared_files(collector_keys):
+    cfg = get_default_config()
+    cfg['result-cache'] = False
+    for tool in get_tools():
+        cfg[tool]['use'] = tool in ('pyflakes', 'pycodestyle', 'mccabe', 'jsonlint')
+    expected = execute_tools(cfg, 'test/project1')
+
+    cfg['sharding'] = True
+    cfg['shard-size'] = 2
+    progress = QuietProgress()
+    actual = execute_tools(cfg, 'test/project1', progress=progress)
+
+    assert collector_keys(expected) == collector_keys(actual)
+    assert [] == sorted(progress.current_tools)
+    assert ['jsonlint', 'mccabe', 'pycodestyle', 'pyflakes'] == sorted(progress.completed_tools)
+
+
+def test_execute_tools_jobs(collector_keys):
+    # The tools that check their files in several processes are given the
+    # Finder that's wrapped to profile them.
+    tools = ('bandit', 'pycodestyle', 'pydocstyle', 'pylint', 'vulture')
+    cfg = get_default_config()
+    cfg['result-cache'] = False
+    for tool in get_tools():
+        cfg[tool]['use'] = tool in tools
+    expected = execute_tools(cfg, 'test/project1')
+    assert not [
+        issue
+        for issue in expected.get_issues()
+        if issue.code == 'tool'
+    ]
+
+    for tool in tools:
+        cfg[tool]['options']['jobs'] = 3
+    actual = execute_tools(cfg, 'test/project1')
+
+    assert collector_keys(expected) == collector_keys(actual)
+
+
+def test_execute_tools_profile():
+    cfg = get_default_config()
+    cfg['result-cache'] = False
+    cfg['sharding'] = True
+    cfg['shard-size'] = 3
+    for tool in get_tools():
+        cfg[tool]['use'] = tool in ('pyflakes', 'jsonlint', 'pycodestyle')
+
+    progress = QuietProgress()
+    execute_tools(cfg, 'test/project1', progress=progress)
+
+    assert ['jsonlint', 'pycodestyle', 'pyflakes'] == sorted(progress.tool_profiles)
+    profile = progress.tool_profiles['pyflakes']
+    assert profile['files'] == 8
+    assert profile['wall_time'] > 0
+    assert profile['cpu_time'] > 0
+    assert len(profile['slowest_files']) == 8
+    times = [elapsed for _, elapsed in profile['slowest_files']]
+    assert times == sorted(times, reverse=True)
+    assert progress.tool_profiles['jsonlint']['files'] == 2
+
+    # pycodestyle retrieves all of its files before checking them.
+    profile = progress.tool_profiles['pycodestyle']
+    assert profile['files'] == 8
+    assert profile['slowest_files'] == []
+
+
+def test_order_units():
+    units = [
+        {'id': 0, 'files': None, 'tools': [{'name': 'pyroma'}]},
+        {'id': 1, 'files': ['a.py', 'b.py'], 'tools': [{'name': 'pyflakes'}]},
+        {'id': 2, 'files': ['c.py'], 'tools': [{'name': 'pyflakes'}, {'name': 'pycodestyle'}]},
+        {'id': 3, 'files': None, 'tools': [{'name': 'pylint'}]},
+        {'id': 4, 'files': None, 'tools': [{'name': 'unknown'}]},
+    ]
+    durations = {
+        'pyroma': {'time': 1.0, 'files': 0},
+        'pyflakes': {'time': 4.0, 'files': 4},
+        'pycodestyle': {'time': 1.0, 'files': 2},
+        'pylint': {'time': 10.0, 'files': 4},
+    }
+    assert [unit['id'] for unit in order_units(units, durations)] == [4, 3, 1, 2, 0]
+    assert [unit['id'] for unit in order_units(units, {})] == [0, 1, 2, 3, 4]
+
+
+def test_execute_tools_stream():
+    cfg = get_default_config()
+    cfg['result-cache'] = False
+    cfg['sharding'] = True
+    cfg['shard-size'] = 1
+    for tool in get_tools():
+        cfg[tool]['use'] = tool in ('pyflakes', 'pycodestyle', 'yamllint')
+
+    streamed = []
+    streamed_issues = []
+    def on_files_complete(collector, filenames):
+        streamed.extend(filenames)
+        streamed_issues.extend(collector.get_issues(filenames=filenames))
+
+    collector = execute_tools(cfg, 'test/project1', on_files_complete=on_files_complete)
+
+    assert len(streamed) == len(set(streamed))
+    assert streamed
+    issues = [
+        issue
+        for issue in collector.get_issues()
+        if issue.filename in streamed
+    ]
+    assert sorted(map(id, streamed_issues)) == sorted(map(id, issues))
+
+    # Nothing can be streamed until the whole-project tools complete.
+    cfg['pyroma']['use'] = True
+    streamed = []
+    def on_pyroma_complete(collector, filenames):
+        assert 'pyroma' in set(issue.tool for issue in collector.get_issues())
+        streamed.extend(filenames)
+    execute_tools(cfg, 'test/project1', on_files_complete=on_pyroma_complete)
+
+
+def test_execute_tools_pool(tmpdir, collector_keys):
+    cfg = get_default_config()
+    cfg['result-cache'] = False
+    for tool in get_tools():
+        cfg[tool]['use'] = tool in ('pyflakes', 'pycodestyle', 'pylint')
+    expected = execute_tools(cfg, 'test/project1')
+
+    project_dir = tmpdir.mkdir('project')
+    project_dir.join('module.py').write('import os\n')
+
+    with WorkerPool(2) as pool:
+        for _ in range(2):
+            actual = execute_tools(cfg, 'test/project1', pool=pool)
+            assert collector_keys(expected) == collector_keys(actual)
+
+            actual = execute_tools(cfg, str(project_dir), pool=pool)
+            assert set(issue.filename for issue in actual.get_issues()) == set([str(project_dir.join('module.py'))])
+
+
+def test_execute_tools_paths():
+    cfg = get_default_config()
+    cfg['result-cache'] = False
+    for tool in get_tools():
+        cfg[tool]['use'] = tool in ('pyflakes', 'yamllint', 'pylint')
+    paths = ['project1/module1.py', 'data/broken.yaml']
+
+    progress = QuietProgress()
+    collector = execute_tools(cfg, 'test/project1', progress=progress, paths=paths)
+    assert ['pyflakes', 'pylint', 'yamllint'] == sorted(progress.completed_tools)
+    files = set(issue.filename for issue in collector.get_issues())
+    assert sorted(os.path.relpath(f, 'test/project1') for f in files) == sorted(paths)
+    assert 'pylint' not in set(issue.tool for issue in collector.get_issues())
+
+    cfg['changed-project-tools'] = 'filter'
+    collector = execute_tools(cfg, 'test/project1', paths=paths)
+    issues = collector.get_issues()
+    assert 'pylint' in set(issue.tool for issue in issues)
+    files = set(issue.filename for issue in issues)
+    assert sorted(os.path.relpath(f, 'test/project1') for f in files) == sorted(paths)
+
+    collector = execute_tools(cfg, 'test/project1', paths=[])
+    assert collector.issue_count() == 0
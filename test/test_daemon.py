@@ -0,0 +1,189 @@
+import os
+import socket
+import stat
+import time
+
+from multiprocessing import Process
+
+import pytest
+
+from tidypy import execute_tools, get_tools
+from tidypy.config import get_project_config, override_config
+from tidypy.daemon import DaemonServer, DaemonClient, DaemonError, \
+    is_daemon_supported
+
+
+pytestmark = pytest.mark.skipif(
+    not is_daemon_supported(),
+    reason='Unix sockets are not available',
+)
+
+
+def _start_daemon(socket_path, workers):
+    server = Process(
+        target=DaemonServer(
+            socket_path=socket_path,
+            workers=workers,
+        ).serve_forever,
+    )
+    server.start()
+
+    client = DaemonClient(socket_path=socket_path)
+    for _ in range(100):
+        try:
+            client.ping()
+        except DaemonError:
+            time.sleep(0.1)
+        else:
+            break
+
+    return server, client
+
+
+@pytest.fixture
+def daemon(tmpdir):
+    socket_path = str(tmpdir.join('daemon.sock'))
+    server, client = _start_daemon(socket_path, 2)
+
+    yield client
+
+    client.stop()
+    server.join(30)
+    assert not os.path.exists(socket_path)
+
+
+def test_not_running(tmpdir):
+    client = DaemonClient(socket_path=str(tmpdir.join('nothere.sock')))
+    with pytest.raises(DaemonError):
+        client.ping()
+
+
+def test_socket_permissions(daemon):
+    mode = stat.S_IMODE(os.stat(daemon.socket_path).st_mode)
+    assert mode & 0o077 == 0
+
+
+def test_already_running(daemon):
+    server = DaemonServer(socket_path=daemon.socket_path, workers=1)
+    with pytest.raises(DaemonError) as excinfo:
+        server.serve_forever()
+    assert 'already running' in str(excinfo.value)
+
+    # The running daemon must keep its socket.
+    assert daemon.ping()
+
+
+def test_stale_socket(tmpdir):
+    socket_path = str(tmpdir.join('daemon.sock'))
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    server, client = _start_daemon(socket_path, 1)
+    assert client.ping()
+
+    client.stop()
+    server.join(30)
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, 'SO_PEERCRED'),
+    reason='SO_PEERCRED is not available',
+)
+def test_untrusted_peer(daemon, monkeypatch):
+    monkeypatch.setattr(os, 'getuid', lambda: -1)
+    with pytest.raises(DaemonError) as excinfo:
+        daemon.ping()
+    assert 'another user' in str(excinfo.value)
+
+
+def test_check(daemon, tmpdir, collector_keys):
+    project_dir = tmpdir.mkdir('project')
+    project_dir.join('module.py').write('import os\n')
+    path = str(project_dir)
+
+    overrides = {'result-cache': False}
+    tools = ['pyflakes', 'pylint']
+    config = override_config(get_project_config(path), overrides, tools)
+    expected = execute_tools(config, path)
+
+    events = []
+    def get_progress(cfg):
+        assert cfg['pyflakes']['use']
+        assert not cfg['pycodestyle']['use']
+        events.append('created')
+        return ProgressRecorder(events)
+
+    actual_config, actual = daemon.check(
+        path,
+        overrides=overrides,
+        tools=tools,
+        progress_factory=get_progress,
+    )
+    assert actual_config == config
+    assert collector_keys(expected) == collector_keys(actual)
+    assert 'unused-import' in [issue.code for issue in actual.get_issues()]
+    assert events[0] == 'created'
+    assert events[1] == 'on_start'
+    assert events[-1] == 'on_finish'
+    assert sorted(events[2:-1]) == sorted(
+        ['on_tool_start:%s' % tool for tool in tools]
+        + ['on_tool_finish:%s' % tool for tool in tools]
+    )
+
+    # The warm workers must notice that the file changed.
+    time.sleep(0.01)
+    project_dir.join('module.py').write('import os\n\nprint(os.name)\n')
+    _, actual = daemon.check(path, overrides=overrides, tools=tools)
+    assert collector_keys(execute_tools(config, path)) == collector_keys(actual)
+    assert 'unused-import' not in [issue.code for issue in actual.get_issues()]
+
+
+def test_check_stream(daemon, tmpdir):
+    project_dir = tmpdir.mkdir('project')
+    project_dir.join('module1.py').write('import os\n')
+    project_dir.join('module2.py').write('import sys\n')
+    path = str(project_dir)
+
+    streamed = []
+    def on_files_complete(collector, filenames):
+        streamed.extend(filenames)
+        assert collector.get_issues(filenames=filenames)
+
+    _, collector = daemon.check(
+        path,
+        overrides={'result-cache': False, 'sharding': True, 'shard-size': 1},
+        tools=['pyflakes'],
+        on_files_complete=on_files_complete,
+    )
+    assert sorted(streamed) == sorted([
+        str(project_dir.join('module1.py')),
+        str(project_dir.join('module2.py')),
+    ])
+    assert collector.issue_count() == 2
+
+
+def test_check_bad_config(daemon, tmpdir):
+    config_file = tmpdir.join('bad.toml')
+    config_file.write('this is not toml')
+
+    with pytest.raises(DaemonError) as excinfo:
+        daemon.check(str(tmpdir), config_file=str(config_file))
+    assert 'Could not parse config file' in str(excinfo.value)
+
+
+class ProgressRecorder:
+    def __init__(self, events):
+        self.events = events
+
+    def on_start(self):
+        self.events.append('on_start')
+
+    def on_tool_start(self, tool):
+        self.events.append('on_tool_start:%s' % tool)
+
+    def on_tool_finish(self, tool):
+        self.events.append('on_tool_finish:%s' % tool)
+
+    def on_finish(self):
+        self.events.append('on_finish')
@@ -0,0 +1,79 @@
+import ast
+
+from tidypy import AstChecker, AstDispatcher
+
+
+SOURCE = '''
+import os
+
+def foo(a):
+    if a:
+        return os.path.join(a, 'b')
+    try:
+        pass
+    finally:
+        print(a)
+'''
+
+
+class Recorder(AstChecker):
+    def __init__(self, events):
+        self.events = events
+
+    def visit_FunctionDef(self, node):
+        self.events.append('enter %s' % (node.name,))
+
+    def leave_FunctionDef(self, node):
+        self.events.append('leave %s' % (node.name,))
+
+    def visit_If(self, node):
+        self.events.append('enter if')
+
+    def leave_If(self, node):
+        self.events.append('leave if')
+
+    def visit_Call(self, node):
+        self.events.append('call')
+
+
+class StatementRecorder(Recorder):
+    statements_only = True
+
+
+class NameVisitor(ast.NodeVisitor):
+    def __init__(self):
+        self.names = []
+
+    def visit_Name(self, node):
+        self.names.append(node.id)
+        self.generic_visit(node)
+
+
+def test_walk():
+    events = []
+    visitor = NameVisitor()
+    AstDispatcher([Recorder(events), visitor]).walk(ast.parse(SOURCE))
+    assert events == [
+        'enter foo',
+        'enter if',
+        'call',
+        'leave if',
+        'call',
+        'leave foo',
+    ]
+    assert visitor.names == ['a', 'os', 'a', 'print', 'a']
+
+
+def test_statements_only():
+    events = []
+    dispatcher = AstDispatcher([StatementRecorder(events)])
+    assert dispatcher.statements_only
+    dispatcher.walk(ast.parse(SOURCE))
+    assert events == [
+        'enter foo',
+        'enter if',
+        'leave if',
+        'leave foo',
+    ]
+
+    assert not AstDispatcher([StatementRecorder([]), Recorder([])]).statements_only
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import json
 import os
 import sys
 
 from tidypy import Finder, get_default_config
+from tidypy.finder import get_snapshot_path
 
 
 def fix_paths(paths):
@@ -74,6 +76,110 @@ def test_files_filter():
     assert expected == actual
 
 
+def test_paths():
+    cfg = get_default_config()
+    cfg['exclude'] = [r'module2']
+    finder = Finder('test/project1', cfg, paths=[
+        'setup.py',
+        'project1/module1.py',
+        'project1/module1.py',
+        'project1/module2.py',
+        'project1/CVS/dontfind.py',
+        'project1/doesntexist.py',
+        'project1',
+        os.path.abspath('test/project1/project1b/__init__.py'),
+    ])
+
+    expected = sorted(fix_paths([
+        'setup.py',
+        'project1/module1.py',
+        'project1b/__init__.py',
+    ]))
+
+    actual = sorted([
+        os.path.relpath(f, 'test/project1')
+        for f in finder.files()
+    ])
+
+    assert expected == actual
+
+
+def test_subset():
+    cfg = get_default_config()
+    finder = Finder('test/project1', cfg)
+
+    subset = finder.subset([
+        os.path.join(finder.project_path, 'setup.py'),
+        os.path.join(finder.project_path, fix_paths(['project1/module1.py'])[0]),
+    ])
+
+    expected = sorted(fix_paths([
+        'setup.py',
+        'project1/module1.py',
+    ]))
+
+    actual = sorted([
+        os.path.relpath(f, 'test/project1')
+        for f in subset.files()
+    ])
+
+    assert expected == actual
+    assert len(list(finder.files())) > len(actual)
+    assert subset.project_path == finder.project_path
+
+
+def test_snapshot(tmpdir, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir.mkdir('cache')))
+    project_dir = tmpdir.mkdir('project')
+    project_dir.mkdir('pkg').join('__init__.py').write('')
+    project_dir.mkdir('docs').join('index.rst').write('')
+    project_dir.join('setup.py').write('')
+    for dirname in ('pkg', 'docs', '.'):
+        os.utime(str(project_dir.join(dirname)), (1000000000, 1000000000))
+
+    def found(finder):
+        return sorted(
+            os.path.relpath(f, str(project_dir))
+            for f in finder.files()
+        )
+
+    cfg = get_default_config()
+    cfg['exclude'] = [r'^docs/']
+    expected = found(Finder(str(project_dir), cfg))
+    assert expected == sorted(fix_paths(['pkg/__init__.py', 'setup.py']))
+
+    cfg['finder-snapshot'] = True
+    assert found(Finder(str(project_dir), cfg)) == expected
+
+    scanned = []
+    original_scan = Finder._scan
+    def _scan(self, dirname):
+        scanned.append(dirname)
+        return original_scan(self, dirname)
+    monkeypatch.setattr(Finder, '_scan', _scan)
+
+    assert found(Finder(str(project_dir), cfg)) == expected
+    assert scanned == []
+
+    project_dir.join('pkg', 'module.py').write('')
+    assert found(Finder(str(project_dir), cfg)) == sorted(expected + fix_paths(['pkg/module.py']))
+    assert scanned == [str(project_dir.join('pkg'))]
+
+    cfg['exclude'] = []
+    finder = Finder(str(project_dir), cfg)
+    assert fix_paths(['docs/index.rst'])[0] in found(finder)
+
+    # Snapshots that can't be read are ignored.
+    snapshot_path = get_snapshot_path(finder.project_path, cfg['exclude'])
+    with open(snapshot_path, 'r') as snapshot_file:
+        assert isinstance(json.load(snapshot_file), dict)
+    with open(snapshot_path, 'w') as snapshot_file:
+        snapshot_file.write('not json')
+    del scanned[:]
+    assert found(Finder(str(project_dir), cfg)) == found(finder)
+    assert scanned
+
+
 def test_directories():
     cfg = get_default_config()
     cfg['exclude'] = ['project1b']
@@ -0,0 +1,54 @@
+import os
+import subprocess
+
+import pytest
+
+from tidypy.plugin.git import get_changed_files
+
+
+def executable_exists(executable):
+    try:
+        subprocess.call([executable])
+    except OSError:
+        return False
+    else:
+        return True
+
+
+def git(path, *args):
+    subprocess.check_call(
+        ['git', '-C', path, '-c', 'user.name=test', '-c', 'user.email=test@example.com'] + list(args),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+@pytest.mark.skipif(not executable_exists('git'), reason='git not available')
+def test_get_changed_files(tmpdir):
+    repo_dir = str(tmpdir.mkdir('git'))
+    git(repo_dir, 'init')
+    project_dir = tmpdir.join('git').mkdir('project')
+    project_dir.join('unchanged.py').write('foo = 1\n')
+    project_dir.join('modified.py').write('foo = 1\n')
+    project_dir.join('deleted.py').write('foo = 1\n')
+    tmpdir.join('git').join('outside.py').write('foo = 1\n')
+    git(repo_dir, 'add', '.')
+    git(repo_dir, 'commit', '-m', 'initial')
+    git(repo_dir, 'tag', 'initial')
+
+    project_dir.join('modified.py').write('foo = 2\n')
+    project_dir.join('deleted.py').remove()
+    project_dir.join('staged.py').write('foo = 1\n')
+    project_dir.join('untracked.py').write('foo = 1\n')
+    tmpdir.join('git').join('outside.py').write('foo = 2\n')
+    git(repo_dir, 'add', os.path.join('project', 'staged.py'))
+
+    assert sorted(get_changed_files(str(project_dir), staged=True)) == ['staged.py']
+    assert sorted(get_changed_files(str(project_dir))) == ['modified.py', 'staged.py', 'untracked.py']
+
+    git(repo_dir, 'commit', '-m', 'second')
+    assert sorted(get_changed_files(str(project_dir))) == ['modified.py', 'untracked.py']
+    assert sorted(get_changed_files(str(project_dir), since='initial')) == ['modified.py', 'staged.py', 'untracked.py']
+
+    with pytest.raises(Exception):
+        get_changed_files(str(project_dir), since='doesntexist')
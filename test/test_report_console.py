@@ -3,6 +3,7 @@ import sys
 
 from six import PY2
 from tidypy import execute_reports, get_default_config, Collector, TidyPyIssue
+from tidypy.core import create_reports
 
 
 ISSUES = [
@@ -91,3 +92,44 @@ def test_console_execute(capsys):
     assert out.rstrip() == expected
     assert err == ''
 
+
+
+EXPECTED_CONSOLE_STREAMED = u'''foo.py (2)
+    2     Message 2 (tidypy:code2)
+    5:23  Message 1 (tidypy:code1)
+
+baz.py (1)
+   33     Message 5
+          Has some newlines
+          Like these
+          (tidypy:code5)
+
+blah/bar.py (1)
+   28     Message 1 (tidypy:code1)
+
+subdir/foobar.json (1)
+    5:23  Message 3 (tidypy:code3)
+
+\u2717 5 issues found.
+'''
+
+
+def test_console_stream(capsys):
+    cfg = get_default_config()
+    cfg['requested_reports'] = [{'type': 'console'}]
+
+    collector = Collector(cfg)
+    collector.add_issues(ISSUES)
+
+    reporters = create_reports(cfg, 'someproject')
+    for _, reporter in reporters:
+        reporter.stream(collector, ['someproject/foo.py', 'someproject/nothere.py'])
+    execute_reports(cfg, 'someproject', collector, reporters=reporters)
+
+    expected = EXPECTED_CONSOLE_STREAMED.rstrip()
+    if sys.platform == 'win32':
+        expected = expected.replace(u'\u2717 ', '')
+
+    out, err = capsys.readouterr()
+    assert out.rstrip() == expected
+    assert err == ''
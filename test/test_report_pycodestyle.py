@@ -1,5 +1,6 @@
 
 from tidypy import execute_reports, get_default_config, Collector, TidyPyIssue
+from tidypy.core import create_reports
 
 
 ISSUES = [
@@ -52,3 +53,21 @@ def test_execute(capsys):
     assert out.replace('\r\n', '\n') == EXPECTED_PYCODESTYLE
     assert err == ''
 
+
+
+def test_stream(capsys):
+    cfg = get_default_config()
+    cfg['requested_reports'] = [{'type': 'pycodestyle'}]
+
+    collector = Collector(cfg)
+    collector.add_issues(ISSUES)
+
+    reporters = create_reports(cfg, 'someproject')
+    for _, reporter in reporters:
+        reporter.stream(collector, ['someproject/subdir/foobar.json'])
+    execute_reports(cfg, 'someproject', collector, reporters=reporters)
+
+    lines = EXPECTED_PYCODESTYLE.splitlines(True)
+    out, err = capsys.readouterr()
+    assert out.replace('\r\n', '\n') == ''.join(lines[3:] + lines[:3])
+    assert err == ''
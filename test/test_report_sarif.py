@@ -0,0 +1,94 @@
+import json
+
+from tidypy import execute_reports, get_default_config, Collector, TidyPyIssue
+from tidypy.tools.pyflakes import PyFlakesIssue
+
+
+ISSUES = [
+    TidyPyIssue(
+        'code1',
+        'Message 1',
+        u'someproject/foo.py',
+        5,
+        23,
+    ),
+    TidyPyIssue(
+        'code2',
+        'Message 2',
+        u'someproject/foo.py',
+        2,
+    ),
+    TidyPyIssue(
+        'code1',
+        'Message 1',
+        'someproject/blah/bar.py',
+        28,
+    ),
+    PyFlakesIssue(
+        'UnusedImport',
+        "'os' imported but unused",
+        'someproject/foo.py',
+        1,
+        1,
+    ),
+]
+
+
+def test_execute(capsys):
+    cfg = get_default_config()
+    cfg['requested_reports'] = [{'type': 'sarif'}]
+
+    collector = Collector(cfg)
+    collector.add_issues(ISSUES)
+
+    execute_reports(cfg, 'someproject', collector)
+
+    out, err = capsys.readouterr()
+    assert err == ''
+
+    sarif = json.loads(out)
+    assert sarif['version'] == '2.1.0'
+    assert [run['tool']['driver']['name'] for run in sarif['runs']] == ['pyflakes', 'tidypy']
+
+    pyflakes, tidypy = sarif['runs']
+    assert pyflakes['tool']['driver']['rules'] == [
+        {'id': 'UnusedImport', 'shortDescription': {'text': '%r imported but unused'}},
+    ]
+    assert pyflakes['results'] == [
+        {
+            'ruleId': 'UnusedImport',
+            'ruleIndex': 0,
+            'level': 'error',
+            'message': {'text': "'os' imported but unused"},
+            'locations': [{'physicalLocation': {
+                'artifactLocation': {'uri': 'foo.py', 'uriBaseId': '%SRCROOT%'},
+                'region': {'startLine': 1, 'startColumn': 1},
+            }}],
+        },
+    ]
+    assert pyflakes['originalUriBaseIds']['%SRCROOT%']['uri'].endswith('/someproject/')
+
+    assert tidypy['tool']['driver']['rules'] == [{'id': 'code1'}, {'id': 'code2'}]
+    assert [
+        (
+            result['ruleIndex'],
+            result['level'],
+            result['locations'][0]['physicalLocation']['artifactLocation']['uri'],
+            result['locations'][0]['physicalLocation']['region'],
+        )
+        for result in tidypy['results']
+    ] == [
+        (0, 'error', 'blah/bar.py', {'startLine': 28}),
+        (1, 'error', 'foo.py', {'startLine': 2}),
+        (0, 'error', 'foo.py', {'startLine': 5, 'startColumn': 23}),
+    ]
+
+
+def test_execute_empty(capsys):
+    cfg = get_default_config()
+    cfg['requested_reports'] = [{'type': 'sarif'}]
+
+    execute_reports(cfg, 'someproject', Collector(cfg))
+
+    out, err = capsys.readouterr()
+    assert json.loads(out)['runs'] == []
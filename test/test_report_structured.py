@@ -1,7 +1,9 @@
 
+import json
 import sys
 
 from tidypy import execute_reports, get_default_config, Collector, TidyPyIssue
+from tidypy.core import create_reports
 
 
 ISSUES = [
@@ -229,3 +231,69 @@ def test_csv_file_output(capsys, tmpdir):
 
     assert EXPECTED_CSV == open(test_file, 'r').read()
 
+
+
+def test_json_execute_empty(capsys):
+    cfg = get_default_config()
+    cfg['requested_reports'] = [{'type': 'json'}]
+
+    execute_reports(cfg, 'someproject', Collector(cfg))
+
+    out, err = capsys.readouterr()
+    assert json.loads(out) == {'tidypy': '0.23.0', 'issues': {}}
+    assert out.replace('\r\n', '\n') == '{\n  "tidypy": "0.23.0",\n  "issues": {}\n}\n'
+
+
+def test_json_execute_compact(capsys):
+    cfg = get_default_config()
+    cfg['requested_reports'] = [{'type': 'json', 'pretty': False}]
+
+    collector = Collector(cfg)
+    collector.add_issues(ISSUES)
+
+    execute_reports(cfg, 'someproject', collector)
+
+    out, err = capsys.readouterr()
+    assert out.replace('\r\n', '\n') == json.dumps(json.loads(EXPECTED_JSON)) + '\n'
+    assert err == ''
+
+
+EXPECTED_JSONL = '''{"filename": "blah/bar.py", "line": 28, "character": 0, "tool": "tidypy", "code": "code1", "message": "Message 1"}
+{"filename": "foo.py", "line": 2, "character": 0, "tool": "tidypy", "code": "code2", "message": "Message 2"}
+{"filename": "foo.py", "line": 5, "character": 23, "tool": "tidypy", "code": "code1", "message": "Message 1"}
+{"filename": "subdir/foobar.json", "line": 5, "character": 23, "tool": "tidypy", "code": "code3", "message": "Message 3"}
+'''
+
+
+def test_jsonl_execute(capsys):
+    cfg = get_default_config()
+    cfg['requested_reports'] = [{'type': 'jsonl'}]
+
+    collector = Collector(cfg)
+    collector.add_issues(ISSUES)
+
+    execute_reports(cfg, 'someproject', collector)
+
+    out, err = capsys.readouterr()
+    assert EXPECTED_JSONL == out.replace('\r\n', '\n')
+    assert err == ''
+
+
+def test_record_stream(capsys):
+    for report, expected in (('csv', EXPECTED_CSV), ('jsonl', EXPECTED_JSONL)):
+        cfg = get_default_config()
+        cfg['requested_reports'] = [{'type': report}]
+
+        collector = Collector(cfg)
+        collector.add_issues(ISSUES)
+
+        reporter = create_reports(cfg, 'someproject')[0][1]
+        reporter.stream(collector, ['someproject/foo.py'])
+        out, _ = capsys.readouterr()
+        assert 'foo.py' in out
+        assert 'bar.py' not in out
+
+        reporter.produce(collector)
+        rest, _ = capsys.readouterr()
+        assert 'foo.py' not in rest.replace('foobar', '')
+        assert sorted((out + rest).splitlines()) == sorted(expected.splitlines())
@@ -0,0 +1,35 @@
+
+import pytest
+
+
+JOBS_TESTS = (
+    (
+        'low',
+        'low',
+        ['parse', 'B307', 'B105', 'B105'],
+    ),
+    (
+        'low',
+        'high',
+        ['parse', 'B307'],
+    ),
+    (
+        'medium',
+        'low',
+        ['parse', 'B307'],
+    ),
+    (
+        'high',
+        'low',
+        ['parse'],
+    ),
+)
+
+
+@pytest.mark.parametrize('severity,confidence,expected_codes', JOBS_TESTS)
+def test_jobs(check_jobs, severity, confidence, expected_codes):
+    expected = check_jobs(
+        'bandit',
+        {'severity': severity, 'confidence': confidence},
+    )
+    assert [issue.code for issue in expected] == expected_codes
@@ -0,0 +1,46 @@
+
+import ast
+
+import mccabe
+
+from tidypy import get_default_config, Finder
+from tidypy.tools.dispatch import AstDispatcher
+from tidypy.tools.mccabe import ComplexityChecker
+
+
+def _complexities(graphs, score):
+    return {
+        name: (graph.entity, graph.lineno, graph.column, score(graph))
+        for name, graph in graphs.items()
+    }
+
+
+def test_parity():
+    cfg = get_default_config()
+    finder = Finder('test/project1', cfg)
+
+    checked = 0
+    for filepath in finder.files(cfg['mccabe']['filters']):
+        try:
+            tree = ast.parse(finder.read_file(filepath), filepath)
+        except SyntaxError:
+            continue
+
+        visitor = mccabe.PathGraphingAstVisitor()
+        visitor.preorder(tree, visitor)
+        expected = _complexities(
+            visitor.graphs,
+            lambda graph: graph.complexity(),
+        )
+
+        checker = ComplexityChecker()
+        AstDispatcher([checker]).walk(tree)
+        actual = _complexities(
+            checker.graphs,
+            lambda graph: graph.complexity,
+        )
+
+        assert actual == expected, filepath
+        checked += len(expected)
+
+    assert checked
@@ -0,0 +1,20 @@
+
+from tidypy import get_default_config, Finder
+from tidypy.tools import pycodestyle
+
+
+def test_jobs(check_jobs):
+    check_jobs('pycodestyle')
+
+
+def test_without_previous_physical(monkeypatch, issue_keys):
+    cfg = get_default_config()
+    finder = Finder('test/project1', cfg)
+
+    expected = pycodestyle.PyCodeStyleTool(cfg['pycodestyle']).execute(finder)
+    assert expected
+
+    # Versions of pycodestyle before 2.6 tokenize the files themselves.
+    monkeypatch.setattr(pycodestyle, 'PASSES_PREVIOUS_PHYSICAL', False)
+    actual = pycodestyle.PyCodeStyleTool(cfg['pycodestyle']).execute(finder)
+    assert issue_keys(actual) == issue_keys(expected)
@@ -0,0 +1,17 @@
+from types import SimpleNamespace
+
+from tidypy import get_default_config, Finder
+from tidypy.tools import pyflakes
+
+
+def test_without_make_tokens(monkeypatch, issue_keys):
+    cfg = get_default_config()
+    finder = Finder('test/project1', cfg)
+
+    expected = pyflakes.PyFlakesTool(cfg['pyflakes']).execute(finder)
+    assert expected
+
+    # Versions of pyflakes before 2.1 have no make_tokens().
+    monkeypatch.setattr(pyflakes, 'checker', SimpleNamespace())
+    actual = pyflakes.PyFlakesTool(cfg['pyflakes']).execute(finder)
+    assert issue_keys(actual) == issue_keys(expected)
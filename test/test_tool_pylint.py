@@ -0,0 +1,3 @@
+
+def test_jobs(check_jobs):
+    check_jobs('pylint')
@@ -1,6 +1,7 @@
 from __future__ import print_function
 
 import sys
+import tokenize
 
 import pytest
 
@@ -83,3 +84,79 @@ def test_sysoutcapture(capsys):
     assert out == ''
     assert err == ''
 
+
+
+def test_read_file_modified(tmpdir):
+    target = tmpdir.join('file.py')
+    target.write('foo = 1\n')
+    assert util.read_file(str(target)) == 'foo = 1\n'
+    assert util.parse_python_file(str(target)).body[0].targets[0].id == 'foo'
+
+    target.write('barbaz = 2\n')
+    assert util.read_file(str(target)) == 'barbaz = 2\n'
+    assert util.parse_python_file(str(target)).body[0].targets[0].id == 'barbaz'
+
+
+def test_tokenize_python_file(tmpdir):
+    target = tmpdir.join('file.py')
+    target.write('foo = 1  # first\n# second\n')
+    tokens = util.tokenize_python_file(str(target))
+    assert tokens[0].string == 'foo'
+    assert [
+        (comment.start[0], comment.string)
+        for comment in util.get_python_comments(str(target))
+    ] == [(1, '# first'), (2, '# second')]
+    assert util.tokenize_python_file(str(target)) is tokens
+
+    target.write('barbaz = 2\n')
+    assert util.tokenize_python_file(str(target))[0].string == 'barbaz'
+    assert util.get_python_comments(str(target)) == ()
+
+    target.write('foo = (\n')
+    with pytest.raises(tokenize.TokenError):
+        util.tokenize_python_file(str(target))
+
+
+def test_get_cgroup_cpu_quota(tmpdir, monkeypatch):
+    cpu_max = tmpdir.join('cpu.max')
+    monkeypatch.setattr(util, 'CGROUP_CPU_MAX', str(cpu_max))
+    monkeypatch.setattr(util, 'CGROUP_CPU_QUOTA', str(tmpdir.join('quota')))
+    monkeypatch.setattr(util, 'CGROUP_CPU_PERIOD', str(tmpdir.join('period')))
+    assert util.get_cgroup_cpu_quota() is None
+
+    cpu_max.write('max 100000\n')
+    assert util.get_cgroup_cpu_quota() is None
+
+    cpu_max.write('250000 100000\n')
+    assert util.get_cgroup_cpu_quota() == 2.5
+
+    cpu_max.remove()
+    tmpdir.join('quota').write('50000\n')
+    tmpdir.join('period').write('100000\n')
+    assert util.get_cgroup_cpu_quota() == 0.5
+    assert util.get_available_cpus() == 1
+
+    tmpdir.join('quota').write('-1\n')
+    assert util.get_cgroup_cpu_quota() is None
+    assert util.get_available_cpus() >= 1
+
+
+def test_get_file_shards(tmpdir):
+    files = []
+    for idx, size in enumerate((50, 40, 30, 20, 10)):
+        target = tmpdir.join('file%d.py' % (idx,))
+        target.write('x' * size)
+        files.append(str(target))
+
+    assert util.get_file_shards([], 4) == []
+    assert util.get_file_shards(files, 1) == [files]
+
+    shards = util.get_file_shards(files, 2)
+    assert shards == [
+        [files[0], files[3], files[4]],
+        [files[1], files[2]],
+    ]
+
+    shards = util.get_file_shards(files, 10)
+    assert len(shards) == 5
+    assert sorted(sum(shards, [])) == sorted(files)